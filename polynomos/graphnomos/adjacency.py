@@ -0,0 +1,330 @@
+import numpy as np
+
+class AdjacencyStore:
+    '''
+    Mutable adjacency structure of an undirected graph over the integer
+    vertex ids 0, 1, ..., n - 1.
+
+    Every vertex owns the set of its neighbour ids, and every edge is
+    recorded once as a canonical (min_id, max_id) pair mapped to its weight
+    (None for unweighted edges). Adding a vertex, adding an edge and removing
+    an edge are all O(1) amortized operations, and the neighbours of a vertex
+    can be read in O(deg(v)).
+    '''
+    def __init__(self) -> None:
+        self._rows = []
+        self._weights = {}
+
+    @staticmethod
+    def from_edges(n: int, src, dst, weights = None):
+        '''
+        Build a store of n vertices from arrays of (min_id, max_id) edge pairs 
+        without duplicates, and optionally their weights
+        '''
+        store = AdjacencyStore()
+        store._rows = [set() for _ in range(n)]
+        pairs = zip(src.tolist(), dst.tolist())
+        if weights is None:
+            store._weights = dict.fromkeys(pairs)
+        else:
+            if isinstance(weights, np.ndarray):
+                weights = [None if weight != weight else weight for weight in weights.tolist()]
+            store._weights = dict(zip(pairs, weights))
+        for i, j in store._weights:
+            store._rows[i].add(j)
+            store._rows[j].add(i)
+        return store
+
+    def vertex_count(self) -> int:
+        return len(self._rows)
+
+    def edge_count(self) -> int:
+        return len(self._weights)
+
+    def add_vertex(self) -> int:
+        self._rows.append(set())
+        return len(self._rows) - 1
+
+    def has_edge(self, i: int, j: int) -> bool:
+        return j in self._rows[i]
+
+    def add_edge(self, i: int, j: int, weight = None) -> bool:
+        if j in self._rows[i]:
+            return False
+        self._rows[i].add(j)
+        self._rows[j].add(i)
+        self._weights[(i, j) if i <= j else (j, i)] = weight
+        return True
+
+    def remove_edge(self, i: int, j: int) -> None:
+        self._rows[i].remove(j)
+        self._rows[j].discard(i)
+        del self._weights[(i, j) if i <= j else (j, i)]
+
+    def weight(self, i: int, j: int):
+        return self._weights[(i, j) if i <= j else (j, i)]
+
+    def set_weight(self, i: int, j: int, weight) -> None:
+        self._weights[(i, j) if i <= j else (j, i)] = weight
+
+    def neighbours(self, i: int):
+        return self._rows[i]
+
+    def degree(self, i: int) -> int:
+        return len(self._rows[i])
+
+    def neighbour_index(self):
+        return self._rows
+
+    def weighted_neighbour_index(self):
+        index = [[] for _ in self._rows]
+        for (i, j), weight in self._weights.items():
+            index[i].append((j, weight))
+            if i != j:
+                index[j].append((i, weight))
+        return index
+
+    def edges(self):
+        for (i, j), weight in self._weights.items():
+            yield i, j, weight
+
+    def degrees(self) -> list:
+        return [len(row) for row in self._rows]
+
+    def add_edges_from(self, src, dst, weights = None) -> None:
+        if isinstance(src, np.ndarray):
+            src, dst = src.tolist(), dst.tolist()
+        if weights is None:
+            weights = [None] * len(src)
+        elif isinstance(weights, np.ndarray):
+            weights = [None if weight != weight else weight for weight in weights.tolist()]
+        for i, j, weight in zip(src, dst, weights):
+            self.add_edge(i, j, weight)
+
+    def csr_arrays(self):
+        src, dst, weights = self.edge_arrays()
+        csr = CSRAdjacencyStore()
+        csr._vertex_count = len(self._rows)
+        csr._build(src, dst, weights)
+        return csr.indptr, csr.indices, csr.weights
+
+    def edge_arrays(self):
+        src = np.fromiter((i for i, _ in self._weights), dtype=np.int64, count=len(self._weights))
+        dst = np.fromiter((j for _, j in self._weights), dtype=np.int64, count=len(self._weights))
+        return src, dst, _weight_array(self._weights.values())
+
+def _weight_array(weights, count = None):
+    if weights is None:
+        return np.full(count, np.nan)
+    if isinstance(weights, np.ndarray):
+        return weights.astype(np.float64)
+    weights = [np.nan if weight is None else weight for weight in weights]
+    try:
+        return np.array(weights, dtype=np.float64)
+    except (TypeError, ValueError):
+        return np.array(weights, dtype=object)
+
+class CSRAdjacencyStore:
+    '''
+    Compressed-sparse-row adjacency structure of an undirected graph over
+    the integer vertex ids 0, 1, ..., n - 1.
+
+    The neighbours of vertex i are `indices[indptr[i]:indptr[i + 1]]`, in
+    increasing order, and `weights` holds the matching edge weights (NaN for
+    unweighted edges, so weights must be numeric). Every edge is stored once
+    per end vertex, so memory grows with the number of edges instead of n^2.
+
+    Single edge and vertex mutations are buffered and merged into the arrays
+    the next time a neighbourhood is read, so a batch of mutations costs a 
+    single O(n + m) rebuild. The backend is best suited for large graphs that 
+    are built in bulk and then mostly read.
+    '''
+    def __init__(self) -> None:
+        self.indptr = np.zeros(1, dtype=np.int64)
+        self.indices = np.zeros(0, dtype=np.int64)
+        self.weights = np.zeros(0, dtype=np.float64)
+        self._vertex_count = 0
+        self._edge_count = 0
+        self._added = {}
+        self._removed = set()
+
+    @staticmethod
+    def from_arrays(indptr, indices, weights, edge_count: int):
+        '''
+        Wrap existing CSR arrays, e.g. memory-mapped ones, without copying them.
+        Each row of `indices` must be sorted and hold every edge in both directions
+        '''
+        store = CSRAdjacencyStore()
+        store.indptr = indptr
+        store.indices = indices
+        store.weights = weights
+        store._vertex_count = len(indptr) - 1
+        store._edge_count = edge_count
+        return store
+
+    @staticmethod
+    def from_edges(n: int, src, dst, weights = None):
+        '''
+        Build a store of n vertices from arrays of (min_id, max_id) edge pairs 
+        without duplicates, and optionally their weights
+        '''
+        store = CSRAdjacencyStore()
+        store._vertex_count = n
+        store._build(src, dst, _weight_array(weights, len(src)))
+        return store
+
+    def vertex_count(self) -> int:
+        return self._vertex_count
+
+    def edge_count(self) -> int:
+        return self._edge_count
+
+    def add_vertex(self) -> int:
+        self._vertex_count += 1
+        return self._vertex_count - 1
+
+    def _find(self, i: int, j: int) -> int:
+        if i >= len(self.indptr) - 1:
+            return -1
+        start, end = self.indptr[i], self.indptr[i + 1]
+        k = start + np.searchsorted(self.indices[start:end], j)
+        if k < end and self.indices[k] == j:
+            return k
+        return -1
+
+    def has_edge(self, i: int, j: int) -> bool:
+        key = (i, j) if i <= j else (j, i)
+        if key in self._added:
+            return True
+        if key in self._removed:
+            return False
+        return self._find(i, j) >= 0
+
+    def add_edge(self, i: int, j: int, weight = None) -> bool:
+        if self.has_edge(i, j):
+            return False
+        key = (i, j) if i <= j else (j, i)
+        if key in self._removed:
+            self._removed.discard(key)
+            self.set_weight(i, j, weight)
+        else:
+            self._added[key] = weight
+        self._edge_count += 1
+        return True
+
+    def remove_edge(self, i: int, j: int) -> None:
+        key = (i, j) if i <= j else (j, i)
+        if key in self._added:
+            del self._added[key]
+        else:
+            self._removed.add(key)
+        self._edge_count -= 1
+
+    def weight(self, i: int, j: int):
+        key = (i, j) if i <= j else (j, i)
+        if key in self._added:
+            return self._added[key]
+        weight = self.weights[self._find(i, j)]
+        return None if np.isnan(weight) else weight.item()
+
+    def set_weight(self, i: int, j: int, weight) -> None:
+        key = (i, j) if i <= j else (j, i)
+        if key in self._added:
+            self._added[key] = weight
+            return
+        self.weights[self._find(i, j)] = np.nan if weight is None else weight
+        self.weights[self._find(j, i)] = np.nan if weight is None else weight
+
+    def _compact(self) -> None:
+        if not self._added and not self._removed:
+            new_vertices = self._vertex_count - (len(self.indptr) - 1)
+            if new_vertices > 0:
+                self.indptr = np.concatenate([self.indptr, np.full(new_vertices, self.indptr[-1])])
+            return
+
+        src, dst, weights = self._array_edges()
+        if self._removed:
+            n = self._vertex_count
+            removed = np.array([i * n + j for i, j in self._removed], dtype=np.int64)
+            keep = ~np.isin(src * n + dst, removed)
+            src, dst, weights = src[keep], dst[keep], weights[keep]
+        if self._added:
+            src = np.concatenate([src, np.array([i for i, _ in self._added], dtype=np.int64)])
+            dst = np.concatenate([dst, np.array([j for _, j in self._added], dtype=np.int64)])
+            weights = np.concatenate([weights, _weight_array(self._added.values())])
+
+        self._added = {}
+        self._removed = set()
+        self._build(src, dst, weights)
+
+    def _array_edges(self):
+        rows = np.repeat(np.arange(len(self.indptr) - 1, dtype=np.int64), np.diff(self.indptr))
+        upper = rows <= self.indices
+        return rows[upper], self.indices[upper], self.weights[upper]
+
+    def _build(self, src, dst, weights) -> None:
+        n = self._vertex_count
+        loops = src == dst
+        rows = np.concatenate([src, dst[~loops]])
+        cols = np.concatenate([dst, src[~loops]])
+        order = np.argsort(rows * max(n, 1) + cols)
+
+        self.indices = cols[order]
+        self.weights = np.concatenate([weights, weights[~loops]])[order]
+        self.indptr = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum(np.bincount(rows, minlength=n), out=self.indptr[1:])
+        self._edge_count = len(src)
+
+    def add_edges_from(self, src, dst, weights = None) -> None:
+        self._compact()
+        src = np.asarray(src, dtype=np.int64)
+        dst = np.asarray(dst, dtype=np.int64)
+        if len(src) == 0:
+            return
+        lo, hi = np.minimum(src, dst), np.maximum(src, dst)
+
+        old_src, old_dst, old_weights = self._array_edges()
+        src = np.concatenate([old_src, lo])
+        dst = np.concatenate([old_dst, hi])
+        weights = np.concatenate([old_weights, _weight_array(weights, len(lo))])
+
+        # np.unique reports the first occurrence, so existing edges keep their weight
+        _, first = np.unique(src * self._vertex_count + dst, return_index=True)
+        self._build(src[first], dst[first], weights[first])
+
+    def neighbours(self, i: int):
+        self._compact()
+        return self.indices[self.indptr[i]:self.indptr[i + 1]]
+
+    def neighbour_index(self):
+        self._compact()
+        indptr = self.indptr.tolist()
+        indices = self.indices.tolist()
+        return [indices[indptr[i]:indptr[i + 1]] for i in range(self._vertex_count)]
+
+    def weighted_neighbour_index(self):
+        self._compact()
+        indptr = self.indptr.tolist()
+        pairs = [(j, None if weight != weight else weight) for j, weight in zip(self.indices.tolist(), self.weights.tolist())]
+        return [pairs[indptr[i]:indptr[i + 1]] for i in range(self._vertex_count)]
+
+    def degree(self, i: int) -> int:
+        self._compact()
+        return int(self.indptr[i + 1] - self.indptr[i])
+
+    def degrees(self) -> list:
+        self._compact()
+        return np.diff(self.indptr).tolist()
+
+    def edges(self):
+        src, dst, weights = self.edge_arrays()
+        for i, j, weight in zip(src.tolist(), dst.tolist(), weights.tolist()):
+            yield i, j, None if weight != weight else weight
+
+    def edge_arrays(self):
+        self._compact()
+        return self._array_edges()
+
+    def csr_arrays(self):
+        self._compact()
+        return self.indptr, self.indices, self.weights
@@ -1,3 +1,12 @@
 from polynomos.graphnomos.callables import *
 from polynomos.graphnomos.draw_callables import *
-from polynomos.graphnomos.generate_callables import *
\ No newline at end of file
+from polynomos.graphnomos.generate_callables import *
+from polynomos.graphnomos.traversal_callables import *
+from polynomos.graphnomos.path_callables import *
+from polynomos.graphnomos.io_callables import *
+from polynomos.graphnomos.triangle_callables import *
+from polynomos.graphnomos.coloring_callables import *
+from polynomos.graphnomos.bipartite_callables import *
+from polynomos.graphnomos.spanning_callables import *
+from polynomos.graphnomos.centrality_callables import *
+from polynomos.graphnomos.spectral_callables import *
@@ -0,0 +1,132 @@
+import numpy as np
+
+def _spread_bits(v):
+    # Put the bits of a 16-bit integer at the even bit positions
+    v = (v | (v << 8)) & 0x00FF00FF
+    v = (v | (v << 4)) & 0x0F0F0F0F
+    v = (v | (v << 2)) & 0x33333333
+    v = (v | (v << 1)) & 0x55555555
+    return v
+
+class QuadTree:
+    '''
+    Quadtree over a set of 2D points, stored as flat NumPy arrays.
+
+    The points are sorted along a Z-order (Morton) curve, so the points of
+    every cell form a contiguous run of the sorted order. The cells of each
+    level are the distinct prefixes of the Morton codes, and the children of
+    a cell are a contiguous run of cells of the next level. Every cell keeps
+    the number of points it holds, their center of mass and its side length.
+    Cells holding a single point, and all cells of the deepest level, are
+    leaves.
+    '''
+    def __init__(self, positions, depth: int = 16) -> None:
+        n = len(positions)
+        lower = positions.min(axis=0)
+        extent = max(float((positions.max(axis=0) - lower).max()), 1e-9)
+        cells = ((positions - lower) / extent * (1 << depth)).astype(np.int64)
+        np.clip(cells, 0, (1 << depth) - 1, out=cells)
+
+        self.depth = depth
+        self.codes = _spread_bits(cells[:, 0]) | (_spread_bits(cells[:, 1]) << 1)
+        order = np.argsort(self.codes, kind='stable')
+        sorted_codes = self.codes[order]
+        sorted_positions = positions[order]
+
+        keys, counts, sums, shifts, sizes, starts_by_level = [], [], [], [], [], []
+        for level in range(depth + 1):
+            shift = 2 * (depth - level)
+            level_codes = sorted_codes >> shift
+            boundary = np.empty(n, dtype=bool)
+            boundary[0] = True
+            np.not_equal(level_codes[1:], level_codes[:-1], out=boundary[1:])
+            starts = np.flatnonzero(boundary)
+
+            keys.append(level_codes[starts])
+            counts.append(np.diff(np.append(starts, n)))
+            sums.append(np.add.reduceat(sorted_positions, starts, axis=0))
+            shifts.append(np.full(len(starts), shift, dtype=np.int64))
+            sizes.append(np.full(len(starts), extent / (1 << level)))
+            starts_by_level.append(starts)
+
+        offsets = np.cumsum([0] + [len(starts) for starts in starts_by_level])
+        self.keys = np.concatenate(keys)
+        self.counts = np.concatenate(counts)
+        self.centers = np.concatenate(sums) / self.counts[:, None]
+        self.shifts = np.concatenate(shifts)
+        self.sizes = np.concatenate(sizes)
+        self.leaves = self.counts == 1
+        self.leaves[offsets[-2]:] = True
+
+        # Children of a cell are the cells of the next level whose first
+        # point lies in the run of points of the cell
+        child_start = np.zeros(len(self.keys), dtype=np.int64)
+        child_count = np.zeros(len(self.keys), dtype=np.int64)
+        for level in range(depth):
+            starts = starts_by_level[level]
+            ends = starts + counts[level]
+            next_starts = starts_by_level[level + 1]
+            first = np.searchsorted(next_starts, starts)
+            child_start[offsets[level]:offsets[level + 1]] = offsets[level + 1] + first
+            child_count[offsets[level]:offsets[level + 1]] = np.searchsorted(next_starts, ends) - first
+        self.child_start = child_start
+        self.child_count = child_count
+
+def barnes_hut_repulsion(positions, optimal_distance, theta: float = 0.5, block_size: int = 4096):
+    '''
+    Approximate the Fruchterman-Reingold repulsive displacement of every
+    point in O(n log n), treating every quadtree cell whose side length is
+    less than `theta` times its distance as a single body at its center
+    of mass. With `theta = 0` the result is exact.
+
+    The tree is walked for a block of points at a time, keeping the open
+    (point, cell) pairs of a block in flat arrays.
+    '''
+    tree = QuadTree(positions)
+    k2 = optimal_distance ** 2
+    displacements = np.zeros_like(positions)
+
+    for start in range(0, len(positions), block_size):
+        stop = min(start + block_size, len(positions))
+        bodies = np.arange(start, stop)
+        cells = np.zeros(len(bodies), dtype=np.int64)
+        force_x = np.zeros(stop - start)
+        force_y = np.zeros(stop - start)
+
+        while len(bodies):
+            centers = tree.centers[cells]
+            masses = tree.counts[cells].astype(np.float64)
+            delta = centers - positions[bodies]
+            dist2 = (delta ** 2).sum(axis=1)
+
+            inside = (tree.codes[bodies] >> tree.shifts[cells]) == tree.keys[cells]
+            leaf = tree.leaves[cells]
+            far = ~inside & (tree.sizes[cells] ** 2 < theta ** 2 * dist2)
+
+            # A deepest-level leaf may hold the point itself next to others,
+            # which then act as one body without it
+            own = inside & leaf & (masses > 1)
+            if own.any():
+                masses[own] -= 1
+                centers[own] = (centers[own] * (masses[own] + 1)[:, None] - positions[bodies[own]]) / masses[own][:, None]
+                delta[own] = centers[own] - positions[bodies[own]]
+                dist2[own] = (delta[own] ** 2).sum(axis=1)
+
+            accept = far | (leaf & ~inside) | own
+            scale = k2 * masses[accept] / np.maximum(dist2[accept], 0.0001)
+            targets = bodies[accept] - start
+            force_x -= np.bincount(targets, weights=delta[accept, 0] * scale, minlength=stop - start)
+            force_y -= np.bincount(targets, weights=delta[accept, 1] * scale, minlength=stop - start)
+
+            expand = ~accept & ~leaf
+            bodies, cells = bodies[expand], cells[expand]
+            counts = tree.child_count[cells]
+            first = np.repeat(tree.child_start[cells], counts)
+            run_offsets = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+            bodies = np.repeat(bodies, counts)
+            cells = first + run_offsets
+
+        displacements[start:stop, 0] = force_x
+        displacements[start:stop, 1] = force_y
+
+    return displacements
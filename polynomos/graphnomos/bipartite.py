@@ -0,0 +1,93 @@
+from collections import deque
+
+from polynomos.graphnomos.graph import SimpleGraphObject
+
+def two_coloring(graph: SimpleGraphObject, order = None):
+    '''
+    Sides 0 and 1 of every vertex id from a breadth-first 2-coloring, in
+    O(V + E) time. The first vertex of every component in `order` (by
+    default the order of the ids) gets side 0.
+    Returns None if the graph has an odd cycle (or a loop)
+    '''
+    adjacency = graph._store.neighbour_index()
+    side = [-1] * graph.get_vertex_count()
+
+    for source in range(len(side)) if order is None else order:
+        if side[source] != -1:
+            continue
+        side[source] = 0
+        queue = deque([source])
+        while queue:
+            u = queue.popleft()
+            for v in adjacency[u]:
+                if side[v] == -1:
+                    side[v] = 1 - side[u]
+                    queue.append(v)
+                elif side[v] == side[u]:
+                    return None
+    return side
+
+def hopcroft_karp(adjacency, left):
+    '''
+    Maximum matching of a bipartite graph with the Hopcroft-Karp algorithm,
+    in O(E sqrt(V)) time. Every phase layers the graph by a breadth-first
+    search from the free vertices of `left`, then augments along a maximal
+    set of disjoint shortest augmenting paths found by depth-first search.
+
+    Returns a list mapping every vertex id to its partner, -1 if unmatched
+    '''
+    adjacency = [list(row) for row in adjacency]
+    match = [-1] * len(adjacency)
+    unreached = len(adjacency) + 1
+    distance = [unreached] * len(adjacency)
+
+    while True:
+        queue = deque()
+        for u in left:
+            if match[u] == -1:
+                distance[u] = 0
+                queue.append(u)
+            else:
+                distance[u] = unreached
+        found = False
+        while queue:
+            u = queue.popleft()
+            for v in adjacency[u]:
+                w = match[v]
+                if w == -1:
+                    found = True
+                elif distance[w] == unreached:
+                    distance[w] = distance[u] + 1
+                    queue.append(w)
+        if not found:
+            return match
+
+        pointer = {u: 0 for u in left}
+        for root in left:
+            if match[root] != -1:
+                continue
+            stack = [root]
+            while stack:
+                u = stack[-1]
+                row = adjacency[u]
+                advanced = augmented = False
+                while pointer[u] < len(row):
+                    w = match[row[pointer[u]]]
+                    if w == -1:
+                        augmented = True
+                        break
+                    if distance[w] == distance[u] + 1:
+                        stack.append(w)
+                        advanced = True
+                        break
+                    pointer[u] += 1
+                if augmented:
+                    for u in stack:
+                        v = adjacency[u][pointer[u]]
+                        match[u], match[v] = v, u
+                    break
+                if not advanced:
+                    distance[u] = unreached
+                    stack.pop()
+                    if stack:
+                        pointer[stack[-1]] += 1
@@ -0,0 +1,103 @@
+from polynomos.base_callable import BaseCallable
+from polynomos.graphnomos.bipartite import hopcroft_karp, two_coloring
+from polynomos.graphnomos.graph import SimpleGraphObject
+
+__all__ = [
+    'BipartitePartition',
+    'BipartiteQ',
+    'HopcroftKarpMatching'
+]
+
+def _sides(graph: SimpleGraphObject, order):
+    side = two_coloring(graph, order)
+    if side is None:
+        raise ValueError("The graph is not bipartite")
+    return side
+
+class BipartiteQ(BaseCallable):
+    '''
+    BipartiteQ(graph: SimpleGraphObject)
+    ------------------------------------
+    Check if a graph is bipartite, i.e. if its vertices can be split into
+    two parts with every edge joining the two parts. Uses a breadth-first
+    2-coloring, O(V + E) time
+
+    Arguments:
+    - graph: SimpleGraphObject
+        A SimpleGraphObject representing the graph
+
+    Returns:
+    True if the graph has no odd cycle, False otherwise
+    '''
+    def eval(graph: SimpleGraphObject):
+        return two_coloring(graph) is not None
+
+class BipartitePartition(BaseCallable):
+    '''
+    BipartitePartition(graph: SimpleGraphObject)
+    --------------------------------------------
+    Split the vertices of a bipartite graph into two parts, with every edge
+    joining the two parts. Uses a breadth-first 2-coloring, O(V + E) time.
+    The smallest vertex of every connected component goes in the first part
+
+    Arguments:
+    - graph: SimpleGraphObject
+        A SimpleGraphObject representing the graph
+
+    Raises:
+    - ValueError: If the graph is not bipartite
+
+    Returns:
+    A list of two lists of vertex labels, each in sorted label order, as
+    the rows of AdjacencyMatrix
+    '''
+    def eval(graph: SimpleGraphObject):
+        order = graph._sorted_ids()
+        side = _sides(graph, order)
+        return [
+            [graph._labels[i] for i in order if side[i] == 0],
+            [graph._labels[i] for i in order if side[i] == 1]
+        ]
+
+class HopcroftKarpMatching(BaseCallable):
+    '''
+    HopcroftKarpMatching(graph: SimpleGraphObject, first_partition: list = None)
+    ----------------------------------------------------------------------------
+    Find a maximum matching of a bipartite graph, i.e. the largest set of
+    edges no two of which share a vertex, with the Hopcroft-Karp algorithm
+    in O(E sqrt(V)) time
+
+    Arguments:
+    - graph: SimpleGraphObject
+        A SimpleGraphObject representing the graph
+    - first_partition: list of integers/strings or None (optional)
+        The vertices of one part of the graph. If None, the first element
+        of the "bipartite_parties" property is used if the graph has one,
+        and BipartitePartition otherwise
+
+    Raises:
+    - ValueError: If the graph is not bipartite, if a vertex in
+        first_partition is not present in the graph, or if an edge joins two
+        vertices on the same side of first_partition
+
+    Returns:
+    A list of [u, v] label pairs, one per matched edge, with u in the first
+    part, in the sorted order of u
+    '''
+    def eval(graph: SimpleGraphObject, first_partition: list|None = None):
+        if first_partition is None and graph.get_property("bipartite_parties") is not None:
+            first_partition = graph.get_property("bipartite_parties")[0]
+
+        if first_partition is None:
+            side = _sides(graph, graph._sorted_ids())
+        else:
+            side = [1] * graph.get_vertex_count()
+            for vertex in first_partition:
+                side[graph._vertex_id(vertex)] = 0
+            for i, j, _ in graph._store.edges():
+                if side[i] == side[j]:
+                    raise ValueError(f"Edge ({graph._labels[i]}, {graph._labels[j]}) does not join the two parts")
+
+        left = [i for i in graph._sorted_ids() if side[i] == 0]
+        match = hopcroft_karp(graph._store.neighbour_index(), left)
+        return [[graph._labels[u], graph._labels[match[u]]] for u in left if match[u] != -1]
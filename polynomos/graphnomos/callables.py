@@ -1,8 +1,7 @@
-from collections import Counter
 from typing import Iterable
 
 from polynomos.base_callable import BaseCallable
-from polynomos.graphnomos.graph import GraphEdge, SimpleGraphObject, GraphVertex
+from polynomos.graphnomos.graph import SimpleGraphObject, GraphVertex
 
 __all__ = [
     'AddEdge',
@@ -19,6 +18,7 @@ __all__ = [
     'GraphEdges',
     'GraphNeighbours',
     'GraphVertices',
+    'IterNeighbours',
     'KRegularQ',
     'MakeWeighted',
     'Regularity',
@@ -32,7 +32,7 @@ __all__ = [
 
 class SimpleGraph(BaseCallable):
     '''
-    SimpleGraph(vertices: list[int|string], edges: list[list[int|string]])
+    SimpleGraph(vertices: list[int|string], edges: list[list[int|string]], backend: str = "dict")
     ---------------------------------------------------------------------------------
     Generate a simple graph from a list of edges and vertices
     
@@ -43,21 +43,27 @@ class SimpleGraph(BaseCallable):
             optionally followed by a third float)\n
         The edges of the graph, each represented as a list of 2 
         vertex labels and an optional third number denoting it's weight
+    - backend (optional): "dict" or "csr"\n
+        How the adjacency of the graph is stored. "dict" (default) keeps a hash
+        map per vertex and is cheap to mutate. "csr" keeps compressed-sparse-row
+        NumPy arrays, whose memory grows with the number of edges, and is meant 
+        for large sparse graphs that are built in bulk. Edge weights must be 
+        numeric with "csr"
 
     Returns:\n
     A SimpleGraphObject representing the graph
     '''
-    def eval(vertices = None, edges = None):
+    def eval(vertices = None, edges = None, backend = "dict"):
         if vertices is None and edges is None:
             raise ValueError("Both vertices and edges cannot be None")
         if edges is None:
             edges = set()
 
-        return SimpleGraphObject(vertices, edges)
+        return SimpleGraphObject(vertices, edges, backend=backend)
     
 class SimpleGraphFromMatrix(BaseCallable):
     '''
-    SimpleGraphFromMatrix(adjacency_matrix: list[list[int]], vertices: None/list[any])
+    SimpleGraphFromMatrix(adjacency_matrix: list[list[int]], vertices: None/list[any], backend: str = "dict")
     ---------------------------------------------------------------------------------
     Generate a graph from a given adjacency matrix
     
@@ -67,15 +73,17 @@ class SimpleGraphFromMatrix(BaseCallable):
     - vertices (optional): list of strings or integers\n
         The vertex labels of the graph. If nothing is provided, 
         1, 2, ..., n is inferred, where n is the length of the adjacency matrix
+    - backend (optional): "dict" or "csr"\n
+        How the adjacency of the graph is stored, see SimpleGraph
 
     Returns:\n
     A SimpleGraphObject representing the graph constructed from the adjacency matrix
     '''
-    def eval(adjacency_matrix, vertices = None):
+    def eval(adjacency_matrix, vertices = None, backend = "dict"):
         if vertices is None:
             vertices = [i + 1 for i in range(len(adjacency_matrix))]
         
-        return SimpleGraphObject._from_adjacency_matrix(adjacency_matrix, labels=vertices)
+        return SimpleGraphObject._from_adjacency_matrix(adjacency_matrix, labels=vertices, backend=backend)
     
 class MakeWeighted(BaseCallable):
     '''
@@ -108,7 +116,7 @@ class MakeWeighted(BaseCallable):
                 [edge.v1.label, edge.v2.label, wt]
             )
         
-        return SimpleGraphObject(vertices, weighted_edges)
+        return SimpleGraphObject(vertices, weighted_edges, backend=graph._backend)
     
 class AddEdgeWeight(BaseCallable):
     '''
@@ -132,12 +140,7 @@ class AddEdgeWeight(BaseCallable):
     None. Only the weight is assigned to the edge in the given graph
     '''
     def eval(graph: SimpleGraphObject, edge: Iterable[int|str], weight: float|int):
-        edges = GraphEdges(graph)
-        edge_obj = GraphEdge(*sorted([GraphVertex(edge[0]), GraphVertex(edge[1])]))
-        if edge_obj not in edges:
-            raise ValueError(f"The given edge {edge} is not in the graph")
-        graph.remove_edge(edge)
-        graph.add_edge([edge[0], edge[1], weight])
+        graph.set_edge_weight(edge, weight)
         
 class AddEdgeWeights(BaseCallable):
     '''
@@ -152,18 +155,18 @@ class AddEdgeWeights(BaseCallable):
         to be assigned
 
     Raises:
-    - ValueError: If any of the provided edges does not exist in the graph
+    - ValueError: If any of the provided edges does not exist in the graph.
+        The whole batch is checked first, so no weight is assigned in that case
 
     Returns:
     None. Only the weight is assigned to the given edges in the given graph
     '''
     def eval(graph: SimpleGraphObject, weight_dict: dict[tuple, float]):
-        for edge in weight_dict:
-            AddEdgeWeight(graph, edge, weight_dict[edge])
+        graph.set_edge_weights(weight_dict)
 
 class SimpleGraphFromList(BaseCallable):
     '''
-    SimpleGraphFromList(adj_list: dict[any, list[any]])
+    SimpleGraphFromList(adj_list: dict[any, list[any]], backend: str = "dict")
     --------------------------------------------------
     Generate a graph from a given adjacency list
     
@@ -171,12 +174,14 @@ class SimpleGraphFromList(BaseCallable):
     - adj_list: dict, mapping keys/integers to lists of keys/integers\n
         Adjacency List of the graph, mapping vertices to a list of other vertices 
         that are connected to the vertex.
+    - backend (optional): "dict" or "csr"\n
+        How the adjacency of the graph is stored, see SimpleGraph
 
     Returns:\n
     A SimpleGraphObject representing the graph constructed from the adjacency list
     '''
-    def eval(adj_list):
-        return SimpleGraphObject._from_adjacency_list(adj_list)
+    def eval(adj_list, backend = "dict"):
+        return SimpleGraphObject._from_adjacency_list(adj_list, backend=backend)
     
 class GraphVertices(BaseCallable):
     '''
@@ -248,7 +253,9 @@ class VertexCount(BaseCallable):
     An integer equal to the number of vertices
     '''
     def eval(graph: SimpleGraphObject):
-        return len(GraphVertices(graph))
+        if not isinstance(graph, SimpleGraphObject):
+            raise TypeError("Input must be a graph")
+        return graph.get_vertex_count()
     
 class EdgeCount(BaseCallable):
     '''
@@ -264,7 +271,9 @@ class EdgeCount(BaseCallable):
     An integer equal to the number of edges
     '''
     def eval(graph: SimpleGraphObject):
-        return len(GraphEdges(graph))
+        if not isinstance(graph, SimpleGraphObject):
+            raise TypeError("Input must be a graph")
+        return graph.get_edge_count()
     
 class AddEdge(BaseCallable):
     '''
@@ -301,13 +310,16 @@ class AddEdges(BaseCallable):
         A list representing the edge, with list elements representing
         the ends of the edge. You can add an optional 3rd element to each edge 
         list to denote the edge's weight
+
+    Raises:
+    - ValueError: If any of the given edges is not a list of 2 or 3 elements.
+        The whole batch is checked first, so no edge is added in that case
     
     Returns:\n
-    None. Only an edge is added to the given graph
+    None. Only the edges are added to the given graph
     '''
     def eval(graph: SimpleGraphObject, edges: list):
-        for edge in edges:
-            graph.add_edge(edge)
+        graph.add_edges(edges)
 
 class AddVertex(BaseCallable):
     '''
@@ -344,8 +356,7 @@ class AddVertices(BaseCallable):
     None. Only the given vertices are added to the graph.
     '''
     def eval(graph: SimpleGraphObject, vertices: list[int|str]):
-        for vertex in vertices:
-            graph.add_vertex(vertex)
+        graph.add_vertices(vertices)
 
 class DegreeSequence(BaseCallable):
     '''
@@ -398,11 +409,7 @@ class DegreeMap(BaseCallable):
     A dict mapping each vertex label to its degree
     '''
     def eval(graph: SimpleGraphObject):
-        d_map = {}
-        for vertex in GraphVertices(graph):
-            d_map[vertex.label] = VertexDegree(graph, vertex)
-
-        return d_map
+        return graph.get_degree_map()
     
 class DegreeFrequency(BaseCallable):
     '''
@@ -418,8 +425,7 @@ class DegreeFrequency(BaseCallable):
     A dict mapping each degree to its frequency
     '''
     def eval(graph: SimpleGraphObject):
-        d_freq = Counter(DegreeSequence(graph))
-        return dict(d_freq)
+        return graph.get_degree_frequency()
     
 class RegularQ(BaseCallable):
     '''
@@ -436,11 +442,7 @@ class RegularQ(BaseCallable):
     True if the graph is regular, False otherwise
     '''
     def eval(graph: SimpleGraphObject):
-        deg_freq = DegreeFrequency(graph)
-        for degree in deg_freq:
-            if deg_freq[degree] == VertexCount(graph):
-                return True
-        return False
+        return Regularity(graph) != -1
     
 class KRegularQ(BaseCallable):
     '''
@@ -459,11 +461,7 @@ class KRegularQ(BaseCallable):
     True if the graph is k-regular, False otherwise
     '''
     def eval(graph: SimpleGraphObject, k: int):
-        deg_freq = DegreeFrequency(graph)
-        for degree in deg_freq:
-            if deg_freq[degree] == VertexCount(graph) and degree == k:
-                return True
-        return False
+        return RegularQ(graph) and Regularity(graph) == k
     
 class Regularity(BaseCallable):
     '''
@@ -480,17 +478,18 @@ class Regularity(BaseCallable):
     is k-regular, or -1 if the graph is not regular
     '''
     def eval(graph: SimpleGraphObject):
-        deg_freq = DegreeFrequency(graph)
-        for degree in deg_freq:
-            if deg_freq[degree] == VertexCount(graph):
-                return degree
+        # The degree histogram has a single entry exactly when all vertices share a degree
+        deg_hist = graph.get_degree_frequency()
+        if len(deg_hist) == 1:
+            return next(iter(deg_hist))
         return -1
 
 class GraphNeighbours(BaseCallable):
     '''
     GraphNeighbours(graph: SimpleGraphObject, vertex: int|str|GraphVertex, return_objs: bool = False)
     ------------------------------------
-    Returns a list of the neighbours of a given vertex in a given graph
+    Returns a set of the neighbours of a given vertex in a given graph,
+    in O(deg(v)) time
 
     Arguments:
     - graph: SimpleGraphObject
@@ -503,18 +502,33 @@ class GraphNeighbours(BaseCallable):
         will be returned. Defaults to False
 
     Returns:
-    A list of vertex labels (or objects), each corresponding to a 
+    A set of vertex labels (or objects), each corresponding to a 
     neighbour of the given vertex
     '''
     def eval(graph: SimpleGraphObject, vertex: int | str | GraphVertex, return_objs = False):
-        if isinstance(vertex, GraphVertex):
-            v_label = vertex.label
-            return GraphNeighbours(graph, v_label)
-        if isinstance(vertex, (int, str)):
-            v_label = graph._label_map[vertex]
-            neighbours = set()
-            adj = AdjacencyMatrix(graph)
-            for i in range(len(adj[v_label - 1])):
-                if adj[v_label - 1][i] == 1:
-                    neighbours.add(graph._reverse_label_map[i + 1])
-            return neighbours
+        if return_objs:
+            return set(GraphVertex(label) for label in graph.iter_neighbours(vertex))
+        return graph.get_neighbours(vertex)
+    
+class IterNeighbours(BaseCallable):
+    '''
+    IterNeighbours(graph: SimpleGraphObject, vertex: int|str|GraphVertex)
+    ------------------------------------
+    Iterate over the neighbours of a given vertex in a given graph, without
+    building a new set of them like GraphNeighbours does
+
+    Arguments:
+    - graph: SimpleGraphObject
+        A SimpleGraphObject representing the graph
+    - vertex: integer, string or a GraphVertex object
+        The vertex whose neighbours are to be iterated over
+
+    Raises:
+    - ValueError: If the vertex is not present in the graph
+
+    Returns:
+    An iterator over the labels of the neighbours of the given vertex. 
+    The graph should not be modified while the iterator is in use
+    '''
+    def eval(graph: SimpleGraphObject, vertex: int | str | GraphVertex):
+        return graph.iter_neighbours(vertex)
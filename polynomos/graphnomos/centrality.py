@@ -0,0 +1,161 @@
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from polynomos.graphnomos.graph import SimpleGraphObject
+
+# Adjacency of the graph being processed, set once in every worker process
+# so that it is not pickled again with each batch of sources
+_adjacency = None
+
+def _set_adjacency(adjacency) -> None:
+    global _adjacency
+    _adjacency = adjacency
+
+def brandes_partial(adjacency, sources):
+    '''
+    Brandes' accumulation of pair dependencies from the given sources: a
+    breadth-first search from each source counts shortest paths, then the
+    dependencies are summed back from the farthest vertices. O(V + E) per
+    source. Returns the betweenness contributions as a NumPy array
+    '''
+    n = len(adjacency)
+    betweenness = [0.0] * n
+    for s in sources:
+        paths = [0] * n
+        distance = [-1] * n
+        paths[s] = 1
+        distance[s] = 0
+        # The list of visited vertices doubles as the queue
+        order = [s]
+        head = 0
+        while head < len(order):
+            v = order[head]
+            head += 1
+            next_distance = distance[v] + 1
+            v_paths = paths[v]
+            for w in adjacency[v]:
+                w_distance = distance[w]
+                if w_distance < 0:
+                    distance[w] = next_distance
+                    paths[w] = v_paths
+                    order.append(w)
+                elif w_distance == next_distance:
+                    paths[w] += v_paths
+
+        # Predecessors of w are the neighbours one step closer to s
+        dependency = [0.0] * n
+        for w in reversed(order):
+            previous = distance[w] - 1
+            share = (1 + dependency[w]) / paths[w]
+            for v in adjacency[w]:
+                if distance[v] == previous:
+                    dependency[v] += paths[v] * share
+            betweenness[w] += dependency[w]
+        betweenness[s] -= dependency[s]
+    return np.array(betweenness)
+
+def closeness_partial(adjacency, sources):
+    # Number of vertices reached from every source and their total distance
+    n = len(adjacency)
+    reached, totals = [], []
+    for s in sources:
+        distance = [-1] * n
+        distance[s] = 0
+        queue = deque([s])
+        total = 0
+        count = 1
+        while queue:
+            v = queue.popleft()
+            for w in adjacency[v]:
+                if distance[w] < 0:
+                    distance[w] = distance[v] + 1
+                    total += distance[w]
+                    count += 1
+                    queue.append(w)
+        reached.append(count)
+        totals.append(total)
+    return np.array(reached), np.array(totals)
+
+def _run_partial(task):
+    function, sources = task
+    return function(_adjacency, sources)
+
+def map_sources(function, adjacency, sources, workers: int|None = None):
+    '''
+    Apply `function(adjacency, batch)` to batches of the sources, in a pool
+    of `workers` processes if given, and return the list of partial results
+    in the order of the batches
+    '''
+    if not workers or workers <= 1 or len(sources) < 2:
+        return [function(adjacency, sources)]
+
+    batch_size = max(1, -(-len(sources) // (4 * workers)))
+    batches = [sources[i:i + batch_size] for i in range(0, len(sources), batch_size)]
+    with ProcessPoolExecutor(workers, initializer=_set_adjacency, initargs=(adjacency,)) as executor:
+        return list(executor.map(_run_partial, [(function, batch) for batch in batches]))
+
+def betweenness(graph: SimpleGraphObject, normalized: bool = True, samples: int|None = None,
+    seed: int|None = None, workers: int|None = None):
+    if samples is not None and samples < 1:
+        raise ValueError(f"samples should be a positive integer, got {samples}")
+    n = graph.get_vertex_count()
+    adjacency = [[j for j in row if j != i] for i, row in enumerate(graph._store.neighbour_index())]
+    sources = list(range(n))
+    scale = 0.5
+    if samples is not None and samples < n:
+        sources = np.random.default_rng(seed).choice(n, size=samples, replace=False).tolist()
+        scale *= n / samples
+
+    partials = map_sources(brandes_partial, adjacency, sources, workers)
+    values = np.sum(partials, axis=0) * scale
+    if normalized and n > 2:
+        values *= 2 / ((n - 1) * (n - 2))
+    return values
+
+def closeness(graph: SimpleGraphObject, workers: int|None = None):
+    '''
+    Closeness of every vertex, (r - 1) / (total distance to the r - 1 other
+    vertices it reaches), scaled by (r - 1) / (n - 1) so that vertices in
+    small components are not favoured (Wasserman and Faust)
+    '''
+    n = graph.get_vertex_count()
+    adjacency = [list(row) for row in graph._store.neighbour_index()]
+    partials = map_sources(closeness_partial, adjacency, list(range(n)), workers)
+    reached = np.concatenate([part[0] for part in partials]) - 1
+    totals = np.concatenate([part[1] for part in partials])
+    values = np.zeros(n)
+    positive = totals > 0
+    values[positive] = reached[positive] / totals[positive]
+    if n > 1:
+        values *= reached / (n - 1)
+    return values
+
+def pagerank(graph: SimpleGraphObject, damping: float = 0.85, tolerance: float = 1e-6,
+    max_iterations: int = 100):
+    '''
+    PageRank by power iteration on the CSR arrays of the graph. Each step
+    spreads the rank of every vertex evenly over its neighbours with a
+    single np.bincount over the edge entries, so a step is O(V + E). The
+    rank of vertices without neighbours is spread over all vertices
+    '''
+    n = graph.get_vertex_count()
+    if n == 0:
+        return np.zeros(0)
+    indptr, indices, _ = graph._store.csr_arrays()
+    degrees = np.diff(indptr)
+    rows = np.repeat(np.arange(n), degrees)
+    dangling = degrees == 0
+    share = np.zeros(n)
+    share[~dangling] = 1 / degrees[~dangling]
+
+    rank = np.full(n, 1 / n)
+    for _ in range(max_iterations):
+        spread = np.bincount(indices, weights=(rank * share)[rows], minlength=n)
+        updated = damping * spread + (damping * rank[dangling].sum() + 1 - damping) / n
+        change = np.abs(updated - rank).sum()
+        rank = updated
+        if change < n * tolerance:
+            return rank
+    raise ValueError(f"PageRank did not converge in {max_iterations} iterations")
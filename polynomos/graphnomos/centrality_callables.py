@@ -0,0 +1,110 @@
+from polynomos.base_callable import BaseCallable
+from polynomos.graphnomos.centrality import betweenness, closeness, pagerank
+from polynomos.graphnomos.graph import SimpleGraphObject
+
+__all__ = [
+    'BetweennessCentrality',
+    'ClosenessCentrality',
+    'PageRank'
+]
+
+def _by_label(graph: SimpleGraphObject, values):
+    values = values.tolist()
+    return {graph._labels[i]: values[i] for i in graph._sorted_ids()}
+
+class BetweennessCentrality(BaseCallable):
+    '''
+    BetweennessCentrality(graph: SimpleGraphObject, normalized: bool = True, samples: int = None,
+        seed: int = None, workers: int = None)
+    ---------------------------------------------------------------------------------------------
+    Find the betweenness centrality of every vertex, i.e. the sum over all
+    pairs of other vertices of the fraction of shortest paths between them
+    that pass through the vertex. Every edge counts as length 1
+
+    Uses Brandes' algorithm, O(VE) time: a breadth-first search from every
+    source vertex, whose dependencies are accumulated backwards. Sources
+    are independent, so they can be split over a pool of processes and
+    the partial sums added up
+
+    Arguments:
+    - graph: SimpleGraphObject
+        A SimpleGraphObject representing the graph
+    - normalized: bool (optional)
+        If True (Default), divide by the (n - 1)(n - 2)/2 pairs of other vertices
+    - samples: integer or None (optional)
+        If given, estimate the centrality from this many random sources
+        instead of all of them, scaled up accordingly (Brandes and Pich).
+        Defaults to None
+    - seed: integer or None (optional)
+        Seed for choosing the sample of sources
+    - workers: integer or None (optional)
+        If given, the sources are split over a pool of that many processes.
+        Defaults to None, searching in the calling process
+
+    Raises:
+    - ValueError: If samples is less than 1
+
+    Returns:
+    A dictionary mapping every vertex label to its centrality, in sorted
+    label order, as the rows of AdjacencyMatrix
+    '''
+    def eval(graph: SimpleGraphObject, normalized: bool = True, samples: int|None = None,
+        seed: int|None = None, workers: int|None = None):
+        return _by_label(graph, betweenness(graph, normalized, samples, seed, workers))
+
+class ClosenessCentrality(BaseCallable):
+    '''
+    ClosenessCentrality(graph: SimpleGraphObject, workers: int = None)
+    ------------------------------------------------------------------
+    Find the closeness centrality of every vertex, the reciprocal of its
+    average distance to the other vertices it can reach. In a disconnected
+    graph, this is scaled by the fraction of the other vertices reached
+    (Wasserman and Faust). Every edge counts as length 1
+
+    Arguments:
+    - graph: SimpleGraphObject
+        A SimpleGraphObject representing the graph
+    - workers: integer or None (optional)
+        If given, the breadth-first searches are split over a pool of that
+        many processes. Defaults to None, searching in the calling process
+
+    Returns:
+    A dictionary mapping every vertex label to its centrality, 0 for
+    isolated vertices, in sorted label order, as the rows of AdjacencyMatrix
+    '''
+    def eval(graph: SimpleGraphObject, workers: int|None = None):
+        return _by_label(graph, closeness(graph, workers))
+
+class PageRank(BaseCallable):
+    '''
+    PageRank(graph: SimpleGraphObject, damping: float = 0.85, tolerance: float = 1e-6,
+        max_iterations: int = 100)
+    -----------------------------------------------------------------------------------
+    Find the PageRank of every vertex, the long run share of time a random
+    walker spends on it, when at each step it follows a random edge with
+    probability `damping` and jumps to a random vertex otherwise
+
+    Computed by power iteration on the sparse adjacency arrays of the graph,
+    O(V + E) per iteration
+
+    Arguments:
+    - graph: SimpleGraphObject
+        A SimpleGraphObject representing the graph
+    - damping: float (optional)
+        Probability of following an edge. Defaults to 0.85
+    - tolerance: float (optional)
+        The iteration stops when the ranks change by less than n * tolerance
+        in total. Defaults to 1e-6
+    - max_iterations: integer (optional)
+        Defaults to 100
+
+    Raises:
+    - ValueError: If the ranks do not converge within max_iterations
+
+    Returns:
+    A dictionary mapping every vertex label to its rank, the ranks adding
+    up to 1, in sorted label order, as the rows of AdjacencyMatrix
+    '''
+    def eval(graph: SimpleGraphObject, damping: float = 0.85, tolerance: float = 1e-6,
+        max_iterations: int = 100):
+        return _by_label(graph, pagerank(graph, damping, tolerance, max_iterations))
@@ -0,0 +1,256 @@
+import heapq
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from polynomos.graphnomos.graph import SimpleGraphObject
+
+# Colorings are lists mapping every vertex id to a color 0, 1, 2, ...
+
+def coloring_adjacency(graph: SimpleGraphObject):
+    adjacency = [list(row) for row in graph._store.neighbour_index()]
+    for i, row in enumerate(adjacency):
+        if i in row:
+            raise ValueError(f"{graph._labels[i]} has a loop, so the graph has no proper coloring")
+    return adjacency
+
+def largest_first_order(adjacency):
+    return sorted(range(len(adjacency)), key=lambda v: -len(adjacency[v]))
+
+def smallest_last_order(adjacency):
+    '''
+    Matula-Beck ordering: repeatedly remove a vertex of least degree in the
+    remaining graph, and color in the reverse order of removal. Degree
+    buckets make it O(V + E), and the greedy coloring in this order uses at
+    most degeneracy + 1 colors
+    '''
+    n = len(adjacency)
+    degrees = [len(row) for row in adjacency]
+    buckets = [set() for _ in range(max(degrees, default=0) + 1)]
+    for v in range(n):
+        buckets[degrees[v]].add(v)
+    removed = [False] * n
+    order = []
+    lowest = 0
+    for _ in range(n):
+        lowest = max(lowest - 1, 0)
+        while not buckets[lowest]:
+            lowest += 1
+        v = buckets[lowest].pop()
+        removed[v] = True
+        order.append(v)
+        for u in adjacency[v]:
+            if not removed[u]:
+                buckets[degrees[u]].discard(u)
+                degrees[u] -= 1
+                buckets[degrees[u]].add(u)
+    order.reverse()
+    return order
+
+def greedy_coloring(adjacency, order):
+    colors = [-1] * len(adjacency)
+    for v in order:
+        taken = {colors[u] for u in adjacency[v]}
+        color = 0
+        while color in taken:
+            color += 1
+        colors[v] = color
+    return colors
+
+def dsatur_coloring(adjacency):
+    '''
+    Brelaz's DSATUR heuristic: always color next the vertex with the most
+    distinct colors among its neighbours, breaking ties by degree. A heap
+    with lazily discarded entries keeps it O((V + E) log V)
+    '''
+    n = len(adjacency)
+    colors = [-1] * n
+    seen = [set() for _ in range(n)]
+    heap = [(0, -len(adjacency[v]), v) for v in range(n)]
+    heapq.heapify(heap)
+    while heap:
+        saturation, _, v = heapq.heappop(heap)
+        if colors[v] >= 0 or -saturation != len(seen[v]):
+            continue
+        color = 0
+        while color in seen[v]:
+            color += 1
+        colors[v] = color
+        for u in adjacency[v]:
+            if colors[u] < 0 and color not in seen[u]:
+                seen[u].add(color)
+                heapq.heappush(heap, (-len(seen[u]), -len(adjacency[u]), u))
+    return colors
+
+def greedy_clique(adjacency):
+    # A clique grown greedily from every vertex, kept as a lower bound
+    masks = [sum(1 << u for u in row) for row in adjacency]
+    best = []
+    for start in sorted(range(len(adjacency)), key=lambda v: -len(adjacency[v])):
+        if len(adjacency[start]) < len(best):
+            break
+        clique = [start]
+        candidates = masks[start]
+        while candidates:
+            v = max(_bits(candidates), key=lambda u: (masks[u] & candidates).bit_count())
+            clique.append(v)
+            candidates &= masks[v]
+        if len(clique) > len(best):
+            best = clique
+    return best
+
+def _bits(mask: int):
+    while mask:
+        low = mask & -mask
+        yield low.bit_length() - 1
+        mask ^= low
+
+def _assign(adjacency, colors, available, v: int, color: int):
+    # Color v and strike the color off its uncolored neighbours. Returns the
+    # neighbours that changed, and whether one of them ran out of colors
+    bit = 1 << color
+    colors[v] = color
+    changed = []
+    for u in adjacency[v]:
+        if colors[u] < 0 and available[u] & bit:
+            available[u] ^= bit
+            changed.append(u)
+            if not available[u]:
+                return changed, False
+    return changed, True
+
+def _select(uncolored, available, adjacency):
+    # DSATUR branching: the vertex with the fewest colors left
+    return min(uncolored, key=lambda v: (available[v].bit_count(), -len(adjacency[v])))
+
+def _candidates(available: int, used: int, k: int) -> int:
+    # Colors are interchangeable, so only the lowest unused one is tried
+    return available & ((1 << min(used + 1, k)) - 1)
+
+def k_coloring(adjacency, k: int, colors, available, used: int):
+    '''
+    Exact search for a coloring with k colors, extending a partial one.
+    Branch and bound over bitsets: `available[v]` holds the colors still
+    allowed for each uncolored vertex as the bits of an integer, forward
+    checking prunes a branch as soon as a vertex has none left, and the
+    vertex with the fewest colors left is branched on first. The search
+    keeps an explicit stack, so it is not bounded by the recursion limit.
+
+    Returns the coloring as a list, or None if there is none.
+    '''
+    colors, available = list(colors), list(available)
+    uncolored = {v for v in range(len(adjacency)) if colors[v] < 0}
+    if not uncolored:
+        return colors
+
+    v = _select(uncolored, available, adjacency)
+    stack = [[v, _candidates(available[v], used, k), None, used]]
+    while stack:
+        frame = stack[-1]
+        v, candidates, changed, used = frame
+        if changed is not None:
+            bit = 1 << colors[v]
+            for u in changed:
+                available[u] |= bit
+            colors[v] = -1
+            uncolored.add(v)
+            frame[2] = None
+        if not candidates:
+            stack.pop()
+            continue
+
+        low = candidates & -candidates
+        frame[1] = candidates ^ low
+        color = low.bit_length() - 1
+        uncolored.discard(v)
+        frame[2], feasible = _assign(adjacency, colors, available, v, color)
+        if not feasible:
+            continue
+        if not uncolored:
+            return colors
+
+        used = max(used, color + 1)
+        w = _select(uncolored, available, adjacency)
+        stack.append([w, _candidates(available[w], used, k), None, used])
+    return None
+
+def _split(adjacency, k: int, colors, available, used: int, parts: int):
+    # Expand the top of the search tree breadth-first into at least `parts`
+    # independent subproblems, dropping the infeasible ones
+    frontier = [(colors, available, used)]
+    while 0 < len(frontier) < parts:
+        expanded = []
+        for colors, available, used in frontier:
+            uncolored = [v for v in range(len(adjacency)) if colors[v] < 0]
+            if not uncolored:
+                return [(colors, available, used)]
+            v = _select(uncolored, available, adjacency)
+            for color in _bits(_candidates(available[v], used, k)):
+                child_colors, child_available = list(colors), list(available)
+                _, feasible = _assign(adjacency, child_colors, child_available, v, color)
+                if feasible:
+                    expanded.append((child_colors, child_available, max(used, color + 1)))
+        frontier = expanded
+    return frontier
+
+def _solve_part(args):
+    return k_coloring(*args)
+
+def _first_found(executor, tasks):
+    # First coloring found by any subproblem, or None. The subproblems still
+    # queued are cancelled at once, so that they do not hold up the next k
+    futures = [executor.submit(_solve_part, task) for task in tasks]
+    try:
+        for future in as_completed(futures):
+            result = future.result()
+            if result is not None:
+                return result
+        return None
+    finally:
+        for future in futures:
+            future.cancel()
+
+def chromatic_coloring(graph: SimpleGraphObject, workers: int|None = None):
+    '''
+    Optimal coloring of a graph. The better of the DSATUR and smallest-last
+    greedy colorings gives an upper bound and a greedy clique a lower bound.
+    The clique is precolored, and the exact search then looks for colorings
+    with one color fewer than the best so far until it fails.
+
+    With `workers`, the top of every search tree is split into subproblems
+    that are solved in a pool of that many processes.
+    '''
+    adjacency = coloring_adjacency(graph)
+    n = len(adjacency)
+    if n == 0:
+        return []
+
+    best = min(
+        dsatur_coloring(adjacency),
+        greedy_coloring(adjacency, smallest_last_order(adjacency)),
+        key=max
+    )
+    clique = greedy_clique(adjacency)
+
+    executor = ProcessPoolExecutor(workers) if workers else None
+    try:
+        for k in range(max(best), max(len(clique), 1) - 1, -1):
+            colors = [-1] * n
+            available = [(1 << k) - 1] * n
+            feasible = True
+            for color, v in enumerate(clique):
+                _, ok = _assign(adjacency, colors, available, v, color)
+                feasible = feasible and ok
+            if not feasible:
+                break
+
+            if executor is None:
+                found = k_coloring(adjacency, k, colors, available, len(clique))
+            else:
+                parts = _split(adjacency, k, colors, available, len(clique), 4 * workers)
+                found = _first_found(executor, [(adjacency, k) + part for part in parts])
+            if found is None:
+                break
+            best = found
+    finally:
+        if executor is not None:
+            executor.shutdown(cancel_futures=True)
+    return best
@@ -0,0 +1,79 @@
+from polynomos.base_callable import BaseCallable
+from polynomos.graphnomos.coloring import (
+    chromatic_coloring, coloring_adjacency, dsatur_coloring, greedy_coloring,
+    largest_first_order, smallest_last_order
+)
+from polynomos.graphnomos.graph import SimpleGraphObject
+
+__all__ = [
+    'ChromaticNumber',
+    'GreedyColoring'
+]
+
+class GreedyColoring(BaseCallable):
+    '''
+    GreedyColoring(graph: SimpleGraphObject, method: str = "dsatur")
+    ----------------------------------------------------------------
+    Color the vertices of a graph so that adjacent vertices get different
+    colors, giving each vertex in turn the smallest color not taken by its
+    neighbours. The result is a proper coloring, but not always one with
+    the fewest colors, see ChromaticNumber
+
+    Arguments:
+    - graph: SimpleGraphObject
+        A SimpleGraphObject representing the graph
+    - method: string (optional)
+        The order in which the vertices are colored, either of\n
+        1. "largest_first": by decreasing degree\n
+        2. "smallest_last": the reverse of repeatedly removing a vertex of
+        least degree, using at most degeneracy + 1 colors\n
+        3. "dsatur" (Default): the vertex with the most distinct colors among
+        its neighbours first, ties broken by degree
+
+    Raises:
+    - ValueError: If the method is unknown, or if the graph has a loop
+
+    Returns:
+    A dictionary mapping every vertex label to its color 1, 2, 3, ...
+    '''
+    def eval(graph: SimpleGraphObject, method: str = "dsatur"):
+        adjacency = coloring_adjacency(graph)
+        if method == "largest_first":
+            colors = greedy_coloring(adjacency, largest_first_order(adjacency))
+        elif method == "smallest_last":
+            colors = greedy_coloring(adjacency, smallest_last_order(adjacency))
+        elif method == "dsatur":
+            colors = dsatur_coloring(adjacency)
+        else:
+            raise ValueError(f"Unknown method {method}, expected 'largest_first', 'smallest_last' or 'dsatur'")
+        return {graph._labels[i]: colors[i] + 1 for i in graph._sorted_ids()}
+
+class ChromaticNumber(BaseCallable):
+    '''
+    ChromaticNumber(graph: SimpleGraphObject, workers: int = None)
+    --------------------------------------------------------------
+    Find the chromatic number of a graph, the fewest colors needed to color
+    its vertices so that adjacent vertices get different colors
+
+    Greedy colorings and a greedy clique bound the answer, and an exact
+    branch and bound search with the DSATUR rule, over colors kept as integer
+    bitsets, closes the gap. The problem is NP-hard, so the search may take
+    exponential time on large graphs
+
+    Arguments:
+    - graph: SimpleGraphObject
+        A SimpleGraphObject representing the graph
+    - workers: integer or None (optional)
+        If given, the top of the search tree is split into subproblems that
+        are solved in a pool of that many processes. Defaults to None,
+        searching in the calling process
+
+    Raises:
+    - ValueError: If the graph has a loop
+
+    Returns:
+    The chromatic number as an integer, 0 for a graph without vertices
+    '''
+    def eval(graph: SimpleGraphObject, workers: int|None = None):
+        colors = chromatic_coloring(graph, workers=workers)
+        return max(colors, default=-1) + 1
@@ -0,0 +1,52 @@
+class DisjointSet:
+    '''
+    Union-find structure over the integers 0, 1, ..., n - 1, kept in two
+    flat arrays: the parent of every element and the size of every tree.
+
+    Unions link the root of the smaller tree under the larger one and finds
+    halve the path they walk, so a sequence of operations runs in nearly
+    linear time (inverse Ackermann per operation). Elements can be added at
+    any time, which makes it suited to tracking connectivity while the
+    edges of a graph are being inserted.
+    '''
+    def __init__(self, n: int = 0) -> None:
+        self.parent = list(range(n))
+        self.size = [1] * n
+        self.component_count = n
+
+    def __len__(self) -> int:
+        return len(self.parent)
+
+    def add(self) -> int:
+        self.parent.append(len(self.parent))
+        self.size.append(1)
+        self.component_count += 1
+        return len(self.parent) - 1
+
+    def find(self, i: int) -> int:
+        parent = self.parent
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    def union(self, i: int, j: int) -> bool:
+        '''
+        Merge the sets of i and j. Returns False if they were already the
+        same set
+        '''
+        i, j = self.find(i), self.find(j)
+        if i == j:
+            return False
+        if self.size[i] < self.size[j]:
+            i, j = j, i
+        self.parent[j] = i
+        self.size[i] += self.size[j]
+        self.component_count -= 1
+        return True
+
+    def connected(self, i: int, j: int) -> bool:
+        return self.find(i) == self.find(j)
+
+    def set_size(self, i: int) -> int:
+        return self.size[self.find(i)]
@@ -5,243 +5,292 @@ import numpy as np
 
 import matplotlib.pyplot as plt
 import matplotlib.patches as pch
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.collections import LineCollection
+from matplotlib.figure import Figure
 
+from polynomos.graphnomos.barnes_hut import barnes_hut_repulsion
+from polynomos.graphnomos.bipartite import two_coloring
 from polynomos.graphnomos.graph import GraphVertex, SimpleGraphObject
+from polynomos.graphnomos.spectral import laplacian_eigenpairs
+
+# Every layout can return either a dict mapping GraphVertex objects to (x, y)
+# tuples, or with as_numpy=True a pair (positions, labels): an (n, 2) float
+# array and the list of the vertex labels of its rows
+
+def _as_dict(positions, labels):
+    return {GraphVertex(label): tuple(position) for label, position in zip(labels, positions.tolist())}
+
+def _result(positions, labels, as_numpy: bool):
+    return (positions, labels) if as_numpy else _as_dict(positions, labels)
+
+def _repulsion(positions, optimal_distance, block_size = 512):
+    # Sum of the k^2 / d pushes away from every other vertex, computed 
+    # block by block so only block_size x n deltas are alive at a time
+    x, y = positions[:, 0], positions[:, 1]
+    displacements = np.empty_like(positions)
+    for start in range(0, len(positions), block_size):
+        stop = min(start + block_size, len(positions))
+        delta_x = x[None, :] - x[start:stop, None]
+        delta_y = y[None, :] - y[start:stop, None]
+        scale = delta_x * delta_x + delta_y * delta_y
+        np.maximum(scale, 0.0001, out=scale)
+        np.divide(optimal_distance ** 2, scale, out=scale)
+        rows = np.arange(stop - start)
+        scale[rows, rows + start] = 0
+        displacements[start:stop, 0] = -(delta_x * scale).sum(axis=1)
+        displacements[start:stop, 1] = -(delta_y * scale).sum(axis=1)
+    return displacements
 
 def fruchterman_reingold_layout(g: SimpleGraphObject, 
     iterations = 50, 
     seed = None,
-    optimal_distance = None
+    optimal_distance = None,
+    method = "exact",
+    theta = 0.5,
+    initial_positions = None,
+    temperature = None,
+    as_numpy = False
 ):
     def cool(temp, iterations):
         return temp * 0.975
 
+    if method not in ("exact", "barnes_hut"):
+        raise ValueError(f"Unknown method {method}, expected 'exact' or 'barnes_hut'")
+
     if seed is not None:
         random.seed(seed)
 
-    # Initialize positions randomly
-    positions = {vertex: (random.random(), random.random()) for vertex in g.get_vertices()}
+    # Vertex ids in the sorted order of their labels, one row each
+    ids = g._sorted_ids()
+    labels = [g._labels[i] for i in ids]
+    if len(ids) == 0:
+        return _result(np.zeros((0, 2)), labels, as_numpy)
+
+    # Initialize positions randomly, one (n, 2) row per vertex
+    positions = np.array([(random.random(), random.random()) for _ in ids])
+
+    # Row of each vertex id in the positions array
+    rows = np.empty(len(ids), dtype=np.int64)
+    rows[ids] = np.arange(len(ids))
+    src, dst, _ = g._store.edge_arrays()
+    src, dst = rows[src], rows[dst]
 
     # Parameters
     width = 1.0
     height = 1.0
     if optimal_distance is None:
-        optimal_distance = math.sqrt(width * height / len(g.get_vertices()))
-    iterations_total = iterations
-    temperature = width / 10.0
+        optimal_distance = math.sqrt(width * height / len(ids))
+
+    if initial_positions is not None:
+        _warm_start(g, ids, rows, positions, initial_positions, optimal_distance)
+    if temperature is None:
+        # A warm start only needs small refinements, so that the known
+        # vertices stay close to where they were
+        temperature = width / (100.0 if initial_positions is not None else 10.0)
 
     for it in range(iterations):
         # Calculate repulsive forces
-        displacements = {vertex: [0.0, 0.0] for vertex in g.get_vertices()}
-        for v1 in g.get_vertices():
-            for v2 in g.get_vertices():
-                if v1 != v2:
-                    delta_x = positions[v2][0] - positions[v1][0]
-                    delta_y = positions[v2][1] - positions[v1][1]
-                    
-                    delta_dist = max(0.01, math.sqrt(delta_x ** 2 + delta_y ** 2))
-                    repulsion = (optimal_distance ** 2) / delta_dist
-
-                    displacement_x = (delta_x / delta_dist) * repulsion
-                    displacement_y = (delta_y / delta_dist) * repulsion
-
-                    displacements[v1][0] -= displacement_x
-                    displacements[v1][1] -= displacement_y
+        if method == "barnes_hut":
+            displacements = barnes_hut_repulsion(positions, optimal_distance, theta)
+        else:
+            displacements = _repulsion(positions, optimal_distance)
 
         # Calculate attractive forces
-        for edge in g.get_edges():
-            delta_x = positions[edge.v1][0] - positions[edge.v2][0]
-            delta_y = positions[edge.v1][1] - positions[edge.v2][1]
-            
-            delta_dist = max(0.01, math.sqrt(delta_x ** 2 + delta_y ** 2))
-            attraction = (delta_dist ** 2) / optimal_distance
-
-            displacement_x = (delta_x / delta_dist) * attraction
-            displacement_y = (delta_y / delta_dist) * attraction
-
-            displacements[edge.v1][0] -= displacement_x
-            displacements[edge.v1][1] -= displacement_y
-            displacements[edge.v2][0] += displacement_x
-            displacements[edge.v2][1] += displacement_y
-
-        # Update node positions
-        for vertex in g.get_vertices():
-            displacement = displacements[vertex]
-            displacement_mag = max(0.01, math.sqrt(displacement[0] ** 2 + displacement[1] ** 2))
-            
-            # Apply displacement with temperature scaling
-            displacement_x = (displacement[0] / displacement_mag) * min(displacement_mag, temperature)
-            displacement_y = (displacement[1] / displacement_mag) * min(displacement_mag, temperature)
-
-            # Update positions
-            x, y = positions[vertex]
-            x = min(width, max(-width, x + displacement_x))
-            y = min(height, max(-height, y + displacement_y))
-            positions[vertex] = (x, y)
+        delta = positions[src] - positions[dst]
+        delta_dist = np.maximum(0.01, np.sqrt((delta ** 2).sum(axis=1)))
+        attraction = (delta * (delta_dist / optimal_distance)[:, None])
+        np.subtract.at(displacements, src, attraction)
+        np.add.at(displacements, dst, attraction)
+
+        # Update node positions, moving each by at most the temperature
+        displacement_mag = np.maximum(0.01, np.sqrt((displacements ** 2).sum(axis=1)))
+        step = np.minimum(displacement_mag, temperature) / displacement_mag
+        positions += displacements * step[:, None]
+        np.clip(positions[:, 0], -width, width, out=positions[:, 0])
+        np.clip(positions[:, 1], -height, height, out=positions[:, 1])
 
         # Cool down temperature
         temperature = cool(temperature, it)
 
-    return positions
-
-def draw_graph(g: SimpleGraphObject, points = None, algorithm = "fruchterman_reingold"):
+    return _result(positions, labels, as_numpy)
+
+def _id_positions(g: SimpleGraphObject, points):
+    # (n, 2) array of the positions of the vertex ids, from either layout form
+    if isinstance(points, dict):
+        return np.array([points[GraphVertex(label)] for label in g._labels], dtype=np.float64).reshape(-1, 2)
+
+    positions, labels = points
+    positions = np.asarray(positions, dtype=np.float64).reshape(-1, 2)
+    ids = np.array([g._ids.get(label, -1) for label in labels], dtype=np.int64)
+    n = g.get_vertex_count()
+    if len(ids) != n or len(positions) != n or (ids < 0).any() or len(np.unique(ids)) != n:
+        raise ValueError("The layout should give exactly one position to every vertex of the graph")
+    rows = np.empty(n, dtype=np.int64)
+    rows[ids] = np.arange(n)
+    return positions[rows]
+
+def _render(ax, g: SimpleGraphObject, points, show_labels: bool = True) -> None:
+    labels = g._labels
+    positions = _id_positions(g, points)
+    src, dst, weights = g._store.edge_arrays()
+
+    # Draw edges, all in one artist
+    ax.add_collection(LineCollection(
+        np.stack([positions[src], positions[dst]], axis=1), colors='k', linewidths=1, zorder=1
+    ))
+    for i, j in zip(src[weights == weights].tolist(), dst[weights == weights].tolist()):
+        mid_x, mid_y = (positions[i] + positions[j]) / 2
+        ax.text(mid_x, mid_y, str(g._store.weight(i, j)), fontsize=15, ha='center', va='center')
+
+    # Draw nodes, all in one artist
+    ax.scatter(positions[:, 0], positions[:, 1], color='orange', marker='o', s=500, zorder=2)
+    if show_labels:
+        for label, (x, y) in zip(labels, positions.tolist()):
+            ax.text(x, y, str(label), fontsize=12, ha='center', va='center')
+
+    ax.autoscale_view()
+    ax.axis('off')
+
+def draw_graph(g: SimpleGraphObject, points = None, algorithm = "fruchterman_reingold", output: str = None,
+    show_labels: bool = True, figsize = None, dpi: int = 100, ax = None):
     if points is None:
         if algorithm == "fruchterman_reingold":
-            points = fruchterman_reingold_layout(g)
+            points = fruchterman_reingold_layout(g, as_numpy=True)
         elif algorithm == "bipartite":
-            points = bipartite_layout(g)
+            points = bipartite_layout(g, as_numpy=True)
+        elif algorithm == "spectral":
+            points = spectral_layout(g, as_numpy=True)
         else:
             raise ValueError("Either provide an algorithm or a dict of points for the graph")
-    # Draw edges
-    for edge in g.get_edges():
-        x1, y1 = points[edge.v1]
-        x2, y2 = points[edge.v2]
-
-        plt.plot([x1, x2], [y1, y2], 'k-', lw=1, zorder=1)
-
-        if edge.weight is not None:
-            weight = edge.weight
-            mid_x, mid_y = (x1 + x2) / 2, (y1 + y2) / 2
-
-            plt.text(mid_x, mid_y, str(weight), fontsize=15, ha='center', va='center')
-
-    # Draw nodes
-    for node, pos in points.items():
-        plt.scatter(pos[0], pos[1], color='orange', marker='o', s=500, zorder=2)
-        plt.text(pos[0], pos[1], str(node.label), fontsize=12, ha='center', va='center')
-    
-    plt.axis('off')
-    plt.show()
-
-def bipartite_layout(g: SimpleGraphObject, first_partition: list = None):
-    def rescale(positions):
-        limit = 0
-        y_max = -1
-        x_max = -1
-
-        len_pos = len(positions)
-
-        x_mean = 0
-        y_mean = 0
-
-        for pos in positions:
-            if positions[pos][0] > x_max:
-                x_max = positions[pos][0]
-            if positions[pos][1] > y_max:
-                y_max = positions[pos][1]
-
-            x_mean += positions[pos][0] / len_pos
-            y_mean += positions[pos][1] / len_pos
-
-            limit = max(limit, x_max, y_max)
-
-        for pos in positions:
-            positions[pos][0] -= x_mean
-            positions[pos][1] -= y_mean
-        
-        if limit > 0:
-            for pos in positions:
-                positions[pos][0] *= 1 / limit
-                positions[pos][1] *= 1 / limit
-
-        return positions
 
+    if ax is not None:
+        # Draw into the caller's figure, which they show or save themselves
+        _render(ax, g, points, show_labels)
+        if output is not None:
+            ax.figure.savefig(output, dpi=dpi)
+        return
+
+    if output is None:
+        # Draw on the current pyplot axes, unless a new figure size is asked for
+        ax = plt.gca() if figsize is None else plt.subplots(figsize=figsize)[1]
+        _render(ax, g, points, show_labels)
+        plt.show()
+        return
+
+    # Render straight to the file on an Agg canvas, without pyplot, so no
+    # GUI is needed and no figure is left open
+    figure = Figure(figsize=figsize, dpi=dpi)
+    FigureCanvasAgg(figure)
+    _render(figure.add_subplot(), g, points, show_labels)
+    figure.savefig(output)
+
+def bipartite_layout(g: SimpleGraphObject, first_partition: list = None, as_numpy: bool = False):
     if first_partition is None:
         if g.get_property("bipartite_parties") is not None:
-            first_partition = [GraphVertex(v) for v in g.get_property("bipartite_parties")[0]]
+            first_partition = list(g.get_property("bipartite_parties")[0])
         else:
-            first_partition = [GraphVertex(v) for v in range(1, random.randint(2, len(g.get_vertices())))]
+            side = two_coloring(g, g._sorted_ids())
+            if side is None:
+                raise ValueError("The graph is not bipartite, so first_partition has to be given")
+            first_partition = [g._labels[i] for i in g._sorted_ids() if side[i] == 0]
     else:
-        temp = []
         for v in first_partition:
             if GraphVertex(v) not in g.get_vertices():
                 raise ValueError(f"Vertex {v} is not in the graph")
-            else:
-                temp.append(GraphVertex(v))
-        first_partition = temp
-        
+
     height = 1
     width = 4 / 3
-    offset = (width / 2, height / 2)
-
-    first_partition = set(first_partition)
-    second_partition = g.get_vertices() - first_partition
-
-    first_part_points = {
-        vertex: [0, i * height] for i, vertex in enumerate(first_partition)
-    }
-
-    second_part_points = {
-        vertex: [width, i * height] for i, vertex in enumerate(second_partition)
-    }
-
-    for pt in first_part_points:
-        first_part_points[pt][0] -= offset[0]
-        first_part_points[pt][1] -= offset[1]
-
-    for pt in second_part_points:
-        second_part_points[pt][0] -= offset[0]
-        second_part_points[pt][1] -= offset[1]
 
-    final_pts_dict = {}
-
-    for pt in first_part_points:
-        final_pts_dict[pt] = first_part_points[pt]
-
-    for pt in second_part_points:
-        final_pts_dict[pt] = second_part_points[pt]
-
-    return rescale(final_pts_dict)
-
-def circular_layout(g: SimpleGraphObject):
-    center = (0, 0)
-
-    vertices = g.get_vertices()
-    
-    if len(vertices) == 0:
-        return {}
-    elif len(vertices) == 1:
-        return {
-            list(vertices)[0]: center
-        }
-    else:
-        thetas = [float(angle) * 2 * math.pi / len(vertices) for angle in range(len(vertices))]
-        positions = {vertex: (math.cos(theta), math.sin(theta)) for vertex, theta in zip(vertices, thetas)}
-        return positions
-    
-def shell_layout(g: SimpleGraphObject, shells: list[list[int]]):
-    center = (0, 0)
-
-    vertices = g.get_vertices()
-
-    if len(vertices) == 0:
-        return {}
-    elif len(vertices) == 1:
-        return {
-            list(vertices)[0]: center
-        }
+    # Each side is a column of vertices one unit apart, in sorted label order
+    first = set(first_partition)
+    ids = g._sorted_ids()
+    left = [g._labels[i] for i in ids if g._labels[i] in first]
+    right = [g._labels[i] for i in ids if g._labels[i] not in first]
+    positions = np.zeros((len(ids), 2))
+    positions[len(left):, 0] = width
+    positions[:len(left), 1] = np.arange(len(left)) * height
+    positions[len(left):, 1] = np.arange(len(right)) * height
+    positions -= (width / 2, height / 2)
+
+    # Centre on the origin, scaled by the largest coordinate before centering
+    if len(ids) > 0:
+        limit = max(0, positions.max())
+        positions -= positions.mean(axis=0)
+        if limit > 0:
+            positions /= limit
+    return _result(positions, left + right, as_numpy)
+
+def _warm_start(g: SimpleGraphObject, ids, rows, positions, initial_positions, optimal_distance):
+    # Copy the known positions, keyed by GraphVertex or label, or given as a
+    # (positions, labels) pair, then place every new vertex near the average
+    # of its placed neighbours, sweeping outwards from the placed ones. New
+    # vertices out of reach of any placed vertex keep their random position
+    if isinstance(initial_positions, dict):
+        initial_positions = initial_positions.items()
     else:
-        if len(shells[0]) == 1:
-            radius = 0
-        else:
-            radius = 1.0 / len(shells)
-
-        rotate = math.pi / len(shells)
-        
-        init_rotate = rotate
-
-        positions = {}
-        for shell in shells:
-            thetas = (np.linspace(0, 2 * math.pi, len(shell), endpoint=False, dtype=np.float32) + init_rotate)
-            positions.update(
-                {
-                    GraphVertex(vertex): (
-                        radius * np.cos(theta) + center[0], 
-                        radius * np.sin(theta) + center[1]
-                    ) for vertex, theta in zip(shell, thetas)
-                }
-            )
-            radius += 1.0 / (len(shells))
-            init_rotate += rotate
-        
-        return positions
\ No newline at end of file
+        initial_positions = zip(initial_positions[1], np.asarray(initial_positions[0]).tolist())
+    placed = np.zeros(len(ids), dtype=bool)
+    for vertex, position in initial_positions:
+        label = vertex.label if isinstance(vertex, GraphVertex) else vertex
+        if label in g._ids:
+            row = rows[g._ids[label]]
+            positions[row] = position
+            placed[row] = True
+
+    adjacency = g._store.neighbour_index()
+    frontier = [i for i in ids if not placed[rows[i]] and any(placed[rows[j]] for j in adjacency[i])]
+    while frontier:
+        for i in frontier:
+            neighbours = [rows[j] for j in adjacency[i] if placed[rows[j]]]
+            jitter = np.array([random.uniform(-1, 1), random.uniform(-1, 1)]) * optimal_distance / 4
+            positions[rows[i]] = positions[neighbours].mean(axis=0) + jitter
+        for i in frontier:
+            placed[rows[i]] = True
+        frontier = sorted({j for i in frontier for j in adjacency[i] if not placed[rows[j]]})
+
+def circular_layout(g: SimpleGraphObject, as_numpy: bool = False):
+    # Vertices evenly spaced around the unit circle in sorted label order,
+    # or at the centre if there is only one
+    labels = [g._labels[i] for i in g._sorted_ids()]
+    positions = np.zeros((len(labels), 2))
+    if len(labels) > 1:
+        thetas = np.arange(len(labels)) * 2 * math.pi / len(labels)
+        positions[:, 0] = np.cos(thetas)
+        positions[:, 1] = np.sin(thetas)
+    return _result(positions, labels, as_numpy)
+
+def spectral_layout(g: SimpleGraphObject, method: str = "auto", as_numpy: bool = False):
+    # Coordinates from the Laplacian eigenvectors of the second and third
+    # smallest eigenvalues, centred and scaled to fit in [-1, 1]
+    n = g.get_vertex_count()
+    labels = [g._labels[i] for i in g._sorted_ids()]
+    if n == 0:
+        return _result(np.zeros((0, 2)), labels, as_numpy)
+    _, vectors = laplacian_eigenpairs(g, 3, method)
+    positions = np.zeros((n, 2))
+    positions[:, :vectors.shape[1] - 1] = vectors[:, 1:]
+    positions -= positions.mean(axis=0)
+    limit = np.abs(positions).max()
+    if limit > 0:
+        positions /= limit
+    return _result(positions, labels, as_numpy)
+
+def shell_layout(g: SimpleGraphObject, shells: list[list[int]], as_numpy: bool = False):
+    # Shell i of k is a circle of radius (i + 1) / k, or i / k if the first
+    # shell is a single vertex at the centre, each turned by a further pi / k
+    labels = [v for shell in shells for v in shell]
+    if g.get_vertex_count() <= 1:
+        return _result(np.zeros((len(labels), 2)), labels, as_numpy)
+
+    positions = np.empty((len(labels), 2))
+    radius = 0 if len(shells[0]) == 1 else 1.0 / len(shells)
+    rotate = math.pi / len(shells)
+    start = 0
+    for i, shell in enumerate(shells):
+        thetas = np.arange(len(shell)) * 2 * math.pi / len(shell) + (i + 1) * rotate
+        positions[start:start + len(shell), 0] = radius * np.cos(thetas)
+        positions[start:start + len(shell), 1] = radius * np.sin(thetas)
+        start += len(shell)
+        radius += 1.0 / len(shells)
+    return _result(positions, labels, as_numpy)
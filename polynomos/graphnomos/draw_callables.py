@@ -3,9 +3,10 @@ import random
 from polynomos.base_callable import BaseCallable
 from polynomos.graphnomos.draw import (
     draw_graph, fruchterman_reingold_layout, bipartite_layout,
-    circular_layout, shell_layout
+    circular_layout, shell_layout, spectral_layout
 )
 from polynomos.graphnomos.graph import GraphVertex, SimpleGraphObject
+from polynomos.graphnomos.layout_cache import LayoutCache
 
 __all__ = [
     "DrawGraph",
@@ -13,11 +14,19 @@ __all__ = [
     "CircularLayout",
     "BipartiteLayout",
     "FruchtermanReingoldLayout",
+    "SpectralLayout",
+    "LayoutCache",
 ]
 
+def _cached_parameters(parameters: dict, as_numpy: bool) -> dict:
+    # Both forms of a layout are cached, under different keys
+    return dict(parameters, as_numpy=True) if as_numpy else parameters
+
 class FruchtermanReingoldLayout(BaseCallable):
     '''
-    FruchtermanReingoldLayout(g: SimpleGraphObject)
+    FruchtermanReingoldLayout(g: SimpleGraphObject, iterations: int = 50, seed: int = None, 
+        method: str = "exact", theta: float = 0.5, cache: LayoutCache = None, 
+        initial_positions: dict = None, temperature: float = None, as_numpy: bool = False)
     ---------------------------------------------------------------------------------
     Use the Fruchterman-Reingold Force-Directed drawing algorithm to calculate
     the coordinates of vertices of a given graph to be as aesthetically pleasing 
@@ -28,53 +37,136 @@ class FruchtermanReingoldLayout(BaseCallable):
     positions of vertices where the forces are balanced out and the system is at an 
     equilibrium.
     
+    The forces of each iteration are computed on NumPy arrays holding all 
+    vertex positions at once, which takes O(n^2) time and O(n) memory per 
+    iteration. For very large graphs, the Barnes-Hut method approximates the 
+    repulsive forces with a quadtree in O(n log n) time per iteration.
+
+    After a few edits to a graph that already has a layout, pass that layout as 
+    `initial_positions` with a small number of `iterations`: the existing vertices 
+    start where they were, each new vertex starts next to its neighbours, and the 
+    lower starting temperature only refines the picture instead of redrawing it.
+    
     Arguments: \n
     - g: SimpleGraphObject
     The graph whose point coordinates need to be calculated
+    - iterations: integer (optional)
+    Number of force simulation steps. Defaults to 50
+    - seed: integer or None (optional)
+    Seed for the random initial positions, making the layout reproducible. 
+    Defaults to None
+    - method: string (optional)
+    Either "exact" (Default), which sums the repulsion between every pair of vertices,
+    or "barnes_hut", which treats groups of far away vertices as a single body
+    - theta: float (optional)
+    Accuracy of the Barnes-Hut approximation: a quadtree cell is treated as a single 
+    body when its side is less than `theta` times its distance. Smaller is more 
+    accurate and slower, 0 is exact. Defaults to 0.5 and is ignored by the "exact" method
+    - cache: LayoutCache or None (optional)
+    A cache to look the layout up in, and store it in when missing. Only layouts with a
+    seed and without initial positions are cached, since they are the reproducible ones. 
+    Defaults to None
+    - initial_positions: dict, tuple or None (optional)
+    Starting (x, y) positions, keyed by GraphVertex objects or labels or as a
+    (positions, labels) pair, e.g. a layout computed before the graph was edited.
+    Vertices missing from it are placed near the average of their placed neighbours,
+    or at random if they have none. Defaults to None, starting every vertex at a
+    random position
+    - temperature: float or None (optional)
+    Largest distance a vertex may move in the first iteration, which then decreases.
+    Defaults to 0.1, or 0.01 when initial_positions are given
+    - as_numpy: bool (optional)
+    If True, return the layout as a pair of arrays instead of a dict. Defaults to False
+
+    Raises:\n
+    ValueError: When the method is unknown
 
     Returns:\n
     A dict of GraphVertex-(x, y) tuple mappings denoting the optimal position of 
-    each vertex
+    each vertex, or if as_numpy is True, a tuple (positions, labels) of an (n, 2) 
+    NumPy float array and the list of the vertex labels of its rows, in sorted order
 
     References:\n
     - [1] https://dcc.fceia.unr.edu.ar/sites/default/files/uploads/materias/fruchterman.pdf
     (Graph Drawing by Force–Directed Placement by THOMAS M. J. FRUCHTERMAN AND EDWARD M. REINGOLD)
     Easy to implement from the paper, but code has been corrected with some modifications 
     and ChatGPT as deemed suitable
+    - [2] J. Barnes and P. Hut, A hierarchical O(N log N) force-calculation algorithm,
+    Nature 324 (1986)
     '''
-    def eval(g: SimpleGraphObject):
-        return fruchterman_reingold_layout(g)
+    def eval(g: SimpleGraphObject, iterations: int = 50, seed: int = None, method: str = "exact", theta: float = 0.5,
+        cache: LayoutCache|None = None, initial_positions: dict|tuple|None = None, temperature: float|None = None,
+        as_numpy: bool = False):
+        def compute():
+            return fruchterman_reingold_layout(
+                g, iterations=iterations, seed=seed, method=method, theta=theta, 
+                initial_positions=initial_positions, temperature=temperature, as_numpy=as_numpy
+            )
+
+        if cache is None or seed is None or initial_positions is not None:
+            return compute()
+        parameters = {"iterations": iterations, "seed": seed, "method": method, "theta": theta, "temperature": temperature}
+        return cache.layout(g, "fruchterman_reingold", _cached_parameters(parameters, as_numpy), compute)
 
 class DrawGraph(BaseCallable):
     '''
-    DrawGraph(pos: dict[GraphVertex, tuple[float]], layout: string)
+    DrawGraph(pos: dict[GraphVertex, tuple[float]] | tuple, layout: string, output: str = None,
+        show_labels: bool = True, figsize: tuple = None, dpi: int = 100, ax: Axes = None)
     ---------------------------------------------------------------------------------
     Draw the graph on a matplotlib plot using given position map, 
-    or a given layout algorithm
+    or a given layout algorithm. All the edges are drawn as a single 
+    LineCollection and all the vertices as a single scatter, so large 
+    graphs render quickly
     
     Arguments: \n
     - Either: \n
         pos: dict mapping GraphVertex objects to positions 
-            (tuples with (x, y) values)\n
-        The dictionary of positions of the graph vertices
+            (tuples with (x, y) values), or tuple (positions, labels)\n
+        The dictionary of positions of the graph vertices, or the (n, 2) array of
+        positions and the list of the vertex labels of its rows returned by the
+        layouts with as_numpy=True
     - Or: \n
         layout: string\n
         Algorithm for drawing the graph layout. Can be either of\n
         1. "fruchterman_reingold" (Default): Uses the Fruchterman-Reingold Force-Directed
         Algorithm\n
         2. "bipartite": Uses a bipartite layout algorithm, best suited for drawing
-        bipartite graphs
+        bipartite graphs\n
+        3. "spectral": Uses the eigenvectors of the Laplacian matrix
+    - output: string or None (optional)\n
+        Path of an image file (e.g. "graph.png" or "graph.svg") to save the plot to. 
+        The plot is then rendered headless with the Agg backend, without opening a window.
+        Defaults to None, showing the plot
+    - show_labels: bool (optional)\n
+        Whether to write the vertex labels on the vertices. Defaults to True
+    - figsize: tuple of two floats or None (optional)\n
+        Size of a new figure in inches. Defaults to None, drawing on the current
+        pyplot axes when showing the plot, or using the Matplotlib default size
+    - dpi: integer (optional)\n
+        Resolution of the saved image, in dots per inch. Defaults to 100
+    - ax: matplotlib Axes or None (optional)\n
+        Axes to draw the graph on, e.g. a subplot of your own figure. The plot is
+        then neither shown nor closed, and is only saved if `output` is given
+
+    Raises:\n
+    ValueError: When the layout is unknown, or pos is a tuple that does not give exactly
+    one position to every vertex
 
     Returns:\n
     None. Opens up a Matplotlib window (or plot in iPython Notebook) showing the graph
-    plot.
+    plot, writes it to `output`, or draws it on `ax`.
     '''
-    def eval(g, pos = None, layout = 'fruchterman_reingold'):
-        draw_graph(g, points=pos, algorithm=layout)
+    def eval(g, pos = None, layout = 'fruchterman_reingold', output: str|None = None, 
+        show_labels: bool = True, figsize = None, dpi: int = 100, ax = None):
+        draw_graph(
+            g, points=pos, algorithm=layout, output=output, show_labels=show_labels, 
+            figsize=figsize, dpi=dpi, ax=ax
+        )
 
 class BipartiteLayout(BaseCallable):
     '''
-    BipartiteLayout(g: SimpleGraphObject)
+    BipartiteLayout(g: SimpleGraphObject, first_partition: list = None, cache: LayoutCache = None,
+        as_numpy: bool = False)
     ---------------------------------------------------------------------------------
     Calculate the coordinates of vertices, with a given list of vertices on the left
     and the remaining vertices on the right. Best used for bipartite graphs.
@@ -83,51 +175,142 @@ class BipartiteLayout(BaseCallable):
     - g: SimpleGraphObject\n
     The graph whose point coordinates need to be calculated
     - first_partition: list of integers/strings or None\n
-    The vertices that are to be drawn on the left. If None, first_partition is chosen
-    to be any number of vertices from 2 to n - 1, or if the graph has "bipartite_parties" in its properties
+    The vertices that are to be drawn on the left. If None and the graph has "bipartite_parties" in its properties
     (usually when creating bipartite graphs), it will take the first element in the "bipartite_parties"
-    value to be used as the first_partition.
+    value to be used as the first_partition. Otherwise the first part found by BipartitePartition is used.
 
     Raises: \n
-    ValueError: When first_partition contains a vertex not in the given graph
+    ValueError: When first_partition contains a vertex not in the given graph, or when first_partition
+    is None and the graph is not bipartite
+    - cache: LayoutCache or None (optional)\n
+    A cache to look the layout up in, and store it in when missing. Defaults to None
+    - as_numpy: bool (optional)\n
+    If True, return the layout as a pair of arrays instead of a dict. Defaults to False
 
     Returns:\n
     A dict of GraphVertex-(x, y) tuple mappings denoting the optimal position of 
-    each vertex
+    each vertex, or if as_numpy is True, a tuple (positions, labels) of an (n, 2) 
+    NumPy float array and the list of the vertex labels of its rows, the first
+    partition first
 
     References:\n
     - [1] nx.bipartite_layout() function in NetworkX Graph Library. The NX-version uses numpy but
     here it is implemented from scratch as much as possible.
     '''
-    def eval(g: SimpleGraphObject, first_partition = None):
-        return bipartite_layout(g, first_partition)
+    def eval(g: SimpleGraphObject, first_partition = None, cache: LayoutCache|None = None, as_numpy: bool = False):
+        # The graph fingerprint does not cover its properties, so the parties
+        # are resolved here to be part of the cache key
+        if first_partition is None and g.get_property("bipartite_parties") is not None:
+            first_partition = list(g.get_property("bipartite_parties")[0])
+
+        def compute():
+            return bipartite_layout(g, first_partition, as_numpy)
+
+        if cache is None:
+            return compute()
+        return cache.layout(g, "bipartite", _cached_parameters({"first_partition": first_partition}, as_numpy), compute)
     
 class CircularLayout(BaseCallable):
     '''
-    CircularLayout(g: SimpleGraphObject)
+    CircularLayout(g: SimpleGraphObject, cache: LayoutCache = None, as_numpy: bool = False)
     ---------------------------------------------------------------------------------
     Calculate the coordinates of vertices of given graph arranged in a circle
     
     Arguments: \n
     - g: SimpleGraphObject\n
     The graph whose point coordinates need to be calculated
+    - cache: LayoutCache or None (optional)\n
+    A cache to look the layout up in, and store it in when missing. Defaults to None
+    - as_numpy: bool (optional)\n
+    If True, return the layout as a pair of arrays instead of a dict. Defaults to False
     
     Returns:\n
     A dict of GraphVertex-(x, y) tuple mappings denoting the optimal position of 
-    each vertex
+    each vertex, or if as_numpy is True, a tuple (positions, labels) of an (n, 2) 
+    NumPy float array and the list of the vertex labels of its rows, in sorted order
 
     References:\n
     - [1] nx.circular_layout() function in NetworkX Graph Library. The NX-version uses numpy but
     here it is implemented from scratch as much as possible.
     '''
-    def eval(g: SimpleGraphObject):
-        return circular_layout(g)
+    def eval(g: SimpleGraphObject, cache: LayoutCache|None = None, as_numpy: bool = False):
+        if cache is None:
+            return circular_layout(g, as_numpy)
+        return cache.layout(g, "circular", _cached_parameters({}, as_numpy), lambda: circular_layout(g, as_numpy))
     
 class ShellLayout(BaseCallable):
-    def eval(g: SimpleGraphObject, shells: list[list[int]]):
+    '''
+    ShellLayout(g: SimpleGraphObject, shells: list[list[int]], cache: LayoutCache = None,
+        as_numpy: bool = False)
+    ---------------------------------------------------------------------------------
+    Calculate the coordinates of vertices of given graph arranged in concentric circles
+
+    Arguments: \n
+    - g: SimpleGraphObject\n
+    The graph whose point coordinates need to be calculated
+    - shells: list of lists of integers/strings\n
+    The vertices on each circle, from the innermost one outwards
+    - cache: LayoutCache or None (optional)\n
+    A cache to look the layout up in, and store it in when missing. Defaults to None
+    - as_numpy: bool (optional)\n
+    If True, return the layout as a pair of arrays instead of a dict. Defaults to False
+
+    Raises: \n
+    ValueError: When a shell contains a vertex not in the given graph
+
+    Returns:\n
+    A dict of GraphVertex-(x, y) tuple mappings denoting the position of each vertex,
+    or if as_numpy is True, a tuple (positions, labels) of an (n, 2) NumPy float array
+    and the list of the vertex labels of its rows, shell by shell
+    '''
+    def eval(g: SimpleGraphObject, shells: list[list[int]], cache: LayoutCache|None = None, as_numpy: bool = False):
         for shell in shells:
             for v in shell:
                 if GraphVertex(v) not in g.get_vertices():
                     raise ValueError(f"{v} is not present in the graph")
-                
-        return shell_layout(g, shells)
\ No newline at end of file
+
+        if cache is None:
+            return shell_layout(g, shells, as_numpy)
+        return cache.layout(g, "shell", _cached_parameters({"shells": shells}, as_numpy), lambda: shell_layout(g, shells, as_numpy))
+
+class SpectralLayout(BaseCallable):
+    '''
+    SpectralLayout(g: SimpleGraphObject, method: str = "auto", cache: LayoutCache = None,
+        as_numpy: bool = False)
+    ---------------------------------------------------------------------------------
+    Calculate the coordinates of vertices of given graph from the eigenvectors of its 
+    Laplacian matrix for the second and third smallest eigenvalues, scaled to fit in 
+    [-1, 1]. Vertices that are close in the graph get close coordinates, which makes 
+    this a cheap layout for large graphs, and a good set of initial_positions for 
+    FruchtermanReingoldLayout. Best used for connected graphs: the vertices of a small 
+    component may all end up on the same point
+
+    Arguments: \n
+    - g: SimpleGraphObject\n
+    The graph whose point coordinates need to be calculated
+    - method: string (optional)\n
+    Either of\n
+    1. "dense": all the eigenvectors of the dense Laplacian matrix, O(V^3) time\n
+    2. "sparse": only the three needed, by LOBPCG on the sparse Laplacian, 
+    O(E) time per iteration\n
+    3. "auto" (Default): "dense" for graphs with at most 1024 vertices, "sparse" otherwise
+    - cache: LayoutCache or None (optional)\n
+    A cache to look the layout up in, and store it in when missing. Defaults to None
+    - as_numpy: bool (optional)\n
+    If True, return the layout as a pair of arrays instead of a dict. Defaults to False
+
+    Raises: \n
+    ValueError: When the method is unknown, or the eigenvectors do not converge
+
+    Returns:\n
+    A dict of GraphVertex-(x, y) tuple mappings denoting the position of each vertex,
+    or if as_numpy is True, a tuple (positions, labels) of an (n, 2) NumPy float array
+    and the list of the vertex labels of its rows, in sorted order
+    '''
+    def eval(g: SimpleGraphObject, method: str = "auto", cache: LayoutCache|None = None, as_numpy: bool = False):
+        def compute():
+            return spectral_layout(g, method, as_numpy)
+
+        if cache is None:
+            return compute()
+        return cache.layout(g, "spectral", _cached_parameters({"method": method}, as_numpy), compute)
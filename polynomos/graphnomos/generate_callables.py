@@ -1,8 +1,15 @@
-from polynomos.graphnomos.callables import BaseCallable, GraphEdges, GraphNeighbours, SimpleGraphFromList
+import numpy as np
+
+from polynomos.graphnomos.adjacency import CSRAdjacencyStore
+from polynomos.graphnomos.callables import BaseCallable, SimpleGraphFromList
 from polynomos.graphnomos.graph import SimpleGraphObject
-from polynomos.graphnomos.callables import (
-    AddEdges, 
-    GraphVertices
+from polynomos.graphnomos.graph_operations import (
+    sorted_labels, coordinates, identity, kronecker, 
+    upper_edges, mycielskian_edges, complement_edges
+)
+from polynomos.graphnomos.random_graphs import (
+    gnp_edges, gnm_edges, barabasi_albert_edges, 
+    random_regular_edges, watts_strogatz_edges
 )
 
 __all__ = [
@@ -12,12 +19,21 @@ __all__ = [
     'LCFGraph',
     'Mycielskian',
     'DodecahedralGraph',
-    'PetersenGraph'
+    'PetersenGraph',
+    'RandomGraph',
+    'RandomGraphM',
+    'BarabasiAlbertGraph',
+    'RandomRegularGraph',
+    'WattsStrogatzGraph',
+    'CartesianProduct',
+    'TensorProduct',
+    'StrongProduct',
+    'GraphComplement'
 ]
 
 class CycleGraph(BaseCallable):
     '''
-    CycleGraph(n: int)
+    CycleGraph(n: int, backend: str = "dict")
     -----------------
     Generate a cycle graph of n vertices
 
@@ -26,20 +42,24 @@ class CycleGraph(BaseCallable):
     Arguments:
     - n: integer
         Number of vertices in the graph
+    - backend (optional): "dict" or "csr"
+        How the adjacency of the graph is stored, see SimpleGraph
 
     Returns:
     A SimpleGraphObject representing the graph C_n
     '''
-    def eval(n: int):
+    def eval(n: int, backend: str = "dict"):
         if n <= 2:
             raise ValueError("You cannot generate cycles of length <= 2")
         vertices = [i + 1 for i in range(n)]
-        edges = [sorted([i + 1, ((i + 1) % n) + 1]) for i in range(n)]
-        return SimpleGraphObject(vertices, edges)
+        src = np.arange(n, dtype=np.int64)
+        dst = src + 1
+        src[-1], dst[-1] = 0, n - 1
+        return SimpleGraphObject._from_id_arrays(vertices, src, dst, backend=backend)
     
 class CompleteBipartiteGraph(BaseCallable):
     '''
-    CompleteBipartiteGraph(m: int, n: int)
+    CompleteBipartiteGraph(m: int, n: int, backend: str = "dict")
     -------------------------------------
     Generate a complete bipartite graph K_{m, n}, where m, n are the lengths of 
     the two parties on either side
@@ -51,11 +71,13 @@ class CompleteBipartiteGraph(BaseCallable):
         Number of vertices on left-hand side
     - n: integer
         Number of vertices on right-hand side
+    - backend (optional): "dict" or "csr"
+        How the adjacency of the graph is stored, see SimpleGraph
 
     Returns:
     A SimpleGraphObject representing the graph K_{m, n}
     '''
-    def eval(m: int, n: int):
+    def eval(m: int, n: int, backend: str = "dict"):
         if m < 1 or n < 1:
             raise ValueError("Both parties should have at least 1 vertex")
         
@@ -63,17 +85,14 @@ class CompleteBipartiteGraph(BaseCallable):
         party_1 = vertices[:m]
         party_2 = vertices[m:m + n]
 
-        edges = []
+        src = np.repeat(np.arange(m, dtype=np.int64), n)
+        dst = np.tile(np.arange(m, m + n, dtype=np.int64), m)
 
-        for v1 in party_1:
-            for v2 in party_2:
-                edges.append(sorted([v1, v2]))
-
-        return SimpleGraphObject(vertices, edges, bipartite_parties = [party_1, party_2])
+        return SimpleGraphObject._from_id_arrays(vertices, src, dst, backend=backend, bipartite_parties = [party_1, party_2])
     
 class CompleteGraph(BaseCallable):
     '''
-    CompleteGraph(m: int)
+    CompleteGraph(m: int, backend: str = "dict")
     -------------------------------------
     Generate a complete graph K_m where all vertices are connected by an edge
 
@@ -82,27 +101,34 @@ class CompleteGraph(BaseCallable):
     Arguments:
     - m: integer
         Number of vertices in the graph
+    - backend (optional): "dict" or "csr"
+        How the adjacency of the graph is stored, see SimpleGraph. With "csr"
+        the adjacency arrays are written directly as one constant block, which
+        is much faster for large m
 
     Returns:
     A SimpleGraphObject representing the graph K_m
     '''
-    def eval(m: int):
+    def eval(m: int, backend: str = "dict"):
         if m < 2:
             raise ValueError("Complete graphs have at least 2 vertices")
         vertices = [i + 1 for i in range(m)]
 
-        edges = []
-
-        for i in range(1, m + 1):
-            for j in range(1, m + 1):
-                if i < j:
-                    edges.append([i, j])
-
-        return SimpleGraphObject(vertices, edges)
+        if backend == "csr":
+            # Row i holds 0, ..., i - 1, i + 1, ..., m - 1
+            columns = np.arange(m - 1, dtype=np.int64)
+            indices = (columns[None, :] + (columns[None, :] >= np.arange(m)[:, None])).ravel()
+            indptr = np.arange(m + 1, dtype=np.int64) * (m - 1)
+            weights = np.full(len(indices), np.nan)
+            store = CSRAdjacencyStore.from_arrays(indptr, indices, weights, m * (m - 1) // 2)
+            return SimpleGraphObject._from_store(vertices, store, backend)
+
+        src, dst = np.triu_indices(m, 1)
+        return SimpleGraphObject._from_id_arrays(vertices, src, dst, backend=backend)
     
 class LCFGraph(BaseCallable):
     '''
-    LCFGraph(n: int, shifts: list[int], repetitions: int)
+    LCFGraph(n: int, shifts: list[int], repetitions: int, backend: str = "dict")
     -------------------------------------
     Generate a graph using a given LCF notation.
 
@@ -123,28 +149,28 @@ class LCFGraph(BaseCallable):
         Shift for each vertex. Keep in mind, length of shift * repetitions = number of vertices
     - repetitions: integer\n
         How many times the given shift sequence is to be repeated
+    - backend (optional): "dict" or "csr"\n
+        How the adjacency of the graph is stored, see SimpleGraph
 
     Returns:
     A SimpleGraphObject representing the graph generated from the LCF notation
     '''
-    def eval(n: int, shifts: list[int], repetitions: int = 1):
+    def eval(n: int, shifts: list[int], repetitions: int = 1, backend: str = "dict"):
         if n != len(shifts) * repetitions:
             raise ValueError("Number of vertices should be equal to length of shifts * number of repetitions")
+        if n <= 2:
+            raise ValueError("You cannot generate cycles of length <= 2")
 
-        shifts = shifts * repetitions
-        g = CycleGraph(n)
-
-        additional_edges = []
-        vertices = list(g.get_vertices())
-
-        for i in range(n):
-            label = vertices[i].label
-            shifted_label = vertices[(i + shifts[i]) % n].label
-
-            additional_edges.append([label, shifted_label])
-        
-        AddEdges(g, additional_edges)
-        return g
+        vertices = [i + 1 for i in range(n)]
+        ids = np.arange(n, dtype=np.int64)
+        chords = (ids + np.tile(np.asarray(shifts, dtype=np.int64), repetitions)) % n
+
+        # Hamiltonian cycle followed by the chords, each chord appearing 
+        # once from either end
+        src = np.concatenate([ids, ids])
+        dst = np.concatenate([(ids + 1) % n, chords])
+        pairs = np.unique(np.minimum(src, dst) * n + np.maximum(src, dst))
+        return SimpleGraphObject._from_id_arrays(vertices, pairs // n, pairs % n, backend=backend)
     
 class DodecahedralGraph(BaseCallable):
     '''
@@ -188,7 +214,7 @@ class PetersenGraph(BaseCallable):
 
 class Mycielskian(BaseCallable):
     '''
-    Mycielskian(graph: SimpleGraphObject, u_label_prefix: str = None, v_label: str = None)
+    Mycielskian(graph: SimpleGraphObject, u_label_prefix: str = None, v_label: str = None, k: int = 1)
     -------------------------------------
     Generate the Mycielskian of a given graph.
 
@@ -196,6 +222,7 @@ class Mycielskian(BaseCallable):
     that preserves triangle-freedom, i.e. if the original graph
     doesn't have triangles, it's Mycielskian won't have triangles
     as well, and it will if the original graph has triangles.
+    Its chromatic number is one more than that of the original graph.
     Construction is fairly simple: 
         1) Take a new set of vertices, equal to the number of vertices 
         in the original graph + 1, label them u_1, u_2, ..., u_n, v, 
@@ -203,6 +230,10 @@ class Mycielskian(BaseCallable):
         2) Connect each u_i to all the neighbours of v_i
         3) Connect the v to all the u_i.
 
+    The construction is applied k times, each time as a block operation
+    on the edge arrays of the previous graph, so Mycielskian(CompleteGraph(2), k = k)
+    gives the triangle-free graph M_{k + 2} of chromatic number k + 2.
+
     Note: The original labels in the graph are lost and are renamed to
     1, 2, ..., n
 
@@ -210,50 +241,304 @@ class Mycielskian(BaseCallable):
     - graph: SimpleGraphObject
         The graph whose Mycielskian is to be generated
     - u_label_prefix: str or None (optional)
-        Prefix to be assigned to the new 'u' vertices. If None,
-        it just assigns numbers. Defaults to None.
+        Prefix to be assigned to the new 'u' vertices of the last
+        iteration. If None, it just assigns numbers. Defaults to None.
         E.g: If u_label_prefix = 'u', then the new vertices will
         be labeled 'u1', 'u2', etc.
     - v_label: str or None (optional)
-        Label to be assigned to the new 'v' vertex. If None,
-        it just assigns a number. Defaults to None.
+        Label to be assigned to the new 'v' vertex of the last
+        iteration. If None, it just assigns a number. Defaults to None.
         E.g: If v_label = 'v', then the new vertex will
         be labeled 'v'
+    - k: integer (optional)
+        Number of times the construction is applied. Defaults to 1.
+
+    Raises:
+    - ValueError if k is less than 1
 
     Returns:
-    A SimpleGraphObject representing the Mycielskian of the graph
+    A SimpleGraphObject representing the k-th iterated Mycielskian of the graph
     '''
-    def eval(graph: SimpleGraphObject, u_label_prefix: str|None = None, v_label: str|None = None):
-        vertices = GraphVertices(graph)
-        new_labels = sorted([graph._label_map[v.label] for v in vertices])
-
-        u_labels = [i for i in range(1, len(vertices) + 1)]
+    def eval(graph: SimpleGraphObject, u_label_prefix: str|None = None, v_label: str|None = None, k: int = 1):
+        if k < 1:
+            raise ValueError("The Mycielskian construction should be applied at least once")
+        n = graph.get_vertex_count()
+        src, dst = upper_edges(n, coordinates(graph))
+        for _ in range(k):
+            src, dst = mycielskian_edges(n, src, dst)
+            n = 2 * n + 1
+
+        # Vertices added by the last iteration are u_1, ..., u_m, v
+        m = (n - 1) // 2
+        labels = [i for i in range(1, n + 1)]
         if u_label_prefix is not None:
-            u_labels = [u_label_prefix + str(label) for label in u_labels]
-        else:
-            u_labels = [new_labels[-1] + label for label in u_labels]
-        
-        v = 2 * len(vertices) + 1
+            labels[m:2 * m] = [u_label_prefix + str(i) for i in range(1, m + 1)]
         if v_label is not None:
-            v = v_label
-
-        edges = [[edge.v1, edge.v2] for edge in GraphEdges(graph)]
-        for i in range(len(edges)):
-            edge = edges[i]
-            edge_label1 = graph._label_map[edge[0].label]
-            edge_label2 = graph._label_map[edge[1].label]
-            edges[i] = [edge_label1, edge_label2]
-
-        for label, u_label in zip(new_labels, u_labels):
-            neighbours = [graph._label_map[neighbour] for neighbour in GraphNeighbours(graph, label)]
-            for neighbour in neighbours:
-                edges.append(
-                    [u_label, neighbour]
-                )
-        
-        for u_label in u_labels:
-            edges.append(
-                [u_label, v]
-            )
+            labels[-1] = v_label
+
+        return SimpleGraphObject._from_id_arrays(labels, src, dst, backend=graph._backend)
+
+class RandomGraph(BaseCallable):
+    '''
+    RandomGraph(n: int, p: float, seed: int = None, backend: str = "dict")
+    -------------------------------------
+    Generate an Erdos-Renyi random graph G(n, p), where each of the
+    n(n - 1)/2 possible edges is present independently with probability p
+
+    Rather than flipping a coin for every pair of vertices, the gaps between
+    consecutive edges are drawn from the geometric distribution, so the time
+    taken grows with n + m instead of n^2 (Batagelj and Brandes, 2005)
+
+    Arguments:
+    - n: integer
+        Number of vertices in the graph
+    - p: float
+        Probability of each edge, between 0 and 1
+    - seed: integer or None (optional)
+        Seed of the random number generator, for reproducible graphs
+    - backend (optional): "dict" or "csr"
+        How the adjacency of the graph is stored, see SimpleGraph
+
+    Raises:
+    - ValueError if p is not between 0 and 1
+
+    Returns:
+    A SimpleGraphObject on the vertices 1, 2, ..., n
+    '''
+    def eval(n: int, p: float, seed: int|None = None, backend: str = "dict"):
+        if n < 1:
+            raise ValueError("Random graphs have at least 1 vertex")
+        if not 0 <= p <= 1:
+            raise ValueError("Edge probability should be between 0 and 1")
+        src, dst = gnp_edges(n, p, np.random.default_rng(seed))
+        return SimpleGraphObject._from_id_arrays([i + 1 for i in range(n)], src, dst, backend=backend)
+
+class RandomGraphM(BaseCallable):
+    '''
+    RandomGraphM(n: int, m: int, seed: int = None, backend: str = "dict")
+    -------------------------------------
+    Generate an Erdos-Renyi random graph G(n, m), chosen uniformly among all
+    graphs with n vertices and exactly m edges
+
+    Arguments:
+    - n: integer
+        Number of vertices in the graph
+    - m: integer
+        Number of edges in the graph, at most n(n - 1)/2
+    - seed: integer or None (optional)
+        Seed of the random number generator, for reproducible graphs
+    - backend (optional): "dict" or "csr"
+        How the adjacency of the graph is stored, see SimpleGraph
+
+    Raises:
+    - ValueError if m is negative or more than n(n - 1)/2
+
+    Returns:
+    A SimpleGraphObject on the vertices 1, 2, ..., n
+    '''
+    def eval(n: int, m: int, seed: int|None = None, backend: str = "dict"):
+        if n < 1:
+            raise ValueError("Random graphs have at least 1 vertex")
+        if not 0 <= m <= n * (n - 1) // 2:
+            raise ValueError(f"A simple graph on {n} vertices has between 0 and {n * (n - 1) // 2} edges")
+        src, dst = gnm_edges(n, m, np.random.default_rng(seed))
+        return SimpleGraphObject._from_id_arrays([i + 1 for i in range(n)], src, dst, backend=backend)
+
+class BarabasiAlbertGraph(BaseCallable):
+    '''
+    BarabasiAlbertGraph(n: int, k: int, seed: int = None, backend: str = "dict")
+    -------------------------------------
+    Generate a scale-free random graph with the Barabasi-Albert preferential
+    attachment model. Starting from a star on k + 1 vertices, each new vertex
+    is joined to k distinct existing vertices, chosen with probability
+    proportional to their degree
+
+    Arguments:
+    - n: integer
+        Number of vertices in the graph
+    - k: integer
+        Number of edges joining each new vertex to the graph, 1 <= k < n
+    - seed: integer or None (optional)
+        Seed of the random number generator, for reproducible graphs
+    - backend (optional): "dict" or "csr"
+        How the adjacency of the graph is stored, see SimpleGraph
+
+    Raises:
+    - ValueError if k is not between 1 and n - 1
+
+    Returns:
+    A SimpleGraphObject on the vertices 1, 2, ..., n with k(n - k) edges
+    '''
+    def eval(n: int, k: int, seed: int|None = None, backend: str = "dict"):
+        if not 1 <= k < n:
+            raise ValueError("Number of edges per new vertex should be between 1 and n - 1")
+        src, dst = barabasi_albert_edges(n, k, np.random.default_rng(seed))
+        return SimpleGraphObject._from_id_arrays([i + 1 for i in range(n)], src, dst, backend=backend)
+
+class RandomRegularGraph(BaseCallable):
+    '''
+    RandomRegularGraph(n: int, d: int, seed: int = None, backend: str = "dict")
+    -------------------------------------
+    Generate a random d-regular graph on n vertices. The vertex stubs are
+    paired up at random (the configuration model), and any loops or repeated
+    edges are then removed by random edge swaps that keep all degrees at d
+
+    Arguments:
+    - n: integer
+        Number of vertices in the graph
+    - d: integer
+        Degree of every vertex, 0 <= d < n
+    - seed: integer or None (optional)
+        Seed of the random number generator, for reproducible graphs
+    - backend (optional): "dict" or "csr"
+        How the adjacency of the graph is stored, see SimpleGraph
+
+    Raises:
+    - ValueError if d is not between 0 and n - 1, or if n * d is odd
+
+    Returns:
+    A SimpleGraphObject on the vertices 1, 2, ..., n
+    '''
+    def eval(n: int, d: int, seed: int|None = None, backend: str = "dict"):
+        if not 0 <= d < n:
+            raise ValueError("Degree should be between 0 and n - 1")
+        if n * d % 2 != 0:
+            raise ValueError("n * d should be even for a d-regular graph to exist")
+        src, dst = random_regular_edges(n, d, np.random.default_rng(seed))
+        return SimpleGraphObject._from_id_arrays([i + 1 for i in range(n)], src, dst, backend=backend)
+
+class WattsStrogatzGraph(BaseCallable):
+    '''
+    WattsStrogatzGraph(n: int, k: int, p: float, seed: int = None, backend: str = "dict")
+    -------------------------------------
+    Generate a small-world random graph with the Watts-Strogatz model. The 
+    vertices are arranged in a ring, each joined to its k nearest neighbours,
+    and then every edge is rewired to a random endpoint with probability p
 
-        return SimpleGraphObject(new_labels + u_labels + [v], edges)
\ No newline at end of file
+    Can be best visualized with CircularLayout
+
+    Arguments:
+    - n: integer
+        Number of vertices in the graph
+    - k: integer
+        Even number of ring neighbours of each vertex, 0 <= k < n
+    - p: float
+        Probability of rewiring each edge, between 0 and 1
+    - seed: integer or None (optional)
+        Seed of the random number generator, for reproducible graphs
+    - backend (optional): "dict" or "csr"
+        How the adjacency of the graph is stored, see SimpleGraph
+
+    Raises:
+    - ValueError if k is odd or not between 0 and n - 1, or p is not between 0 and 1
+
+    Returns:
+    A SimpleGraphObject on the vertices 1, 2, ..., n with nk/2 edges
+    '''
+    def eval(n: int, k: int, p: float, seed: int|None = None, backend: str = "dict"):
+        if not 0 <= k < n or k % 2 != 0:
+            raise ValueError("Number of ring neighbours should be even and between 0 and n - 1")
+        if not 0 <= p <= 1:
+            raise ValueError("Rewiring probability should be between 0 and 1")
+        src, dst = watts_strogatz_edges(n, k, p, np.random.default_rng(seed))
+        return SimpleGraphObject._from_id_arrays([i + 1 for i in range(n)], src, dst, backend=backend)
+
+def _product(g: SimpleGraphObject, h: SimpleGraphObject, cartesian: bool, tensor: bool):
+    n_g, n_h = g.get_vertex_count(), h.get_vertex_count()
+    a, b = coordinates(g), coordinates(h)
+    blocks = []
+    if cartesian:
+        blocks += [kronecker(a, n_g, identity(n_h), n_h), kronecker(identity(n_g), n_g, b, n_h)]
+    if tensor:
+        blocks.append(kronecker(a, n_g, b, n_h))
+    src, dst = upper_edges(n_g * n_h, *blocks)
+    labels = [(x, y) for x in sorted_labels(g) for y in sorted_labels(h)]
+    return SimpleGraphObject._from_id_arrays(labels, src, dst, backend=g._backend)
+
+class CartesianProduct(BaseCallable):
+    '''
+    CartesianProduct(g: SimpleGraphObject, h: SimpleGraphObject)
+    -------------------------------------
+    Generate the cartesian product of two graphs. Its vertices are the
+    pairs (x, y) of a vertex x of g and a vertex y of h, and (x1, y1) is 
+    adjacent to (x2, y2) if x1 = x2 and y1 ~ y2, or y1 = y2 and x1 ~ x2.
+    E.g. the product of two paths is a grid graph.
+
+    The adjacency matrix A (x) I + I (x) B is built from Kronecker products
+    of the sparse adjacency arrays of the graphs
+
+    Arguments:
+    - g: SimpleGraphObject
+        The first factor
+    - h: SimpleGraphObject
+        The second factor
+
+    Returns:
+    A SimpleGraphObject on the vertex pairs (x, y), without edge weights
+    '''
+    def eval(g: SimpleGraphObject, h: SimpleGraphObject):
+        return _product(g, h, cartesian=True, tensor=False)
+
+class TensorProduct(BaseCallable):
+    '''
+    TensorProduct(g: SimpleGraphObject, h: SimpleGraphObject)
+    -------------------------------------
+    Generate the tensor (categorical) product of two graphs. Its vertices 
+    are the pairs (x, y) of a vertex x of g and a vertex y of h, and 
+    (x1, y1) is adjacent to (x2, y2) if x1 ~ x2 and y1 ~ y2.
+
+    The adjacency matrix is the Kronecker product A (x) B of the sparse
+    adjacency arrays of the graphs
+
+    Arguments:
+    - g: SimpleGraphObject
+        The first factor
+    - h: SimpleGraphObject
+        The second factor
+
+    Returns:
+    A SimpleGraphObject on the vertex pairs (x, y), without edge weights
+    '''
+    def eval(g: SimpleGraphObject, h: SimpleGraphObject):
+        return _product(g, h, cartesian=False, tensor=True)
+
+class StrongProduct(BaseCallable):
+    '''
+    StrongProduct(g: SimpleGraphObject, h: SimpleGraphObject)
+    -------------------------------------
+    Generate the strong product of two graphs, the union of their
+    cartesian and tensor products. E.g. the strong product of two paths
+    is the king's graph of a chessboard.
+
+    Arguments:
+    - g: SimpleGraphObject
+        The first factor
+    - h: SimpleGraphObject
+        The second factor
+
+    Returns:
+    A SimpleGraphObject on the vertex pairs (x, y), without edge weights
+    '''
+    def eval(g: SimpleGraphObject, h: SimpleGraphObject):
+        return _product(g, h, cartesian=True, tensor=True)
+
+class GraphComplement(BaseCallable):
+    '''
+    GraphComplement(graph: SimpleGraphObject)
+    -------------------------------------
+    Generate the complement of a graph, which has the same vertices and
+    joins two distinct vertices exactly when they are not adjacent in the
+    graph. Loops of the graph are dropped.
+
+    Arguments:
+    - graph: SimpleGraphObject
+        The graph whose complement is to be generated
+
+    Returns:
+    A SimpleGraphObject with the same vertex labels
+    '''
+    def eval(graph: SimpleGraphObject):
+        n = graph.get_vertex_count()
+        rows, cols = upper_edges(n, coordinates(graph))
+        src, dst = complement_edges(n, rows, cols)
+        return SimpleGraphObject._from_id_arrays(sorted_labels(graph), src, dst, backend=graph._backend)
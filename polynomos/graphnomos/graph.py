@@ -1,6 +1,12 @@
+import warnings
+from collections import Counter
 from typing import List
 
+from polynomos.graphnomos.adjacency import AdjacencyStore, CSRAdjacencyStore
+
 class GraphVertex:
+    __slots__ = ('label',)
+
     def __init__(self, label) -> None:
         self.label = label
 
@@ -32,6 +38,8 @@ class GraphVertex:
         return str(self)
 
 class GraphEdge:
+    __slots__ = ('v1', 'v2', 'weight')
+
     def __init__(self, v1: GraphVertex, v2: GraphVertex, weight = None) -> None:
         self.v1 = v1
         self.v2 = v2
@@ -40,7 +48,10 @@ class GraphEdge:
     def __eq__(self, other):
         if not isinstance(other, GraphEdge):
             return False
-        return sorted([self.v1, self.v2]) == sorted([other.v1, other.v2])
+        return (
+            (self.v1 == other.v1 and self.v2 == other.v2) or 
+            (self.v1 == other.v2 and self.v2 == other.v1)
+        )
     
     def __ne__(self, other):
         return not self.__eq__(other)
@@ -52,25 +63,43 @@ class GraphEdge:
         return str(self)
     
     def __hash__(self) -> int:
-        return hash(tuple(sorted([self.v1, self.v2])))
+        # Order the end point hashes so that both orientations hash alike
+        h1, h2 = hash(self.v1), hash(self.v2)
+        if h1 > h2:
+            h1, h2 = h2, h1
+        return hash((h1, h2))
+
+_BACKENDS = {
+    "dict": AdjacencyStore,
+    "csr": CSRAdjacencyStore
+}
 
 class SimpleGraphObject:
-    def __init__(self, vertices: List, edges: List = None, **properties) -> None:
-        if all([isinstance(x, (int, str)) for x in vertices]):
-            self._vertices = set([GraphVertex(x) for x in vertices])
-        else:
-            self._vertices = set(vertices)
-        self._edges = set()
+    def __init__(self, vertices: List, edges: List = None, backend: str = "dict", **properties) -> None:
+        if backend not in _BACKENDS:
+            raise ValueError(f"Unknown graph backend {backend}, expected one of {list(_BACKENDS)}")
+        self._backend = backend
+        self._labels = []
+        self._ids = {}
+        self._store = _BACKENDS[backend]()
+        self._degrees = None
+        self._degree_hist = None
+        self._vertex_cache = None
+        self._edge_cache = None
+        self._label_maps = None
+        self._adj_matrix_cache = None
+
+        for vertex in vertices:
+            self._intern(vertex.label if isinstance(vertex, GraphVertex) else vertex)
+
         if edges is not None:
-            for edge in edges:
-                if len(edge) == 3:
-                    self._edges.add(GraphEdge(GraphVertex(edge[0]), GraphVertex(edge[1]), weight=edge[2]))
-                else:
-                    self._edges.add(GraphEdge(GraphVertex(edge[0]), GraphVertex(edge[1])))
+            edges = self._check_edges(edges)
+            self._store.add_edges_from(
+                [self._vertex_id(edge[0]) for edge in edges],
+                [self._vertex_id(edge[1]) for edge in edges],
+                [edge[2] if len(edge) == 3 else None for edge in edges]
+            )
 
-        
-        self._construct_label_map()
-        self._construct_adj_matrix()
         self._properties = properties
 
     def set_property(self, **properties):
@@ -79,59 +108,151 @@ class SimpleGraphObject:
     def get_property(self, property):
         return self._properties.get(property, None)
 
+    def _intern(self, label) -> int:
+        if label in self._ids:
+            return self._ids[label]
+
+        i = self._store.add_vertex()
+        self._ids[label] = i
+        self._labels.append(label)
+        if self._degrees is not None:
+            self._degrees.append(0)
+            self._degree_hist[0] += 1
+
+        if self._vertex_cache is not None:
+            self._vertex_cache.add(GraphVertex(label))
+        self._label_maps = None
+        self._adj_matrix_cache = None
+        return i
+
+    def _degree_state(self):
+        # Degrees are read from the store on first use, then kept up to
+        # date by every mutation
+        if self._degrees is None:
+            self._degrees = self._store.degrees()
+            self._degree_hist = Counter(self._degrees)
+        return self._degrees, self._degree_hist
+
+    def _shift_degree(self, i: int, delta: int):
+        if self._degrees is None:
+            return
+        degree = self._degrees[i]
+        self._degree_hist[degree] -= 1
+        if self._degree_hist[degree] == 0:
+            del self._degree_hist[degree]
+        self._degrees[i] = degree + delta
+        self._degree_hist[degree + delta] += 1
+
+    def _vertex_id(self, vertex: int|str|GraphVertex) -> int:
+        label = vertex.label if isinstance(vertex, GraphVertex) else vertex
+        if label not in self._ids:
+            raise ValueError(f"{label} not present in graph")
+        return self._ids[label]
+
+    def _make_edge(self, i: int, j: int, weight = None) -> GraphEdge:
+        if i > j:
+            i, j = j, i
+        return GraphEdge(GraphVertex(self._labels[i]), GraphVertex(self._labels[j]), weight=weight)
+
+    @staticmethod
+    def _check_edges(edges):
+        edges = list(edges)
+        for edge in edges:
+            if len(edge) not in (2, 3):
+                raise ValueError(f"{edge} is not a valid edge")
+        return edges
+
     def _construct_label_map(self):
-        self._label_map = {vertex.label: i + 1 for i, vertex in enumerate(sorted(list(self._vertices)))}
-        self._reverse_label_map = {i + 1: vertex.label for i, vertex in enumerate(sorted(list(self._vertices)))}
+        order = sorted(range(len(self._labels)), key=lambda i: self._labels[i])
+        self._label_maps = (
+            {self._labels[i]: k + 1 for k, i in enumerate(order)},
+            {k + 1: self._labels[i] for k, i in enumerate(order)},
+            order
+        )
+
+    @property
+    def _label_map(self):
+        if self._label_maps is None:
+            self._construct_label_map()
+        return self._label_maps[0]
+
+    @property
+    def _reverse_label_map(self):
+        if self._label_maps is None:
+            self._construct_label_map()
+        return self._label_maps[1]
+
+    def _sorted_ids(self):
+        if self._label_maps is None:
+            self._construct_label_map()
+        return self._label_maps[2]
 
     def __str__(self) -> str:
-        return f"{self.__class__.__name__}{tuple([str(edge) for edge in self._edges])}"
+        return f"{self.__class__.__name__}{tuple([str(edge) for edge in self.get_edges()])}"
     
+    def _positions(self):
+        position = [0] * len(self._labels)
+        for k, i in enumerate(self._sorted_ids()):
+            position[i] = k
+        return position
+
     def _construct_adj_matrix(self):
-        self._adj_matrix = [[0] * len(self._vertices) for _ in range(len(self._vertices))] 
-        for edge in self._edges:
-            i = self._label_map[edge.v1.label] - 1
-            j = self._label_map[edge.v2.label] - 1
-            
-            self._adj_matrix[i][j] = 1
-            self._adj_matrix[j][i] = 1
+        n = len(self._labels)
+        position = self._positions()
+
+        self._adj_matrix_cache = [[0] * n for _ in range(n)]
+        for i, j, _ in self._store.edges():
+            self._adj_matrix_cache[position[i]][position[j]] = 1
+            self._adj_matrix_cache[position[j]][position[i]] = 1
+
+    @property
+    def _adj_matrix(self):
+        if self._adj_matrix_cache is None:
+            self._construct_adj_matrix()
+        return self._adj_matrix_cache
             
     def __repr__(self) -> str:
         return str(self)
     
     @staticmethod
-    def _from_adjacency_matrix(adj_matrix, labels = None):
+    def _from_adjacency_matrix(adj_matrix, labels = None, backend = "dict"):
         if labels is None:
             labels = [i + 1 for i in range(len(adj_matrix))]
         
-        vertices = labels
-        edges = []
-
-        for i in range(len(adj_matrix)):
-            for j in range(len(adj_matrix[0])):
-                vertex_i = vertices[i]
-                vertex_j = vertices[j]
-
-                if adj_matrix[i][j] == 1 and sorted([vertex_i, vertex_j]) not in edges:
-                    edges.append(sorted([vertex_i, vertex_j]))
-
-        return SimpleGraphObject(vertices, edges)
+        edges = [
+            [labels[i], labels[j]] 
+            for i in range(len(adj_matrix)) 
+            for j in range(len(adj_matrix[i])) 
+            if adj_matrix[i][j] == 1
+        ]
+        return SimpleGraphObject(labels, edges, backend=backend)
     
     @staticmethod
-    def _from_adjacency_list(adj_list: dict):
-        vertices = [GraphVertex(i) for i in adj_list.keys()]
-        edges = []
-
-        for u in adj_list:
-            for v in adj_list[u]:
-                if sorted([u, v]) not in edges:
-                    edges.append(sorted([u, v]))
+    def _from_adjacency_list(adj_list: dict, backend = "dict"):
+        edges = [[u, v] for u in adj_list for v in adj_list[u]]
+        return SimpleGraphObject(list(adj_list.keys()), edges, backend=backend)
+    
+    @staticmethod
+    def _from_id_arrays(labels: List, src, dst, weights = None, backend: str = "dict", **properties):
+        # Build a graph straight from NumPy arrays of (min_id, max_id) edge 
+        # pairs without duplicates, where id i stands for labels[i], and 
+        # optionally their weights (NaN for unweighted edges)
+        if backend not in _BACKENDS:
+            raise ValueError(f"Unknown graph backend {backend}, expected one of {list(_BACKENDS)}")
+        store = _BACKENDS[backend].from_edges(len(labels), src, dst, weights)
+        return SimpleGraphObject._from_store(labels, store, backend, **properties)
 
-        return SimpleGraphObject(vertices, edges)
+    @staticmethod
+    def _from_store(labels: List, store, backend: str, **properties):
+        graph = SimpleGraphObject([], backend=backend, **properties)
+        graph._store = store
+        graph._labels = labels
+        graph._ids = {label: i for i, label in enumerate(labels)}
+        return graph
     
     def get_degree_sequence(self, do_sort=False):
-        degrees = []
-        for row in self._adj_matrix:
-            degrees.append(sum(row))
+        degrees, _ = self._degree_state()
+        degrees = [degrees[i] for i in self._sorted_ids()]
         
         if do_sort:
             degrees = sorted(degrees, reverse=True)
@@ -139,73 +260,131 @@ class SimpleGraphObject:
         return degrees
     
     def get_degree(self, vertex: int|str|GraphVertex):
-        if isinstance(vertex, str):
-            if vertex not in self._label_map:
-                raise ValueError(f"{vertex} not present in graph")
-            i = self._label_map[vertex] - 1
-            return sum(self._adj_matrix[i])
-        elif isinstance(vertex, int):
-            if GraphVertex(vertex) not in self._vertices:
-                raise ValueError(f"{vertex} not present in graph")
-            return sum(self._adj_matrix[vertex - 1])
-        else:
-            if vertex not in self._vertices:
-                raise ValueError(f"{vertex.label} not present in graph")
-            i = self._label_map[vertex.label] - 1
-            return sum(self._adj_matrix[i])
+        return self._degree_state()[0][self._vertex_id(vertex)]
+
+    def get_degree_map(self):
+        return dict(zip(self._labels, self._degree_state()[0]))
+
+    def get_degree_frequency(self):
+        return dict(self._degree_state()[1])
+
+    def get_neighbours(self, vertex: int|str|GraphVertex):
+        return set(self.iter_neighbours(vertex))
+
+    def iter_neighbours(self, vertex: int|str|GraphVertex):
+        labels = self._labels
+        return (labels[j] for j in self._store.neighbours(self._vertex_id(vertex)))
     
     def get_edges(self):
-        return self._edges
+        if self._edge_cache is None:
+            vertices = [GraphVertex(label) for label in self._labels]
+            self._edge_cache = set(GraphEdge(vertices[i], vertices[j], weight=weight) for i, j, weight in self._store.edges())
+        return self._edge_cache
+    
+    def get_edge_count(self):
+        return self._store.edge_count()
+    
+    def get_vertex_count(self):
+        return len(self._labels)
     
     def get_vertices(self):
-        return self._vertices
+        if self._vertex_cache is None:
+            self._vertex_cache = set(GraphVertex(label) for label in self._labels)
+        return self._vertex_cache
     
     def _get_adj_matrix(self, as_numpy = False):
         if as_numpy:
             import numpy as np
-            return np.array(self._adj_matrix)
+            if self._adj_matrix_cache is not None:
+                return np.array(self._adj_matrix_cache)
+            position = np.array(self._positions(), dtype=np.int64)
+            src, dst, _ = self._store.edge_arrays()
+            matrix = np.zeros((len(self._labels), len(self._labels)), dtype=int)
+            matrix[position[src], position[dst]] = 1
+            matrix[position[dst], position[src]] = 1
+            return matrix
         return self._adj_matrix
     
     def add_edge(self, edge: List):
-        if edge[0] > edge[1]:
-            edge[0], edge[1] = edge[1], edge[0]
-        edge_wt = None
-        if len(edge) == 3:
-            edge_wt = edge[2]
-        v1 = GraphVertex(edge[0])
-        v2 = GraphVertex(edge[1])
-
-        if v1 not in self._vertices:
-            self._vertices.add(v1)
-        if v2 not in self._vertices:
-            self._vertices.add(v2)
-
-        self._edges.add(GraphEdge(v1, v2, weight=edge_wt))
-        self._construct_label_map()
-        self._construct_adj_matrix()
+        self.add_edges([edge])
+
+    def add_edges(self, edges: List[List]):
+        added = False
+        for edge in self._check_edges(edges):
+            i = self._intern(edge[0])
+            j = self._intern(edge[1])
+            edge_wt = edge[2] if len(edge) == 3 else None
+
+            if self._store.add_edge(i, j, edge_wt):
+                self._shift_degree(i, 1)
+                if i != j:
+                    self._shift_degree(j, 1)
+                if self._edge_cache is not None:
+                    self._edge_cache.add(self._make_edge(i, j, edge_wt))
+                added = True
+
+        if added:
+            self._adj_matrix_cache = None
+
+    def _intern_array(self, labels):
+        # Ids of a NumPy array of labels, adding the labels not yet in the graph
+        import numpy as np
+        unique, inverse = np.unique(labels, return_inverse=True)
+        ids = np.array([self._intern(label) for label in unique.tolist()], dtype=np.int64)
+        return ids[inverse.ravel()]
+
+    def _add_edge_ids(self, src, dst, weights = None):
+        # Bulk insertion of edges given as NumPy arrays of vertex ids,
+        # with NaN weights for unweighted edges
+        self._store.add_edges_from(src, dst, weights)
+
+        self._degrees = None
+        self._degree_hist = None
+        self._edge_cache = None
+        self._adj_matrix_cache = None
+
+    def set_edge_weight(self, edge: List, weight):
+        self.set_edge_weights({(edge[0], edge[1]): weight})
+
+    def set_edge_weights(self, weight_dict: dict):
+        updates = []
+        for edge, weight in weight_dict.items():
+            i = self._ids.get(edge[0])
+            j = self._ids.get(edge[1])
+            if i is None or j is None or not self._store.has_edge(i, j):
+                raise ValueError(f"The given edge {edge} is not in the graph")
+            updates.append((i, j, weight))
+
+        for i, j, weight in updates:
+            self._store.set_weight(i, j, weight)
+            if self._edge_cache is not None:
+                self._edge_cache.discard(self._make_edge(i, j))
+                self._edge_cache.add(self._make_edge(i, j, weight))
 
     def remove_edge(self, edge: List, add_weight_mode=False):
-        if edge[0] > edge[1]:
-            edge[0], edge[1] = edge[1], edge[0]
-        
-        v1 = GraphVertex(edge[0])
-        v2 = GraphVertex(edge[1])
+        if add_weight_mode:
+            # The adjacency is updated in place, so there is nothing to defer
+            warnings.warn(
+                "add_weight_mode no longer has any effect and will be removed",
+                DeprecationWarning, stacklevel=2
+            )
+        i = self._vertex_id(edge[0])
+        j = self._vertex_id(edge[1])
 
-        if v1 not in self._vertices:
-            raise ValueError(f"{v1.label} not present in graph")
-        if v2 not in self._vertices:
-            raise ValueError(f"{v2.label} not present in graph")
+        if not self._store.has_edge(i, j):
+            raise ValueError(f"The given edge {edge} is not in the graph")
         
-        self._edges.remove(GraphEdge(v1, v2))
-        if add_weight_mode == False:
-            self._construct_label_map()
-            self._construct_adj_matrix()
+        self._store.remove_edge(i, j)
+        self._shift_degree(i, -1)
+        if i != j:
+            self._shift_degree(j, -1)
+        if self._edge_cache is not None:
+            self._edge_cache.discard(self._make_edge(i, j))
+        self._adj_matrix_cache = None
 
     def add_vertex(self, vertex: int | str):
-        v = GraphVertex(vertex)
-
-        if v not in self._vertices:
-            self._vertices.add(v)
+        self._intern(vertex)
 
-        self._construct_label_map()
-        self._construct_adj_matrix()
+    def add_vertices(self, vertices: List[int | str]):
+        for vertex in vertices:
+            self._intern(vertex)
@@ -0,0 +1,204 @@
+import io
+import json
+import mmap
+import struct
+import warnings
+import zipfile
+
+import numpy as np
+
+from polynomos.graphnomos.adjacency import CSRAdjacencyStore
+from polynomos.graphnomos.graph import SimpleGraphObject
+
+FORMATS = ("edgelist", "weighted_edgelist", "adjlist")
+
+def iter_chunks(path: str, chunk_size: int):
+    '''
+    Yield the contents of a text file in chunks of about `chunk_size` bytes,
+    each ending at a line break. The file is memory-mapped where possible.
+    '''
+    with open(path, 'rb') as f:
+        try:
+            data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (ValueError, OSError):
+            # Empty files and special files cannot be mapped
+            data = f.read()
+
+        start = 0
+        while start < len(data):
+            end = start + chunk_size
+            if end >= len(data):
+                end = len(data)
+            else:
+                # Extend the chunk to the end of the line it stops in
+                newline = data.find(b'\n', end)
+                end = len(data) if newline == -1 else newline + 1
+            yield data[start:end]
+            start = end
+
+        if isinstance(data, mmap.mmap):
+            data.close()
+
+def _parse_edge_lines(chunk: bytes, label_type, weighted: bool, comments: str, delimiter):
+    if label_type is int:
+        fields = [('u', np.int64), ('v', np.int64)] + ([('w', np.float64)] if weighted else [])
+        dtype, ndmin = np.dtype(fields), 1
+    else:
+        dtype, ndmin = str, 2
+
+    with warnings.catch_warnings():
+        # Chunks holding only comments or blank lines are not an error
+        warnings.simplefilter("ignore", UserWarning)
+        rows = np.loadtxt(io.BytesIO(chunk), dtype=dtype, comments=comments, delimiter=delimiter, ndmin=ndmin)
+
+    if label_type is int:
+        return rows['u'], rows['v'], rows['w'] if weighted else None
+    if rows.size == 0:
+        return rows.reshape(0), rows.reshape(0), None
+    if rows.shape[1] != 2 + weighted:
+        raise ValueError(f"Expected {2 + weighted} columns per line, found {rows.shape[1]}")
+    return rows[:, 0], rows[:, 1], rows[:, 2].astype(np.float64) if weighted else None
+
+def _parse_adjacency_lines(chunk: bytes, label_type, comments: str, delimiter):
+    src, dst, isolated = [], [], []
+    for line in chunk.decode().splitlines():
+        if comments is not None:
+            line = line.split(comments, 1)[0]
+        tokens = line.split(delimiter)
+        tokens = [token for token in (token.strip() for token in tokens) if token]
+        if not tokens:
+            continue
+        u = label_type(tokens[0])
+        if len(tokens) == 1:
+            isolated.append(u)
+        for token in tokens[1:]:
+            src.append(u)
+            dst.append(label_type(token))
+    return src, dst, isolated
+
+def read_graph(path: str, 
+    format: str = "edgelist", 
+    label_type = int, 
+    backend: str = "dict",
+    chunk_size: int = 1 << 26,
+    comments: str = "#",
+    delimiter: str = None
+):
+    if format not in FORMATS:
+        raise ValueError(f"Unknown graph file format {format}, expected one of {list(FORMATS)}")
+    if label_type not in (int, str):
+        raise ValueError("Vertex labels can only be read as int or str")
+
+    graph = SimpleGraphObject([], backend=backend)
+    dtype = np.int64 if label_type is int else str
+    src_ids, dst_ids, weights = [], [], []
+
+    for chunk in iter_chunks(path, chunk_size):
+        if format == "adjlist":
+            src, dst, isolated = _parse_adjacency_lines(chunk, label_type, comments, delimiter)
+            graph.add_vertices(isolated)
+            src, dst = np.array(src, dtype=dtype), np.array(dst, dtype=dtype)
+        else:
+            src, dst, chunk_weights = _parse_edge_lines(chunk, label_type, format == "weighted_edgelist", comments, delimiter)
+            if chunk_weights is not None:
+                weights.append(chunk_weights)
+
+        if len(src):
+            src_ids.append(graph._intern_array(src))
+            dst_ids.append(graph._intern_array(dst))
+
+    if src_ids:
+        graph._add_edge_ids(
+            np.concatenate(src_ids), 
+            np.concatenate(dst_ids), 
+            np.concatenate(weights) if weights else None
+        )
+    return graph
+
+def _label_array(labels: list):
+    if all(type(label) is int for label in labels):
+        return "int", np.array(labels, dtype=np.int64)
+    if all(type(label) is str for label in labels):
+        return "str", np.array(labels, dtype=str)
+    try:
+        return "json", np.array(json.dumps(labels))
+    except TypeError:
+        raise ValueError("Vertex labels can only be saved as ints, strs, floats or (nested) tuples of them") from None
+
+def _tuple_label(label):
+    # JSON turns tuples into lists, which cannot be labels as they are unhashable
+    if isinstance(label, list):
+        return tuple(_tuple_label(item) for item in label)
+    return label
+
+def save_graph(graph: SimpleGraphObject, path: str, compressed: bool = False):
+    indptr, indices, weights = graph._store.csr_arrays()
+    if weights.dtype == object:
+        raise ValueError("Only graphs with numeric edge weights can be saved")
+
+    label_kind, labels = _label_array(graph._labels)
+    meta = {
+        "version": 1,
+        "backend": graph._backend,
+        "labels": label_kind,
+        "edge_count": graph.get_edge_count(),
+        "properties": graph._properties
+    }
+
+    save = np.savez_compressed if compressed else np.savez
+    with open(path, 'wb') as f:
+        save(f, 
+            meta=np.array(json.dumps(meta)), labels=labels, 
+            indptr=indptr, indices=indices, weights=weights
+        )
+
+def _memmap_member(path: str, archive: zipfile.ZipFile, name: str):
+    # Members of uncompressed archives are stored as plain .npy files,
+    # so their data can be mapped straight from the archive
+    info = archive.getinfo(name + '.npy')
+    if info.compress_type != zipfile.ZIP_STORED:
+        raise ValueError("Compressed graph files cannot be memory-mapped")
+
+    with open(path, 'rb') as f:
+        f.seek(info.header_offset)
+        name_length, extra_length = struct.unpack('<HH', f.read(30)[26:30])
+        f.seek(info.header_offset + 30 + name_length + extra_length)
+        version = np.lib.format.read_magic(f)
+        if version == (1, 0):
+            shape, fortran_order, dtype = np.lib.format.read_array_header_1_0(f)
+        else:
+            shape, fortran_order, dtype = np.lib.format.read_array_header_2_0(f)
+        offset = f.tell()
+
+    if int(np.prod(shape)) == 0:
+        return np.zeros(shape, dtype=dtype)
+    return np.memmap(path, dtype=dtype, mode='c', offset=offset, shape=shape, order='F' if fortran_order else 'C')
+
+def load_graph(path: str, mmap: bool = False, backend: str = None):
+    with np.load(path, allow_pickle=False) as archive:
+        meta = json.loads(archive['meta'].item())
+        labels = archive['labels']
+        if mmap:
+            with zipfile.ZipFile(path) as members:
+                indptr, indices, weights = [_memmap_member(path, members, name) for name in ("indptr", "indices", "weights")]
+        else:
+            indptr, indices, weights = archive['indptr'], archive['indices'], archive['weights']
+
+    if backend is None:
+        backend = "csr" if mmap else meta["backend"]
+    if mmap and backend != "csr":
+        raise ValueError("Memory-mapped graphs can only use the csr backend")
+
+    if meta["labels"] == "json":
+        labels = [_tuple_label(label) for label in json.loads(labels.item())]
+    else:
+        labels = labels.tolist()
+    if backend == "csr":
+        store = CSRAdjacencyStore.from_arrays(indptr, indices, weights, meta["edge_count"])
+        return SimpleGraphObject._from_store(labels, store, backend, **meta["properties"])
+    
+    graph = SimpleGraphObject(labels, backend=backend, **meta["properties"])
+    rows = np.repeat(np.arange(len(indptr) - 1, dtype=np.int64), np.diff(indptr))
+    upper = rows <= indices
+    graph._add_edge_ids(rows[upper], indices[upper], weights[upper])
+    return graph
@@ -0,0 +1,78 @@
+import numpy as np
+
+from polynomos.graphnomos.graph import SimpleGraphObject
+
+# Graph operators on the sparse adjacency of a graph in coordinate form:
+# a pair of NumPy arrays (rows, cols) holding every edge in both directions
+# (loops once), over the positions 0, 1, ..., n - 1 of the vertices in the
+# sorted order of their labels
+
+def sorted_labels(graph: SimpleGraphObject) -> list:
+    return [graph._labels[i] for i in graph._sorted_ids()]
+
+def coordinates(graph: SimpleGraphObject):
+    indptr, indices, _ = graph._store.csr_arrays()
+    n = graph.get_vertex_count()
+    position = np.asarray(graph._positions(), dtype=np.int64)
+    rows = np.repeat(np.arange(n, dtype=np.int64), np.diff(indptr))
+    return position[rows], position[indices]
+
+def identity(n: int):
+    ids = np.arange(n, dtype=np.int64)
+    return ids, ids
+
+def kronecker(first, n_first: int, second, n_second: int):
+    '''
+    Coordinates of the Kronecker product of two adjacency matrices, whose
+    entry ((a, b), (c, d)) at position a * n_second + b is the product of
+    the entries (a, c) and (b, d)
+    '''
+    rows_1, cols_1 = first
+    rows_2, cols_2 = second
+    rows = (rows_1[:, None] * n_second + rows_2[None, :]).ravel()
+    cols = (cols_1[:, None] * n_second + cols_2[None, :]).ravel()
+    return rows, cols
+
+def upper_edges(n: int, *blocks):
+    '''
+    Merge blocks of symmetric coordinates into the (min_id, max_id) edge
+    pairs, without duplicates, of the graph over n vertices they form
+    '''
+    rows = np.concatenate([block[0] for block in blocks])
+    cols = np.concatenate([block[1] for block in blocks])
+    upper = rows <= cols
+    keys = np.unique(rows[upper] * n + cols[upper])
+    return keys // n, keys % n
+
+def mycielskian_edges(n: int, src, dst):
+    '''
+    Edges of the Mycielskian of a graph, with adjacency matrix
+        [[A,   A, 0],
+         [A,   0, 1],
+         [0, 1^T, 0]]
+    where vertex n + i is the copy u_i of vertex i and vertex 2n is v
+    '''
+    ids = np.arange(n, dtype=np.int64)
+    src, dst = (
+        np.concatenate([src, src, dst, n + ids]),
+        np.concatenate([dst, n + dst, n + src, np.full(n, 2 * n, dtype=np.int64)])
+    )
+    keys = np.unique(np.minimum(src, dst) * (2 * n + 1) + np.maximum(src, dst))
+    return keys // (2 * n + 1), keys % (2 * n + 1)
+
+def complement_edges(n: int, rows, cols):
+    '''
+    Edges (i, j), i < j, of the complement of the graph over n vertices with
+    the given symmetric coordinates. Each row is the id range (i, n) minus the
+    sorted neighbours of i, so no n x n matrix is built
+    '''
+    upper = rows < cols
+    keys = np.unique(rows[upper] * n + cols[upper])
+    rows, cols = keys // n, keys % n
+    indptr = np.searchsorted(rows, np.arange(n + 1, dtype=np.int64))
+    src, dst = [np.zeros(0, dtype=np.int64)], [np.zeros(0, dtype=np.int64)]
+    for i in range(n):
+        missing = np.setdiff1d(np.arange(i + 1, n, dtype=np.int64), cols[indptr[i]:indptr[i + 1]], assume_unique=True)
+        src.append(np.full(len(missing), i, dtype=np.int64))
+        dst.append(missing)
+    return np.concatenate(src), np.concatenate(dst)
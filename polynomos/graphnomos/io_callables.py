@@ -0,0 +1,114 @@
+from polynomos.base_callable import BaseCallable
+from polynomos.graphnomos.graph import SimpleGraphObject
+from polynomos.graphnomos.graph_io import load_graph, read_graph, save_graph
+
+__all__ = [
+    'LoadGraph',
+    'ReadGraph',
+    'SaveGraph'
+]
+
+class ReadGraph(BaseCallable):
+    '''
+    ReadGraph(path: str, format: str = "edgelist", label_type: type = int, backend: str = "dict")
+    ----------------------------------------------------------------------------------------------
+    Read a graph from a text file
+
+    The file is memory-mapped where possible and parsed in chunks straight 
+    into NumPy arrays, which are inserted into the graph in a single batch,
+    so large files are never held as Python lists of edges.
+
+    Arguments:
+    - path: string\n
+        Path of the file to be read
+    - format: string (optional)\n
+        Layout of the file. Can be either of\n
+        1. "edgelist" (Default): One edge per line, given as 2 vertex labels\n
+        2. "weighted_edgelist": One edge per line, given as 2 vertex labels
+        followed by the weight of the edge\n
+        3. "adjlist": One vertex per line, followed by the labels of (some of) 
+        its neighbours. A line with a single label adds an isolated vertex
+    - label_type: int or str (optional)\n
+        Type of the vertex labels. Defaults to int
+    - backend (optional): "dict" or "csr"\n
+        How the adjacency of the graph is stored, see SimpleGraph
+    - chunk_size: integer (optional)\n
+        Approximate number of bytes parsed at a time. Defaults to 64 MiB
+    - comments: string (optional)\n
+        Text after this marker on a line is ignored. Defaults to "#"
+    - delimiter: string or None (optional)\n
+        Separator between the values on a line. None (Default) means any whitespace
+
+    Raises:
+    - ValueError: If the format or label type is unknown, or if a line 
+        cannot be parsed
+
+    Returns:
+    A SimpleGraphObject holding the vertices and edges listed in the file
+    '''
+    def eval(path: str, format: str = "edgelist", label_type = int, backend: str = "dict", 
+            chunk_size: int = 1 << 26, comments: str = "#", delimiter: str = None):
+        return read_graph(
+            path, format=format, label_type=label_type, backend=backend, 
+            chunk_size=chunk_size, comments=comments, delimiter=delimiter
+        )
+
+class SaveGraph(BaseCallable):
+    '''
+    SaveGraph(graph: SimpleGraphObject, path: str, compressed: bool = False)
+    -------------------------------------------------------------------------
+    Save a graph to a binary NumPy .npz file, that can be opened again
+    with LoadGraph
+
+    The file holds the vertex labels, the adjacency of the graph as 
+    compressed-sparse-row arrays, the edge weights, the backend and the
+    graph properties (such as "bipartite_parties")
+
+    Arguments:
+    - graph: SimpleGraphObject\n
+        The graph to be saved
+    - path: string\n
+        Path of the file to be written. It is written as given, without
+        appending an extension
+    - compressed: boolean (optional)\n
+        Whether to compress the arrays. Compressed files are smaller but 
+        cannot be memory-mapped by LoadGraph. Defaults to False
+
+    Raises:
+    - ValueError: If the graph has non-numeric edge weights, or vertex labels
+    other than ints, strs, floats and tuples of them
+    - TypeError: If the graph properties cannot be written as JSON
+
+    Returns:
+    None. Only the file is written
+    '''
+    def eval(graph: SimpleGraphObject, path: str, compressed: bool = False):
+        save_graph(graph, path, compressed=compressed)
+
+class LoadGraph(BaseCallable):
+    '''
+    LoadGraph(path: str, mmap: bool = False, backend: str = None)
+    -------------------------------------------------------------
+    Load a graph saved with SaveGraph
+
+    Arguments:
+    - path: string\n
+        Path of the file to be read
+    - mmap: boolean (optional)\n
+        Whether to memory-map the adjacency arrays of an uncompressed file
+        instead of reading them. Only the vertex labels are read up front, 
+        edges are paged in from disk as they are used, and changes to the 
+        graph are never written back to the file. Defaults to False
+    - backend: "dict", "csr" or None (optional)\n
+        Backend of the loaded graph, see SimpleGraph. None (Default) means 
+        the backend the graph was saved with, or "csr" when memory-mapping
+
+    Raises:
+    - ValueError: If a compressed file is memory-mapped, or if a memory-mapped
+        graph is asked for a backend other than "csr"
+
+    Returns:
+    The SimpleGraphObject stored in the file
+    '''
+    def eval(path: str, mmap: bool = False, backend: str = None):
+        return load_graph(path, mmap=mmap, backend=backend)
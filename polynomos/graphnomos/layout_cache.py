@@ -0,0 +1,143 @@
+import hashlib
+import json
+import os
+import tempfile
+from collections import OrderedDict
+
+import numpy as np
+
+from polynomos.graphnomos.graph import GraphVertex, SimpleGraphObject
+from polynomos.graphnomos.graph_io import _label_array, _tuple_label
+
+def graph_fingerprint(graph: SimpleGraphObject) -> str:
+    '''
+    Hash of the structure of a graph: its vertex labels in insertion order
+    and its edges with their weights, in canonical order. Graphs built the
+    same way hash the same whatever their backend, and any edit to the
+    vertices, edges or weights changes the hash. O(V + E log E)
+    '''
+    src, dst, weights = graph._store.edge_arrays()
+    order = np.lexsort((dst, src))
+    digest = hashlib.blake2b(digest_size=20)
+    digest.update(repr(graph._labels).encode())
+    digest.update(np.ascontiguousarray(src[order], dtype=np.int64).tobytes())
+    digest.update(np.ascontiguousarray(dst[order], dtype=np.int64).tobytes())
+    weights = weights[order]
+    if weights.dtype == object:
+        digest.update(repr([None if weight != weight else weight for weight in weights.tolist()]).encode())
+    else:
+        digest.update(np.ascontiguousarray(weights, dtype=np.float64).tobytes())
+    return digest.hexdigest()
+
+class LayoutCache:
+    '''
+    Cache of computed layouts, keyed by the structural hash of the graph
+    together with the layout name and parameters.
+
+    The most recently used `maxsize` layouts are kept in memory, the least
+    recently used one being evicted first. If a `directory` is given, every
+    layout is also written there as a .npz file named after its key, and
+    memory misses are looked up on disk, so layouts outlive the process and
+    can be shared between processes. The files hold only arrays and JSON, and
+    are read without unpickling, so a shared directory cannot run code.
+    '''
+    def __init__(self, maxsize: int = 128, directory: str|None = None) -> None:
+        if maxsize < 0:
+            raise ValueError("maxsize should be a non-negative integer")
+        self.maxsize = maxsize
+        self.directory = directory
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        if directory is not None:
+            os.makedirs(directory, exist_ok=True)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def key(graph: SimpleGraphObject, layout: str, parameters: dict) -> str:
+        digest = hashlib.blake2b(digest_size=20)
+        digest.update(graph_fingerprint(graph).encode())
+        digest.update(layout.encode())
+        digest.update(repr(sorted(parameters.items())).encode())
+        return digest.hexdigest()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key + ".npz")
+
+    @staticmethod
+    def _write(f, value) -> None:
+        if isinstance(value, dict):
+            form, labels = "dict", [vertex.label for vertex in value]
+            positions = np.array(list(value.values()), dtype=np.float64).reshape(len(value), 2)
+        else:
+            form, (positions, labels) = "array", value
+        label_kind, label_array = _label_array(labels)
+        meta = {"form": form, "labels": label_kind}
+        np.savez(f, meta=np.array(json.dumps(meta)), positions=positions, labels=label_array)
+
+    @staticmethod
+    def _read(path: str):
+        with np.load(path, allow_pickle=False) as archive:
+            meta = json.loads(archive['meta'].item())
+            positions, labels = archive['positions'], archive['labels']
+        if meta["labels"] == "json":
+            labels = [_tuple_label(label) for label in json.loads(labels.item())]
+        else:
+            labels = labels.tolist()
+        if meta["form"] == "array":
+            return positions, labels
+        return {GraphVertex(label): (x, y) for label, (x, y) in zip(labels, positions.tolist())}
+
+    def get(self, key: str):
+        if key in self._entries:
+            self._entries.move_to_end(key)
+            return self._entries[key]
+        if self.directory is not None and os.path.exists(self._path(key)):
+            value = self._read(self._path(key))
+            self._remember(key, value)
+            return value
+        return None
+
+    def put(self, key: str, value) -> None:
+        self._remember(key, value)
+        if self.directory is not None:
+            # Write to a temporary file first, so readers never see a partial file
+            descriptor, temporary = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+            with os.fdopen(descriptor, "wb") as f:
+                self._write(f, value)
+            os.replace(temporary, self._path(key))
+
+    def _remember(self, key: str, value) -> None:
+        if self.maxsize == 0:
+            return
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def clear(self, disk: bool = False) -> None:
+        self._entries.clear()
+        if disk and self.directory is not None:
+            for name in os.listdir(self.directory):
+                if name.endswith(".npz"):
+                    os.remove(os.path.join(self.directory, name))
+
+    def layout(self, graph: SimpleGraphObject, layout: str, parameters: dict, compute):
+        '''
+        Return the cached layout of the graph, or compute it with `compute()`
+        and cache it. The layout is a dict or a (positions, labels) pair, and
+        a copy is returned, so callers may change it freely
+        '''
+        key = self.key(graph, layout, parameters)
+        value = self.get(key)
+        if value is None:
+            self.misses += 1
+            value = compute()
+            self.put(key, value)
+        else:
+            self.hits += 1
+        if isinstance(value, dict):
+            return dict(value)
+        return value[0].copy(), list(value[1])
@@ -0,0 +1,117 @@
+from polynomos.base_callable import BaseCallable
+from polynomos.graphnomos.graph import GraphVertex, SimpleGraphObject
+from polynomos.graphnomos.paths import (
+    dijkstra, dijkstra_all_pairs, floyd_warshall, weighted_adjacency
+)
+
+__all__ = [
+    'GraphDistanceMatrix',
+    'ShortestPath',
+    'ShortestPathLength'
+]
+
+class ShortestPath(BaseCallable):
+    '''
+    ShortestPath(graph: SimpleGraphObject, u: int|str|GraphVertex, v: int|str|GraphVertex)
+    --------------------------------------------------------------------------------------
+    Find a path of least total weight between two vertices using Dijkstra's
+    algorithm with a binary heap, in O((V + E) log V) time
+
+    Edges without a weight count as weight 1, so on unweighted graphs this
+    is a path with the fewest edges
+
+    Arguments:
+    - graph: SimpleGraphObject
+        A SimpleGraphObject representing the graph
+    - u: integer, string or a GraphVertex object
+        The start vertex
+    - v: integer, string or a GraphVertex object
+        The end vertex
+
+    Raises:
+    - ValueError: If either vertex is not present in the graph, or if
+        the graph has a negative edge weight
+
+    Returns:
+    A list of vertex labels from `u` to `v`, or an empty list if `v` cannot 
+    be reached from `u`
+    '''
+    def eval(graph: SimpleGraphObject, u: int|str|GraphVertex, v: int|str|GraphVertex):
+        source = graph._vertex_id(u)
+        target = graph._vertex_id(v)
+        _, parents = dijkstra(weighted_adjacency(graph), source, target)
+
+        if target != source and parents[target] == -1:
+            return []
+        
+        path = [target]
+        while path[-1] != source:
+            path.append(parents[path[-1]])
+        return [graph._labels[i] for i in reversed(path)]
+    
+class ShortestPathLength(BaseCallable):
+    '''
+    ShortestPathLength(graph: SimpleGraphObject, u: int|str|GraphVertex, v: int|str|GraphVertex)
+    --------------------------------------------------------------------------------------------
+    Find the least total weight of a path between two vertices using 
+    Dijkstra's algorithm. Edges without a weight count as weight 1
+
+    Arguments:
+    - graph: SimpleGraphObject
+        A SimpleGraphObject representing the graph
+    - u: integer, string or a GraphVertex object
+        The start vertex
+    - v: integer, string or a GraphVertex object
+        The end vertex
+
+    Raises:
+    - ValueError: If either vertex is not present in the graph, or if
+        the graph has a negative edge weight
+
+    Returns:
+    The total weight of a shortest path, or math.inf if `v` cannot be 
+    reached from `u`
+    '''
+    def eval(graph: SimpleGraphObject, u: int|str|GraphVertex, v: int|str|GraphVertex):
+        target = graph._vertex_id(v)
+        distances, _ = dijkstra(weighted_adjacency(graph), graph._vertex_id(u), target)
+        return distances[target]
+    
+class GraphDistanceMatrix(BaseCallable):
+    '''
+    GraphDistanceMatrix(graph: SimpleGraphObject, method: str = "auto")
+    -------------------------------------------------------------------
+    Find the weighted distances between all pairs of vertices. Edges 
+    without a weight count as weight 1
+
+    Arguments:
+    - graph: SimpleGraphObject
+        A SimpleGraphObject representing the graph
+    - method: string (optional)
+        Either of\n
+        1. "floyd_warshall": NumPy-vectorized Floyd-Warshall, O(V^3) time
+        and O(V^2) memory, best for dense graphs\n
+        2. "dijkstra": Dijkstra's algorithm from every vertex, 
+        O(V(V + E) log V) time, best for sparse graphs\n
+        3. "auto" (Default): Floyd-Warshall for graphs with at most 200 vertices 
+        or an edge density of at least 0.1, Dijkstra otherwise
+
+    Raises:
+    - ValueError: If the method is unknown, or if the graph has a negative 
+        edge weight
+
+    Returns:
+    An n x n NumPy float array, with rows and columns in the same vertex 
+    order as AdjacencyMatrix, holding math.inf for unreachable pairs
+    '''
+    def eval(graph: SimpleGraphObject, method: str = "auto"):
+        if method == "auto":
+            n = graph.get_vertex_count()
+            dense = n <= 200 or 2 * graph.get_edge_count() >= 0.1 * n * (n - 1)
+            method = "floyd_warshall" if dense else "dijkstra"
+
+        if method == "floyd_warshall":
+            return floyd_warshall(graph)
+        if method == "dijkstra":
+            return dijkstra_all_pairs(graph)
+        raise ValueError(f"Unknown method {method}, expected 'auto', 'floyd_warshall' or 'dijkstra'")
@@ -0,0 +1,73 @@
+import heapq
+import math
+
+import numpy as np
+
+from polynomos.graphnomos.graph import SimpleGraphObject
+
+def _check_weight(weight):
+    if weight is None:
+        return 1
+    if weight < 0:
+        raise ValueError("Shortest paths require non-negative edge weights")
+    return weight
+
+def weighted_adjacency(graph: SimpleGraphObject):
+    '''
+    Per vertex id lists of (neighbour id, weight) pairs, with unweighted
+    edges counted as weight 1
+    '''
+    return [
+        [(j, _check_weight(weight)) for j, weight in row]
+        for row in graph._store.weighted_neighbour_index()
+    ]
+
+def dijkstra(adjacency, source: int, target: int = None):
+    distances = [math.inf] * len(adjacency)
+    parents = [-1] * len(adjacency)
+    done = [False] * len(adjacency)
+    distances[source] = 0
+    heap = [(0, source)]
+
+    while heap:
+        d, u = heapq.heappop(heap)
+        if done[u]:
+            continue
+        done[u] = True
+        if u == target:
+            break
+        for v, weight in adjacency[u]:
+            nd = d + weight
+            if nd < distances[v]:
+                distances[v] = nd
+                parents[v] = u
+                heapq.heappush(heap, (nd, v))
+
+    return distances, parents
+
+def floyd_warshall(graph: SimpleGraphObject):
+    n = graph.get_vertex_count()
+    position = np.array(graph._positions(), dtype=np.int64)
+    src, dst, weights = graph._store.edge_arrays()
+    weights = np.where(np.isnan(weights.astype(np.float64)), 1.0, weights.astype(np.float64))
+    if (weights < 0).any():
+        raise ValueError("Shortest paths require non-negative edge weights")
+
+    distances = np.full((n, n), np.inf)
+    np.minimum.at(distances, (position[src], position[dst]), weights)
+    np.minimum.at(distances, (position[dst], position[src]), weights)
+    np.fill_diagonal(distances, 0)
+
+    for k in range(n):
+        np.minimum(distances, distances[:, k, None] + distances[None, k, :], out=distances)
+
+    return distances
+
+def dijkstra_all_pairs(graph: SimpleGraphObject):
+    adjacency = weighted_adjacency(graph)
+    position = graph._positions()
+    distances = np.empty((len(adjacency), len(adjacency)))
+    for source in range(len(adjacency)):
+        row, _ = dijkstra(adjacency, source)
+        distances[position[source], position] = row
+    return distances
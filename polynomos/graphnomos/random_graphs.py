@@ -0,0 +1,177 @@
+import numpy as np
+
+# Every sampler below returns the edges of a graph over the vertex ids
+# 0, 1, ..., n - 1 as two NumPy arrays of (min_id, max_id) pairs without
+# duplicates, ready for SimpleGraphObject._from_id_arrays
+
+def _pairs_from_index(index):
+    # Map the linear index k of the pair (i, j), j < i, in the row-major
+    # order of the strict lower triangle, k = i * (i - 1) / 2 + j, back to
+    # the pair. The float square root is off by at most one for huge k
+    index = np.asarray(index, dtype=np.int64)
+    rows = ((1 + np.sqrt(1 + 8 * index.astype(np.float64))) // 2).astype(np.int64)
+    rows -= rows * (rows - 1) // 2 > index
+    rows += (rows + 1) * rows // 2 <= index
+    return index - rows * (rows - 1) // 2, rows
+
+def _canonical(src, dst, n: int):
+    lo, hi = np.minimum(src, dst), np.maximum(src, dst)
+    keys = np.unique(lo * n + hi)
+    return keys // n, keys % n
+
+def gnp_edges(n: int, p: float, rng, batch_size: int = 1 << 20):
+    '''
+    Erdos-Renyi G(n, p) sampler of Batagelj and Brandes. Instead of flipping
+    a coin for each of the n(n - 1)/2 pairs, the gaps between consecutive
+    edges in the linear order of the pairs are drawn from the geometric
+    distribution, so the cost is O(n + m)
+    '''
+    total = n * (n - 1) // 2
+    if p <= 0 or total == 0:
+        return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64)
+    if p >= 1:
+        return _pairs_from_index(np.arange(total, dtype=np.int64))
+
+    batch_size = max(1024, min(batch_size, int(total * p * 1.1) + 1024))
+    chunks = []
+    position = -1
+    while position < total:
+        positions = position + np.cumsum(rng.geometric(p, size=batch_size))
+        chunks.append(positions[positions < total])
+        position = int(positions[-1])
+    return _pairs_from_index(np.concatenate(chunks))
+
+def gnm_edges(n: int, m: int, rng):
+    '''
+    Uniform sampler of graphs with n vertices and exactly m edges, drawing m
+    distinct pair indices out of n(n - 1)/2
+    '''
+    index = rng.choice(n * (n - 1) // 2, size=m, replace=False)
+    return _pairs_from_index(np.sort(index))
+
+def barabasi_albert_edges(n: int, k: int, rng):
+    '''
+    Preferential attachment: starting from a star on k + 1 vertices, every
+    new vertex is joined to k distinct earlier vertices chosen with
+    probability proportional to their degree. Picking a uniform entry of the
+    list of all edge endpoints so far is a degree-proportional choice
+    '''
+    m = k + (n - k - 1) * k
+    src = np.empty(m, dtype=np.int64)
+    dst = np.empty(m, dtype=np.int64)
+    src[:k] = 0
+    dst[:k] = np.arange(1, k + 1)
+
+    endpoints = [0] * k + list(range(1, k + 1))
+    uniforms = []
+    edge = k
+    for v in range(k + 1, n):
+        targets = set()
+        while len(targets) < k:
+            if not uniforms:
+                uniforms = rng.random(1 << 16).tolist()
+            targets.add(endpoints[int(uniforms.pop() * len(endpoints))])
+        for u in targets:
+            src[edge], dst[edge] = u, v
+            edge += 1
+        endpoints.extend(targets)
+        endpoints.extend([v] * k)
+    return src, dst
+
+def _repaired_pairing(n: int, d: int, rng):
+    # Pairs the shuffled stubs, then swaps each loop or repeated edge with a
+    # valid edge. Returns None if the swaps fail too often, as when no valid
+    # swap partner exists at all
+    stubs = np.repeat(np.arange(n, dtype=np.int64), d)
+    rng.shuffle(stubs)
+    lo = np.minimum(stubs[0::2], stubs[1::2])
+    hi = np.maximum(stubs[0::2], stubs[1::2])
+    m = len(lo)
+    if m == 0:
+        return lo, hi
+
+    _, first = np.unique(lo * n + hi, return_index=True)
+    valid = np.zeros(m, dtype=bool)
+    valid[first] = True
+    valid &= lo != hi
+
+    edges = list(zip(lo.tolist(), hi.tolist()))
+    keys = set(i * n + j for i, j in zip(lo[valid].tolist(), hi[valid].tolist()))
+    pending = np.flatnonzero(~valid).tolist()
+    valid = valid.tolist()
+    attempts = 10 * m + 100
+
+    while pending:
+        b = pending.pop()
+        u, v = edges[b]
+        while True:
+            attempts -= 1
+            if attempts < 0:
+                return None
+            r = int(rng.integers(m))
+            if not valid[r]:
+                continue
+            x, y = edges[r] if rng.random() < 0.5 else edges[r][::-1]
+            first_key = min(u, x) * n + max(u, x)
+            second_key = min(v, y) * n + max(v, y)
+            if u == x or v == y or first_key == second_key or first_key in keys or second_key in keys:
+                continue
+            keys.discard(min(x, y) * n + max(x, y))
+            keys.add(first_key)
+            keys.add(second_key)
+            edges[r] = (min(u, x), max(u, x))
+            edges[b] = (min(v, y), max(v, y))
+            valid[b] = True
+            break
+
+    keys = np.sort(np.fromiter(keys, dtype=np.int64, count=m))
+    return keys // n, keys % n
+
+def random_regular_edges(n: int, d: int, rng):
+    '''
+    Random d-regular graph from the configuration model: the n * d stubs are
+    shuffled and paired up, and each loop or repeated edge is then removed by
+    a random double edge swap with a valid edge, which keeps every degree.
+    If the swaps get stuck, the stubs are shuffled again from scratch
+    '''
+    if d == n - 1:
+        return _pairs_from_index(np.arange(n * (n - 1) // 2, dtype=np.int64))
+
+    while True:
+        edges = _repaired_pairing(n, d, rng)
+        if edges is not None:
+            return edges
+
+def watts_strogatz_edges(n: int, k: int, p: float, rng):
+    '''
+    Watts-Strogatz small world graph: a ring lattice joining each vertex to
+    its k nearest neighbours, whose edges (u, u + j) are each rewired with
+    probability p to (u, w) for a uniform random w, avoiding loops and
+    repeated edges
+    '''
+    src = np.repeat(np.arange(n, dtype=np.int64), k // 2)
+    dst = (src + np.tile(np.arange(1, k // 2 + 1, dtype=np.int64), n)) % n
+    rewire = np.flatnonzero(rng.random(len(src)) < p)
+    if len(rewire) == 0:
+        return _canonical(src, dst, n)
+
+    keys = set((np.minimum(src, dst) * n + np.maximum(src, dst)).tolist())
+    degrees = [k] * n
+    candidates = []
+    for e in rewire.tolist():
+        u, v = int(src[e]), int(dst[e])
+        if degrees[u] >= n - 1:
+            continue
+        while True:
+            if not candidates:
+                candidates = rng.integers(n, size=1 << 16).tolist()
+            w = candidates.pop()
+            if w != u and min(u, w) * n + max(u, w) not in keys:
+                break
+        keys.discard(min(u, v) * n + max(u, v))
+        keys.add(min(u, w) * n + max(u, w))
+        degrees[v] -= 1
+        degrees[w] += 1
+        dst[e] = w
+
+    return _canonical(src, dst, n)
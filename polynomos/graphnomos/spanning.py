@@ -0,0 +1,86 @@
+import numpy as np
+
+from polynomos.graphnomos.disjoint_set import DisjointSet
+from polynomos.graphnomos.graph import SimpleGraphObject
+
+# Both algorithms return the spanning forest as indices into the arrays of
+# graph._store.edge_arrays(), with unweighted edges counted as weight 1
+
+def edge_costs(graph: SimpleGraphObject):
+    src, dst, weights = graph._store.edge_arrays()
+    try:
+        weights = weights.astype(np.float64)
+    except (TypeError, ValueError):
+        raise ValueError("Spanning trees require numeric edge weights")
+    return src, dst, np.where(np.isnan(weights), 1.0, weights)
+
+def kruskal(graph: SimpleGraphObject):
+    '''
+    Kruskal's algorithm: scan the edges by increasing weight and keep those
+    joining two different trees of the forest so far, tracked with a
+    DisjointSet. O(E log E) for the sort, done by NumPy
+    '''
+    src, dst, costs = edge_costs(graph)
+    n = graph.get_vertex_count()
+    forest = DisjointSet(n)
+    chosen = []
+    order = np.argsort(costs, kind='stable')
+    for e, i, j in zip(order.tolist(), src[order].tolist(), dst[order].tolist()):
+        if forest.union(i, j):
+            chosen.append(e)
+            if forest.component_count == 1:
+                break
+    return chosen
+
+def prim(graph: SimpleGraphObject):
+    '''
+    Prim's algorithm for dense graphs: grow a tree from a root, always
+    adding the lightest edge leaving it. The lightest known edge to every
+    vertex outside the tree is kept in an array updated with one NumPy 
+    operation per step, for O(V^2) time and memory, which beats a heap once 
+    E is a sizeable fraction of V^2. A vertex out of reach starts a new tree
+    '''
+    src, dst, costs = edge_costs(graph)
+    n = graph.get_vertex_count()
+    matrix = np.full((n, n), np.inf)
+    edge = np.full((n, n), -1, dtype=np.int64)
+    ids = np.arange(len(src))
+    matrix[src, dst] = costs
+    matrix[dst, src] = costs
+    edge[src, dst] = ids
+    edge[dst, src] = ids
+
+    key = np.full(n, np.inf)
+    parent_edge = np.full(n, -1, dtype=np.int64)
+    outside = np.ones(n, dtype=bool)
+    chosen = []
+    for _ in range(n):
+        u = int(np.argmin(np.where(outside, key, np.inf)))
+        if not outside[u]:
+            # Every remaining key is infinite and argmin landed in the tree
+            u = int(np.flatnonzero(outside)[0])
+        outside[u] = False
+        if parent_edge[u] >= 0:
+            chosen.append(int(parent_edge[u]))
+        closer = outside & (matrix[u] < key)
+        key[closer] = matrix[u, closer]
+        parent_edge[closer] = edge[u, closer]
+    return chosen
+
+def spanning_forest(graph: SimpleGraphObject, method: str = "auto") -> SimpleGraphObject:
+    if method == "auto":
+        n = graph.get_vertex_count()
+        dense = 2 * graph.get_edge_count() >= 0.1 * n * (n - 1)
+        method = "prim" if dense and n <= 4096 else "kruskal"
+    if method == "kruskal":
+        chosen = kruskal(graph)
+    elif method == "prim":
+        chosen = prim(graph)
+    else:
+        raise ValueError(f"Unknown method {method}, expected 'auto', 'kruskal' or 'prim'")
+
+    src, dst, weights = graph._store.edge_arrays()
+    chosen = np.sort(np.asarray(chosen, dtype=np.int64))
+    return SimpleGraphObject._from_id_arrays(
+        list(graph._labels), src[chosen], dst[chosen], weights[chosen], backend=graph._backend
+    )
@@ -0,0 +1,40 @@
+from polynomos.base_callable import BaseCallable
+from polynomos.graphnomos.disjoint_set import DisjointSet
+from polynomos.graphnomos.graph import SimpleGraphObject
+from polynomos.graphnomos.spanning import spanning_forest
+
+__all__ = [
+    'DisjointSet',
+    'MinimumSpanningTree'
+]
+
+class MinimumSpanningTree(BaseCallable):
+    '''
+    MinimumSpanningTree(graph: SimpleGraphObject, method: str = "auto")
+    -------------------------------------------------------------------
+    Find a minimum spanning tree of a weighted graph, i.e. a tree joining
+    all of its vertices with the least total edge weight. Edges without a
+    weight count as weight 1. For a disconnected graph, a minimum spanning
+    tree of every connected component is found (a spanning forest)
+
+    Arguments:
+    - graph: SimpleGraphObject
+        A SimpleGraphObject representing the graph
+    - method: string (optional)
+        Either of\n
+        1. "kruskal": Kruskal's algorithm with a union-find structure,
+        O(E log E) time, best for sparse graphs\n
+        2. "prim": Prim's algorithm over a dense array of edge weights,
+        O(V^2) time and memory, best for dense graphs\n
+        3. "auto" (Default): Prim for graphs with at most 4096 vertices and
+        an edge density of at least 0.1, Kruskal otherwise
+
+    Raises:
+    - ValueError: If the method is unknown, or if an edge weight is not a number
+
+    Returns:
+    A new SimpleGraphObject with all the vertices of the graph and the edges
+    of the tree, keeping their weights
+    '''
+    def eval(graph: SimpleGraphObject, method: str = "auto"):
+        return spanning_forest(graph, method)
@@ -0,0 +1,232 @@
+import numpy as np
+
+from polynomos.graphnomos.graph import SimpleGraphObject
+from polynomos.graphnomos.graph_operations import coordinates
+from polynomos.graphnomos.traversal import component_ids
+
+# Matrices are indexed by the positions of the vertices in the sorted order
+# of their labels, as in SimpleGraphObject._get_adj_matrix. Edge weights are
+# ignored, and a loop adds 1 to the diagonal of the adjacency matrix
+
+DENSE_MAX_VERTICES = 1024
+
+def laplacian_matrix(graph: SimpleGraphObject):
+    # Loops cancel out of D - A, as they add the same amount to both
+    adjacency = graph._get_adj_matrix(as_numpy=True)
+    return np.diag(adjacency.sum(axis=1)) - adjacency
+
+class SparseOperator:
+    '''
+    Product of the adjacency or Laplacian matrix of a graph with a block of
+    vectors, from the sparse coordinates of the adjacency, O(E) per vector
+    '''
+    def __init__(self, graph: SimpleGraphObject, laplacian: bool = False) -> None:
+        self.n = graph.get_vertex_count()
+        self.rows, self.cols = coordinates(graph)
+        self.degrees = np.bincount(self.rows, minlength=self.n).astype(np.float64) if laplacian else None
+
+    def __call__(self, block):
+        product = np.empty_like(block)
+        for c in range(block.shape[1]):
+            product[:, c] = np.bincount(self.rows, weights=block[self.cols, c], minlength=self.n)
+        if self.degrees is not None:
+            product = self.degrees[:, None] * block - product
+        return product
+
+def _orthonormalize(block, basis):
+    # Gram-Schmidt twice against the basis, then a QR decomposition of the
+    # block, dropping the directions that are (numerically) in the basis
+    for _ in range(2):
+        block = block - basis @ (basis.T @ block)
+    vectors, triangle = np.linalg.qr(block)
+    return vectors[:, np.abs(np.diag(triangle)) > 1e-10 * max(1.0, np.abs(triangle).max())]
+
+def _orthonormalize_images(block, images, basis, basis_images):
+    # As _orthonormalize, also applying every step to the images of the block
+    # under the operator, so that they need not be computed again
+    for _ in range(2):
+        coefficients = basis.T @ block
+        block = block - basis @ coefficients
+        images = images - basis_images @ coefficients
+    _, values, rows = np.linalg.svd(block, full_matrices=False)
+    keep = values > 1e-8 * max(1.0, values[0])
+    transform = rows[keep].T / values[keep]
+    return block @ transform, images @ transform
+
+def block_lanczos(operator, n: int, k: int, largest: bool, seed: int = 0,
+    tolerance: float = 1e-6, max_restarts: int = 1000):
+    '''
+    The k largest or smallest eigenpairs of a symmetric matrix given by its
+    product with a block of vectors, by block Lanczos with thick restarts.
+    A block Krylov basis of k vectors per step is grown with full
+    reorthogonalization up to a fixed size, then the Rayleigh-Ritz pairs of
+    the basis are computed, and the basis restarts from the best Ritz
+    vectors, growing again from their residuals. A block of k vectors also
+    finds repeated eigenvalues. O(nk) memory is needed besides the operator
+    '''
+    rng = np.random.default_rng(seed)
+    size = min(n, max(4 * k, 40))
+    keep = min(size - k, 2 * k + 8)
+    # Column-major, so that the filled columns form a contiguous block
+    basis = np.empty((n, size), order='F')
+    images = np.empty((n, size), order='F')
+    filled = 0
+    block = rng.standard_normal((n, k))
+    for _ in range(max_restarts):
+        while filled < size:
+            block = _orthonormalize(block, basis[:, :filled])[:, :size - filled]
+            if block.shape[1] == 0:
+                # The basis spans an invariant subspace, so its Ritz pairs are exact
+                break
+            stop = filled + block.shape[1]
+            basis[:, filled:stop] = block
+            images[:, filled:stop] = operator(block)
+            block = images[:, filled:stop]
+            filled = stop
+
+        projected = basis[:, :filled].T @ images[:, :filled]
+        values, vectors = np.linalg.eigh((projected + projected.T) / 2)
+        order = np.argsort(-values if largest else values, kind='stable')[:keep]
+        values, vectors = values[order], vectors[:, order]
+        ritz = basis[:, :filled] @ vectors
+        images[:, :len(order)] = images[:, :filled] @ vectors
+        basis[:, :len(order)] = ritz
+        filled = len(order)
+        residuals = images[:, :filled] - ritz * values
+        scale = max(1.0, np.abs(values).max())
+        if block.shape[1] == 0 or np.linalg.norm(residuals[:, :k], axis=0).max() <= tolerance * scale:
+            return values[:k], ritz[:, :k]
+        # The residuals are orthogonal to the basis, and their k leading
+        # directions span the next block
+        block = np.linalg.svd(residuals, full_matrices=False)[0][:, :k]
+    raise ValueError(f"The eigenvalues did not converge in {max_restarts} restarts")
+
+def lobpcg(operator, n: int, k: int, preconditioner, project, dimension: int, seed: int = 0,
+    tolerance: float = 1e-6, max_iterations: int = 10000):
+    '''
+    The k smallest eigenpairs of a symmetric matrix given by its product with
+    a block of vectors, among the vectors left unchanged by `project`, a
+    projection onto a subspace of the given dimension that the matrix maps to
+    itself. Uses the locally optimal block preconditioned conjugate gradient
+    method (Knyazev): every iteration does a Rayleigh-Ritz step over the
+    current vectors, their preconditioned residuals and the previous search
+    directions. A good preconditioner makes up for clustered small
+    eigenvalues, where Lanczos needs many restarts
+    '''
+    rng = np.random.default_rng(seed)
+    size = min(dimension, k + max(k, 4))
+    vectors, _ = np.linalg.qr(project(rng.standard_normal((n, size))))
+    images = operator(vectors)
+    values, rotation = np.linalg.eigh(vectors.T @ images)
+    vectors, images = vectors @ rotation, images @ rotation
+    directions = direction_images = None
+    for _ in range(max_iterations):
+        residuals = images - vectors * values
+        if np.linalg.norm(residuals[:, :k], axis=0).max() <= tolerance * max(1.0, np.abs(values).max()):
+            return values[:k], vectors[:, :k]
+
+        block = project(preconditioner(residuals))
+        block_images = operator(block)
+        if directions is not None:
+            block = np.hstack([block, directions])
+            block_images = np.hstack([block_images, direction_images])
+        block, block_images = _orthonormalize_images(block, block_images, vectors, images)
+        if block.shape[1] == 0:
+            return values[:k], vectors[:, :k]
+
+        span = np.hstack([vectors, block])
+        span_images = np.hstack([images, block_images])
+        projected = span.T @ span_images
+        values, rotation = np.linalg.eigh((projected + projected.T) / 2)
+        values, rotation = values[:size], rotation[:, :size]
+        directions = block @ rotation[size:]
+        direction_images = block_images @ rotation[size:]
+        vectors, images = span @ rotation, span_images @ rotation
+    raise ValueError(f"The eigenvalues did not converge in {max_iterations} iterations")
+
+def choose_method(n: int, k: int, method: str) -> str:
+    if method == "auto":
+        return "dense" if n <= DENSE_MAX_VERTICES or 4 * k >= n else "sparse"
+    if method not in ("dense", "sparse"):
+        raise ValueError(f"Unknown method {method}, expected 'auto', 'dense' or 'sparse'")
+    return method
+
+def _fix_signs(vectors):
+    # Eigenvectors are only defined up to sign: make the entry of largest
+    # magnitude positive, so results do not depend on the method
+    rows = np.abs(vectors).argmax(axis=0)
+    signs = np.sign(vectors[rows, np.arange(vectors.shape[1])])
+    signs[signs == 0] = 1
+    return vectors * signs
+
+def adjacency_eigenvalues(graph: SimpleGraphObject, k: int|None = None, which: str = "largest",
+    method: str = "auto"):
+    '''
+    Eigenvalues of the adjacency matrix, all of them in decreasing order if
+    k is None, else the k largest in decreasing or the k smallest in
+    increasing order
+    '''
+    if which not in ("largest", "smallest"):
+        raise ValueError(f"Unknown which {which}, expected 'largest' or 'smallest'")
+    n = graph.get_vertex_count()
+    if k is None:
+        k = n
+    if k < 0:
+        raise ValueError("k should be a non-negative integer")
+    k = min(k, n)
+    if k == 0:
+        return np.zeros(0)
+
+    if choose_method(n, k, method) == "dense":
+        values = np.linalg.eigvalsh(graph._get_adj_matrix(as_numpy=True).astype(np.float64))
+        return values[::-1][:k] if which == "largest" else values[:k]
+    values, _ = block_lanczos(SparseOperator(graph), n, k, which == "largest")
+    return values
+
+def laplacian_eigenpairs(graph: SimpleGraphObject, k: int, method: str = "auto"):
+    '''
+    The k smallest eigenvalues of the Laplacian matrix in increasing order,
+    with their unit eigenvectors as the columns of an (n, k) array.
+
+    The sparse method knows the zero eigenvalues already: their eigenvectors
+    are the indicator vectors of the connected components. The rest are found
+    by LOBPCG among the vectors summing to zero over every component, with
+    the inverse degrees as a (Jacobi) preconditioner
+    '''
+    n = graph.get_vertex_count()
+    k = min(k, n)
+    if choose_method(n, k, method) == "dense":
+        values, vectors = np.linalg.eigh(laplacian_matrix(graph).astype(np.float64))
+        return np.maximum(values[:k], 0.0), _fix_signs(vectors[:, :k])
+
+    ids, count = component_ids(graph)
+    component = np.empty(n, dtype=np.int64)
+    component[graph._positions()] = ids
+    sizes = np.bincount(component, minlength=count).astype(np.float64)
+    zeros = min(k, count)
+    null = np.zeros((n, zeros))
+    first = component < zeros
+    null[first, component[first]] = 1 / np.sqrt(sizes[component[first]])
+    if k == zeros:
+        return np.zeros(k), null
+
+    def project(block):
+        # Subtract the mean over its component from every entry
+        projected = np.empty_like(block)
+        for c in range(block.shape[1]):
+            means = np.bincount(component, weights=block[:, c], minlength=count) / sizes
+            projected[:, c] = block[:, c] - means[component]
+        return projected
+
+    operator = SparseOperator(graph, laplacian=True)
+    degrees = np.maximum(operator.degrees, 1.0)[:, None]
+    values, vectors = lobpcg(operator, n, k - zeros, lambda block: block / degrees, project, n - count)
+    # The Laplacian is positive semidefinite, so anything negative is rounding
+    values = np.concatenate([np.zeros(zeros), np.maximum(values, 0.0)])
+    return values, np.hstack([null, _fix_signs(vectors)])
+
+def algebraic_connectivity(graph: SimpleGraphObject, method: str = "auto") -> float:
+    if graph.get_vertex_count() < 2:
+        return 0.0
+    values, _ = laplacian_eigenpairs(graph, 2, method)
+    return float(values[1])
@@ -0,0 +1,98 @@
+from polynomos.base_callable import BaseCallable
+from polynomos.graphnomos.graph import SimpleGraphObject
+from polynomos.graphnomos.spectral import adjacency_eigenvalues, algebraic_connectivity, laplacian_matrix
+
+__all__ = [
+    'AdjacencyEigenvalues',
+    'AlgebraicConnectivity',
+    'LaplacianMatrix'
+]
+
+class LaplacianMatrix(BaseCallable):
+    '''
+    LaplacianMatrix(graph: SimpleGraphObject, as_numpy: bool = False)
+    -----------------------------------------------------------------
+    Find the Laplacian matrix D - A of a graph, where D is the diagonal
+    matrix of vertex degrees and A the adjacency matrix, with rows and
+    columns in the same order as AdjacencyMatrix. Edge weights are ignored
+
+    Arguments:
+    - graph: SimpleGraphObject
+        A SimpleGraphObject representing the graph
+    - as_numpy: bool (optional)
+        If True, return a NumPy array instead of a list of lists. Defaults to False
+
+    Returns:
+    A list of lists of integers representing the Laplacian matrix of the graph
+    '''
+    def eval(graph: SimpleGraphObject, as_numpy: bool = False):
+        matrix = laplacian_matrix(graph)
+        return matrix if as_numpy else matrix.tolist()
+
+class AdjacencyEigenvalues(BaseCallable):
+    '''
+    AdjacencyEigenvalues(graph: SimpleGraphObject, k: int = None, which: str = "largest",
+        method: str = "auto")
+    -------------------------------------------------------------------------------------
+    Find the eigenvalues of the adjacency matrix of a graph, i.e. its
+    spectrum, or only the k largest or smallest of them. Edge weights are
+    ignored
+
+    Arguments:
+    - graph: SimpleGraphObject
+        A SimpleGraphObject representing the graph
+    - k: integer or None (optional)
+        Number of eigenvalues to find. Defaults to None, finding all of them
+    - which: string (optional)
+        Either "largest" (Default) or "smallest", the end of the spectrum
+        the k eigenvalues are taken from
+    - method: string (optional)
+        Either of\n
+        1. "dense": all the eigenvalues of the dense adjacency matrix with
+        NumPy, O(V^3) time and O(V^2) memory\n
+        2. "sparse": only the k needed, by block Lanczos on the sparse
+        adjacency, O(E) time per iteration and O(Vk) memory\n
+        3. "auto" (Default): "dense" for graphs with at most 1024 vertices or
+        when k is at least a quarter of them, "sparse" otherwise
+
+    Raises:
+    - ValueError: If k is negative, which or the method is unknown, or the
+    eigenvalues do not converge
+
+    Returns:
+    A list of the eigenvalues as floats, the largest first if which is
+    "largest", the smallest first otherwise
+    '''
+    def eval(graph: SimpleGraphObject, k: int|None = None, which: str = "largest", method: str = "auto"):
+        return adjacency_eigenvalues(graph, k, which, method).tolist()
+
+class AlgebraicConnectivity(BaseCallable):
+    '''
+    AlgebraicConnectivity(graph: SimpleGraphObject, method: str = "auto")
+    ---------------------------------------------------------------------
+    Find the algebraic connectivity of a graph, the second smallest
+    eigenvalue of its Laplacian matrix. It is positive if and only if the
+    graph is connected, and the larger it is, the harder the graph is to
+    cut into pieces. Edge weights are ignored
+
+    Arguments:
+    - graph: SimpleGraphObject
+        A SimpleGraphObject representing the graph
+    - method: string (optional)
+        Either of\n
+        1. "dense": all the eigenvalues of the dense Laplacian matrix with
+        NumPy, O(V^3) time and O(V^2) memory\n
+        2. "sparse": LOBPCG on the sparse Laplacian, preconditioned with
+        the vertex degrees, O(E) time per iteration\n
+        3. "auto" (Default): "dense" for graphs with at most 1024 vertices,
+        "sparse" otherwise
+
+    Raises:
+    - ValueError: If the method is unknown, or the eigenvalues do not converge
+
+    Returns:
+    The algebraic connectivity as a float, 0 for graphs with fewer than two
+    vertices
+    '''
+    def eval(graph: SimpleGraphObject, method: str = "auto"):
+        return algebraic_connectivity(graph, method)
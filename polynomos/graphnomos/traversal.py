@@ -0,0 +1,81 @@
+import math
+from collections import deque
+
+from polynomos.graphnomos.graph import SimpleGraphObject
+
+def bfs_ids(graph: SimpleGraphObject, source: int):
+    adjacency = graph._store.neighbour_index()
+    seen = [False] * graph.get_vertex_count()
+    seen[source] = True
+    queue = deque([source])
+
+    while queue:
+        u = queue.popleft()
+        yield u
+        for v in adjacency[u]:
+            if not seen[v]:
+                seen[v] = True
+                queue.append(v)
+
+def dfs_ids(graph: SimpleGraphObject, source: int):
+    adjacency = graph._store.neighbour_index()
+    seen = [False] * graph.get_vertex_count()
+    seen[source] = True
+    # Keeping the neighbour iterator of every open vertex on the stack
+    # visits vertices in the same order as the recursive algorithm
+    stack = [iter(adjacency[source])]
+    yield source
+
+    while stack:
+        for v in stack[-1]:
+            if not seen[v]:
+                seen[v] = True
+                yield v
+                stack.append(iter(adjacency[v]))
+                break
+        else:
+            stack.pop()
+
+def bfs_distances(graph: SimpleGraphObject, source: int, adjacency = None):
+    if adjacency is None:
+        adjacency = graph._store.neighbour_index()
+    distances = [-1] * graph.get_vertex_count()
+    distances[source] = 0
+    queue = deque([source])
+
+    while queue:
+        u = queue.popleft()
+        d = distances[u] + 1
+        for v in adjacency[u]:
+            if distances[v] == -1:
+                distances[v] = d
+                queue.append(v)
+
+    return distances
+
+def component_ids(graph: SimpleGraphObject):
+    adjacency = graph._store.neighbour_index()
+    component = [-1] * graph.get_vertex_count()
+    count = 0
+
+    for source in range(len(component)):
+        if component[source] != -1:
+            continue
+        component[source] = count
+        stack = [source]
+        while stack:
+            u = stack.pop()
+            for v in adjacency[u]:
+                if component[v] == -1:
+                    component[v] = count
+                    stack.append(v)
+        count += 1
+
+    return component, count
+
+def eccentricities(graph: SimpleGraphObject):
+    if component_ids(graph)[1] > 1:
+        return [math.inf] * graph.get_vertex_count()
+
+    adjacency = graph._store.neighbour_index()
+    return [max(bfs_distances(graph, source, adjacency)) for source in range(graph.get_vertex_count())]
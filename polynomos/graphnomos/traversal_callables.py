@@ -0,0 +1,202 @@
+import math
+
+from polynomos.base_callable import BaseCallable
+from polynomos.graphnomos.graph import GraphVertex, SimpleGraphObject
+from polynomos.graphnomos.traversal import (
+    bfs_distances, bfs_ids, component_ids, dfs_ids, eccentricities
+)
+
+__all__ = [
+    'BreadthFirstSearch',
+    'ConnectedComponents',
+    'ConnectedQ',
+    'DepthFirstSearch',
+    'Eccentricity',
+    'GraphDiameter',
+    'GraphDistance',
+    'GraphRadius'
+]
+
+class BreadthFirstSearch(BaseCallable):
+    '''
+    BreadthFirstSearch(graph: SimpleGraphObject, source: int|str|GraphVertex)
+    -------------------------------------------------------------------------
+    Traverse a graph breadth-first, starting from a given vertex
+
+    The traversal is iterative and takes O(V + E) time, so it can be used 
+    on very large graphs without hitting the recursion limit
+
+    Arguments:
+    - graph: SimpleGraphObject
+        A SimpleGraphObject representing the graph
+    - source: integer, string or a GraphVertex object
+        The vertex to start the traversal from
+
+    Raises:
+    - ValueError: If the source vertex is not present in the graph
+
+    Returns:
+    A generator yielding the labels of the vertices reachable from `source`,
+    in breadth-first order
+    '''
+    def eval(graph: SimpleGraphObject, source: int|str|GraphVertex):
+        labels = graph._labels
+        return (labels[i] for i in bfs_ids(graph, graph._vertex_id(source)))
+    
+class DepthFirstSearch(BaseCallable):
+    '''
+    DepthFirstSearch(graph: SimpleGraphObject, source: int|str|GraphVertex)
+    -----------------------------------------------------------------------
+    Traverse a graph depth-first, starting from a given vertex
+
+    The traversal keeps an explicit stack instead of recursing, so it can
+    be used on very large graphs without hitting the recursion limit
+
+    Arguments:
+    - graph: SimpleGraphObject
+        A SimpleGraphObject representing the graph
+    - source: integer, string or a GraphVertex object
+        The vertex to start the traversal from
+
+    Raises:
+    - ValueError: If the source vertex is not present in the graph
+
+    Returns:
+    A generator yielding the labels of the vertices reachable from `source`,
+    in depth-first (pre-)order
+    '''
+    def eval(graph: SimpleGraphObject, source: int|str|GraphVertex):
+        labels = graph._labels
+        return (labels[i] for i in dfs_ids(graph, graph._vertex_id(source)))
+
+class ConnectedComponents(BaseCallable):
+    '''
+    ConnectedComponents(graph: SimpleGraphObject)
+    ---------------------------------------------
+    Find the connected components of a graph in O(V + E) time
+
+    Arguments:
+    - graph: SimpleGraphObject
+        A SimpleGraphObject representing the graph
+
+    Returns:
+    A list of sets of vertex labels, one set per connected component
+    '''
+    def eval(graph: SimpleGraphObject):
+        component, count = component_ids(graph)
+        components = [set() for _ in range(count)]
+        for label, c in zip(graph._labels, component):
+            components[c].add(label)
+        return components
+    
+class ConnectedQ(BaseCallable):
+    '''
+    ConnectedQ(graph: SimpleGraphObject)
+    ------------------------------------
+    Determine whether a graph is connected, i.e. whether there is a path 
+    between every pair of vertices
+
+    Arguments:
+    - graph: SimpleGraphObject
+        A SimpleGraphObject representing the graph
+
+    Returns:
+    True if the graph is connected, False otherwise. A graph without 
+    vertices is considered connected
+    '''
+    def eval(graph: SimpleGraphObject):
+        return component_ids(graph)[1] <= 1
+
+class GraphDistance(BaseCallable):
+    '''
+    GraphDistance(graph: SimpleGraphObject, u: int|str|GraphVertex, v: int|str|GraphVertex)
+    ---------------------------------------------------------------------------------------
+    Find the number of edges on a shortest path between two vertices
+
+    Arguments:
+    - graph: SimpleGraphObject
+        A SimpleGraphObject representing the graph
+    - u: integer, string or a GraphVertex object
+        The start vertex
+    - v: integer, string or a GraphVertex object
+        The end vertex
+
+    Raises:
+    - ValueError: If either vertex is not present in the graph
+
+    Returns:
+    The distance between `u` and `v` as an integer, or math.inf if `v`
+    cannot be reached from `u`
+    '''
+    def eval(graph: SimpleGraphObject, u: int|str|GraphVertex, v: int|str|GraphVertex):
+        target = graph._vertex_id(v)
+        distance = bfs_distances(graph, graph._vertex_id(u))[target]
+        return math.inf if distance == -1 else distance
+    
+class Eccentricity(BaseCallable):
+    '''
+    Eccentricity(graph: SimpleGraphObject, vertex: int|str|GraphVertex)
+    -------------------------------------------------------------------
+    Find the eccentricity of a vertex, i.e. the largest distance between 
+    the vertex and any other vertex of the graph
+
+    Arguments:
+    - graph: SimpleGraphObject
+        A SimpleGraphObject representing the graph
+    - vertex: integer, string or a GraphVertex object
+        The vertex whose eccentricity is to be found
+
+    Raises:
+    - ValueError: If the vertex is not present in the graph
+
+    Returns:
+    The eccentricity as an integer, or math.inf if some vertex cannot be
+    reached from the given vertex
+    '''
+    def eval(graph: SimpleGraphObject, vertex: int|str|GraphVertex):
+        distances = bfs_distances(graph, graph._vertex_id(vertex))
+        return math.inf if -1 in distances else max(distances)
+    
+class GraphDiameter(BaseCallable):
+    '''
+    GraphDiameter(graph: SimpleGraphObject)
+    ---------------------------------------
+    Find the diameter of a graph, i.e. the largest eccentricity of any
+    of its vertices. Takes O(V(V + E)) time
+
+    Arguments:
+    - graph: SimpleGraphObject
+        A SimpleGraphObject representing the graph
+
+    Raises:
+    - ValueError: If the graph has no vertices
+
+    Returns:
+    The diameter as an integer, or math.inf if the graph is disconnected
+    '''
+    def eval(graph: SimpleGraphObject):
+        if graph.get_vertex_count() == 0:
+            raise ValueError("The graph has no vertices")
+        return max(eccentricities(graph))
+    
+class GraphRadius(BaseCallable):
+    '''
+    GraphRadius(graph: SimpleGraphObject)
+    -------------------------------------
+    Find the radius of a graph, i.e. the smallest eccentricity of any
+    of its vertices. Takes O(V(V + E)) time
+
+    Arguments:
+    - graph: SimpleGraphObject
+        A SimpleGraphObject representing the graph
+
+    Raises:
+    - ValueError: If the graph has no vertices
+
+    Returns:
+    The radius as an integer, or math.inf if the graph is disconnected
+    '''
+    def eval(graph: SimpleGraphObject):
+        if graph.get_vertex_count() == 0:
+            raise ValueError("The graph has no vertices")
+        return min(eccentricities(graph))
@@ -0,0 +1,112 @@
+from polynomos.base_callable import BaseCallable
+from polynomos.graphnomos.graph import GraphVertex, SimpleGraphObject
+from polynomos.graphnomos.triangles import simple_degrees, triangle_count, vertex_triangles
+
+__all__ = [
+    'GlobalClusteringCoefficient',
+    'LocalClusteringCoefficient',
+    'TriangleCount',
+    'TriangleFreeQ'
+]
+
+class TriangleCount(BaseCallable):
+    '''
+    TriangleCount(graph: SimpleGraphObject, method: str = "auto")
+    -------------------------------------------------------------
+    Count the triangles of a graph, i.e. the sets of three pairwise
+    adjacent vertices. Loops are ignored
+
+    Arguments:
+    - graph: SimpleGraphObject
+        A SimpleGraphObject representing the graph
+    - method: string (optional)
+        Either of\n
+        1. "intersection": node iterator with degree ordering, intersecting
+        the sorted adjacency of low-degree vertices, O(E^1.5) time, best for
+        sparse graphs\n
+        2. "matrix": trace of A^3 with NumPy matrix products, O(V^3) time
+        and O(V^2) memory, best for dense graphs\n
+        3. "auto" (Default): "matrix" for graphs with at most 4096 vertices
+        and an edge density of at least 0.1, "intersection" otherwise
+
+    Raises:
+    - ValueError: If the method is unknown
+
+    Returns:
+    The number of triangles as an integer
+    '''
+    def eval(graph: SimpleGraphObject, method: str = "auto"):
+        return triangle_count(graph, method)
+
+class TriangleFreeQ(BaseCallable):
+    '''
+    TriangleFreeQ(graph: SimpleGraphObject)
+    ---------------------------------------
+    Check if a graph has no triangles
+
+    Arguments:
+    - graph: SimpleGraphObject
+        A SimpleGraphObject representing the graph
+
+    Returns:
+    True if the graph has no three pairwise adjacent vertices, False otherwise
+    '''
+    def eval(graph: SimpleGraphObject):
+        return triangle_count(graph) == 0
+
+class LocalClusteringCoefficient(BaseCallable):
+    '''
+    LocalClusteringCoefficient(graph: SimpleGraphObject, vertex: int|str|GraphVertex = None)
+    ----------------------------------------------------------------------------------------
+    Find the local clustering coefficient of a vertex, the fraction of pairs
+    of its neighbours that are adjacent, 2T(v) / (deg(v)(deg(v) - 1)) where
+    T(v) is the number of triangles through v. Vertices with fewer than two
+    neighbours have a coefficient of 0
+
+    Arguments:
+    - graph: SimpleGraphObject
+        A SimpleGraphObject representing the graph
+    - vertex: integer, string, GraphVertex object or None (optional)
+        The vertex whose coefficient is to be found. If None, the
+        coefficients of all vertices are found
+
+    Raises:
+    - ValueError: If the vertex is not present in the graph
+
+    Returns:
+    The coefficient as a float, or a dictionary mapping every vertex label
+    to its coefficient if no vertex is given
+    '''
+    def eval(graph: SimpleGraphObject, vertex: int|str|GraphVertex = None):
+        if vertex is not None:
+            i = graph._vertex_id(vertex)
+        triangles = vertex_triangles(graph)
+        degrees = simple_degrees(graph)
+        pairs = degrees * (degrees - 1) / 2
+        coefficients = [t / p if p > 0 else 0.0 for t, p in zip(triangles.tolist(), pairs.tolist())]
+
+        if vertex is not None:
+            return coefficients[i]
+        return {graph._labels[i]: coefficients[i] for i in graph._sorted_ids()}
+
+class GlobalClusteringCoefficient(BaseCallable):
+    '''
+    GlobalClusteringCoefficient(graph: SimpleGraphObject)
+    -----------------------------------------------------
+    Find the global clustering coefficient (transitivity) of a graph, the
+    fraction of paths of length two that are closed into a triangle, i.e.
+    3 x (number of triangles) / (number of connected triples)
+
+    Arguments:
+    - graph: SimpleGraphObject
+        A SimpleGraphObject representing the graph
+
+    Returns:
+    The coefficient as a float, 0 if the graph has no path of length two
+    '''
+    def eval(graph: SimpleGraphObject):
+        degrees = simple_degrees(graph)
+        triples = int((degrees * (degrees - 1) // 2).sum())
+        if triples == 0:
+            return 0.0
+        return 3 * triangle_count(graph) / triples
@@ -0,0 +1,347 @@
+import math
+import unittest
+
+import sys
+
+sys.path.insert(0, "../../kc-polynomos")
+sys.path.insert(0, "../kc-polynomos")
+
+from polynomos.graphnomos.all import *
+from polynomos.graphnomos.graph import GraphEdge, GraphVertex
+
+class TestTraversal(unittest.TestCase):
+    def test_search(self):
+        g1 = SimpleGraph(vertices = [1, 2, 3, 4, 5, 6], edges = [
+            [1, 2],
+            [1, 3],
+            [2, 4],
+            [3, 4],
+            [4, 5]
+        ])
+        bfs = list(BreadthFirstSearch(g1, 1))
+        self.assertEqual(bfs[0], 1)
+        self.assertEqual(set(bfs[1:3]), {2, 3})
+        self.assertEqual(bfs[3:], [4, 5])
+
+        dfs = list(DepthFirstSearch(g1, 5))
+        self.assertEqual(dfs[:2], [5, 4])
+        self.assertEqual(set(dfs), {1, 2, 3, 4, 5})
+        self.assertEqual(list(DepthFirstSearch(g1, 6)), [6])
+
+        path = SimpleGraph(vertices = list(range(1, 20001)), edges = [[i, i + 1] for i in range(1, 20000)], backend = "csr")
+        self.assertEqual(list(DepthFirstSearch(path, 1)), list(range(1, 20001)))
+
+    def test_components(self):
+        g1 = SimpleGraph(vertices = [1, 2, 3, 4, 5, 6], edges = [
+            [1, 2],
+            [2, 3],
+            [4, 5]
+        ])
+        self.assertEqual(sorted(ConnectedComponents(g1), key=min), [{1, 2, 3}, {4, 5}, {6}])
+        self.assertEqual(ConnectedQ(g1), False)
+        self.assertEqual(ConnectedQ(PetersenGraph()), True)
+
+    def test_distances(self):
+        c6 = CycleGraph(6)
+        self.assertEqual(GraphDistance(c6, 1, 4), 3)
+        self.assertEqual(GraphDistance(c6, 2, 6), 2)
+        self.assertEqual(Eccentricity(c6, 1), 3)
+        self.assertEqual(GraphDiameter(c6), 3)
+        self.assertEqual(GraphRadius(c6), 3)
+
+        petersen = PetersenGraph()
+        self.assertEqual(GraphDiameter(petersen), 2)
+        self.assertEqual(GraphRadius(petersen), 2)
+
+        star = SimpleGraph(vertices = [1, 2, 3, 4], edges = [[1, 2], [1, 3], [1, 4]], backend = "csr")
+        self.assertEqual(GraphRadius(star), 1)
+        self.assertEqual(GraphDiameter(star), 2)
+
+        g1 = SimpleGraph(vertices = [1, 2, 3], edges = [[1, 2]])
+        self.assertEqual(GraphDistance(g1, 1, 3), math.inf)
+        self.assertEqual(GraphDiameter(g1), math.inf)
+
+class TestShortestPaths(unittest.TestCase):
+    def test_shortest_path(self):
+        g1 = SimpleGraph(vertices = ['A', 'B', 'C', 'D', 'E'], edges = [
+            ['A', 'B', 4],
+            ['A', 'C', 1],
+            ['C', 'B', 2],
+            ['B', 'D', 5],
+            ['C', 'D', 8]
+        ])
+        self.assertEqual(ShortestPath(g1, 'A', 'D'), ['A', 'C', 'B', 'D'])
+        self.assertEqual(ShortestPathLength(g1, 'A', 'D'), 8)
+        self.assertEqual(ShortestPath(g1, 'A', 'A'), ['A'])
+        self.assertEqual(ShortestPath(g1, 'A', 'E'), [])
+        self.assertEqual(ShortestPathLength(g1, 'E', 'A'), math.inf)
+
+        c6 = CycleGraph(6)
+        self.assertEqual(ShortestPathLength(c6, 1, 4), 3)
+
+        g2 = SimpleGraph(vertices = [1, 2], edges = [[1, 2, -1]])
+        self.assertRaises(ValueError, lambda: ShortestPath(g2, 1, 2))
+
+    def test_distance_matrix(self):
+        g1 = SimpleGraph(vertices = [1, 2, 3, 4], edges = [
+            [1, 2, 4],
+            [1, 3, 1],
+            [3, 2, 2]
+        ])
+        expected = [
+            [0, 3, 1, math.inf],
+            [3, 0, 2, math.inf],
+            [1, 2, 0, math.inf],
+            [math.inf, math.inf, math.inf, 0]
+        ]
+        self.assertEqual(GraphDistanceMatrix(g1, method="floyd_warshall").tolist(), expected)
+        self.assertEqual(GraphDistanceMatrix(g1, method="dijkstra").tolist(), expected)
+        self.assertRaises(ValueError, lambda: GraphDistanceMatrix(g1, method="bellman_ford"))
+
+        petersen = PetersenGraph()
+        self.assertEqual(
+            GraphDistanceMatrix(petersen, method="floyd_warshall").tolist(), 
+            GraphDistanceMatrix(petersen, method="dijkstra").tolist()
+        )
+        self.assertEqual(GraphDistanceMatrix(petersen).max(), 2)
+
+class TestTriangles(unittest.TestCase):
+    def test_triangle_count(self):
+        g1 = SimpleGraph(vertices = [1, 2, 3, 4, 5], edges = [
+            [1, 2],
+            [1, 3],
+            [2, 3],
+            [2, 4],
+            [3, 4],
+            [4, 5]
+        ])
+        for method in ["matrix", "intersection"]:
+            self.assertEqual(TriangleCount(g1, method = method), 2)
+            self.assertEqual(TriangleCount(CompleteGraph(7), method = method), 35)
+            self.assertEqual(TriangleCount(PetersenGraph(), method = method), 0)
+
+        random_graph = RandomGraph(80, 0.2, seed = 3)
+        self.assertEqual(
+            TriangleCount(random_graph, method = "matrix"),
+            TriangleCount(random_graph, method = "intersection")
+        )
+        self.assertRaises(ValueError, lambda: TriangleCount(g1, method = "brute_force"))
+
+        self.assertFalse(TriangleFreeQ(g1))
+        self.assertTrue(TriangleFreeQ(Mycielskian(CompleteGraph(2), k = 3)))
+        self.assertTrue(TriangleFreeQ(CompleteBipartiteGraph(3, 4)))
+
+    def test_clustering(self):
+        g1 = SimpleGraph(vertices = [1, 2, 3, 4, 5], edges = [
+            [1, 2],
+            [1, 3],
+            [2, 3],
+            [2, 4],
+            [3, 4],
+            [4, 5]
+        ])
+        self.assertEqual(LocalClusteringCoefficient(g1, 1), 1.0)
+        self.assertEqual(LocalClusteringCoefficient(g1, 4), 1 / 3)
+        self.assertEqual(LocalClusteringCoefficient(g1), {1: 1.0, 2: 2 / 3, 3: 2 / 3, 4: 1 / 3, 5: 0.0})
+        self.assertRaises(ValueError, lambda: LocalClusteringCoefficient(g1, 6))
+
+        self.assertEqual(GlobalClusteringCoefficient(g1), 6 / 10)
+        self.assertEqual(GlobalClusteringCoefficient(CompleteGraph(5)), 1.0)
+        self.assertEqual(GlobalClusteringCoefficient(CycleGraph(5)), 0.0)
+
+class TestColoring(unittest.TestCase):
+    def assertProperColoring(self, graph, colors):
+        self.assertEqual(set(colors), set([vertex.label for vertex in GraphVertices(graph)]))
+        for edge in GraphEdges(graph):
+            self.assertNotEqual(colors[edge.v1.label], colors[edge.v2.label])
+
+    def test_greedy_coloring(self):
+        petersen = PetersenGraph()
+        for method in ["largest_first", "smallest_last", "dsatur"]:
+            colors = GreedyColoring(petersen, method = method)
+            self.assertProperColoring(petersen, colors)
+            self.assertLessEqual(max(colors.values()), 4)
+
+        self.assertEqual(set(GreedyColoring(CompleteBipartiteGraph(3, 4)).values()), {1, 2})
+        self.assertEqual(set(GreedyColoring(CompleteGraph(6)).values()), {1, 2, 3, 4, 5, 6})
+        self.assertRaises(ValueError, lambda: GreedyColoring(petersen, method = "random"))
+        self.assertRaises(ValueError, lambda: GreedyColoring(SimpleGraph([1, 2], [[1, 1], [1, 2]])))
+
+    def test_chromatic_number(self):
+        self.assertEqual(ChromaticNumber(PetersenGraph()), 3)
+        self.assertEqual(ChromaticNumber(DodecahedralGraph()), 3)
+        self.assertEqual(ChromaticNumber(CycleGraph(8)), 2)
+        self.assertEqual(ChromaticNumber(CycleGraph(9)), 3)
+        self.assertEqual(ChromaticNumber(CompleteGraph(6)), 6)
+        self.assertEqual(ChromaticNumber(SimpleGraph([1, 2, 3])), 1)
+        self.assertEqual(ChromaticNumber(SimpleGraph([])), 0)
+        self.assertEqual(ChromaticNumber(Mycielskian(CompleteGraph(2), k = 3)), 5)
+        self.assertEqual(ChromaticNumber(Mycielskian(CompleteGraph(2), k = 2), workers = 2), 4)
+        g1 = RandomGraph(30, 0.4, seed = 2)
+        self.assertEqual(ChromaticNumber(g1, workers = 2), ChromaticNumber(g1))
+
+class TestBipartite(unittest.TestCase):
+    def test_bipartite_partition(self):
+        g1 = SimpleGraph(vertices = [1, 2, 3, 4, 5, 6, 7], edges = [
+            [1, 4],
+            [4, 2],
+            [2, 5],
+            [6, 3]
+        ])
+        self.assertTrue(BipartiteQ(g1))
+        self.assertEqual(BipartitePartition(g1), [[1, 2, 3, 7], [4, 5, 6]])
+        self.assertTrue(BipartiteQ(CycleGraph(6)))
+        self.assertTrue(BipartiteQ(CartesianProduct(CycleGraph(4), CycleGraph(6))))
+        self.assertFalse(BipartiteQ(CycleGraph(7)))
+        self.assertFalse(BipartiteQ(PetersenGraph()))
+        self.assertFalse(BipartiteQ(SimpleGraph([1, 2], [[1, 1], [1, 2]])))
+        self.assertRaises(ValueError, lambda: BipartitePartition(CycleGraph(5)))
+
+    def test_hopcroft_karp(self):
+        g1 = SimpleGraph(vertices = [1, 2, 3, 4, 5, 6], edges = [
+            [1, 4],
+            [1, 5],
+            [2, 4],
+            [3, 4],
+            [3, 6]
+        ])
+        matching = HopcroftKarpMatching(g1)
+        self.assertEqual(len(matching), 3)
+        self.assertEqual(len(set([u for u, v in matching] + [v for u, v in matching])), 6)
+        for u, v in matching:
+            self.assertIn(v, GraphNeighbours(g1, u))
+
+        self.assertEqual(len(HopcroftKarpMatching(CompleteBipartiteGraph(3, 5))), 3)
+        self.assertEqual(len(HopcroftKarpMatching(CycleGraph(10), [1, 3, 5, 7, 9])), 5)
+        self.assertEqual(HopcroftKarpMatching(SimpleGraph([1, 2, 3])), [])
+        self.assertRaises(ValueError, lambda: HopcroftKarpMatching(CycleGraph(10), [1, 2]))
+        self.assertRaises(ValueError, lambda: HopcroftKarpMatching(PetersenGraph()))
+
+class TestSpanningTrees(unittest.TestCase):
+    def test_disjoint_set(self):
+        components = DisjointSet(5)
+        self.assertEqual(components.component_count, 5)
+        self.assertTrue(components.union(0, 1))
+        self.assertTrue(components.union(3, 4))
+        self.assertFalse(components.union(1, 0))
+        self.assertTrue(components.connected(0, 1))
+        self.assertFalse(components.connected(1, 3))
+        self.assertEqual(components.component_count, 3)
+
+        self.assertEqual(components.add(), 5)
+        self.assertTrue(components.union(5, 4))
+        self.assertEqual(components.set_size(3), 3)
+        self.assertEqual(len(components), 6)
+
+    def test_minimum_spanning_tree(self):
+        g1 = SimpleGraph(vertices = [1, 2, 3, 4, 5, 6], edges = [
+            [1, 2, 4],
+            [1, 3, 1],
+            [2, 3, 2],
+            [2, 4, 5],
+            [3, 4, 8],
+            [4, 5, 3],
+            [5, 6]
+        ])
+        expected = set([
+            GraphEdge(GraphVertex(1), GraphVertex(3), 1),
+            GraphEdge(GraphVertex(2), GraphVertex(3), 2),
+            GraphEdge(GraphVertex(2), GraphVertex(4), 5),
+            GraphEdge(GraphVertex(4), GraphVertex(5), 3),
+            GraphEdge(GraphVertex(5), GraphVertex(6))
+        ])
+        for method in ["kruskal", "prim"]:
+            tree = MinimumSpanningTree(g1, method = method)
+            self.assertEqual(GraphVertices(tree), GraphVertices(g1))
+            self.assertEqual(GraphEdges(tree), expected)
+            self.assertEqual(sorted([edge.weight for edge in GraphEdges(tree)], key = str), [1, 2, 3, 5, None])
+
+        forest = MinimumSpanningTree(SimpleGraph([1, 2, 3, 4], [[1, 2], [3, 4]], backend = "csr"))
+        self.assertEqual(EdgeCount(forest), 2)
+        self.assertEqual(EdgeCount(MinimumSpanningTree(CompleteGraph(8))), 7)
+        self.assertRaises(ValueError, lambda: MinimumSpanningTree(g1, method = "boruvka"))
+
+class TestCentrality(unittest.TestCase):
+    def test_betweenness(self):
+        path = SimpleGraph([1, 2, 3, 4, 5], [[1, 2], [2, 3], [3, 4], [4, 5]])
+        self.assertEqual(BetweennessCentrality(path, normalized = False), {1: 0.0, 2: 3.0, 3: 4.0, 4: 3.0, 5: 0.0})
+        self.assertEqual(BetweennessCentrality(path), {1: 0.0, 2: 0.5, 3: 4 / 6, 4: 0.5, 5: 0.0})
+
+        star = CompleteBipartiteGraph(1, 4)
+        self.assertEqual(BetweennessCentrality(star, normalized = False)[1], 6.0)
+
+        # Two shortest paths between opposite vertices of a 4-cycle
+        self.assertEqual(BetweennessCentrality(CycleGraph(4), normalized = False), {1: 0.5, 2: 0.5, 3: 0.5, 4: 0.5})
+
+        petersen = PetersenGraph()
+        serial = BetweennessCentrality(petersen)
+        parallel = BetweennessCentrality(petersen, workers = 2)
+        for vertex in serial:
+            self.assertAlmostEqual(serial[vertex], parallel[vertex])
+        self.assertEqual(len(BetweennessCentrality(petersen, samples = 5, seed = 1)), 10)
+        self.assertRaises(ValueError, lambda: BetweennessCentrality(petersen, samples = 0))
+        self.assertRaises(ValueError, lambda: BetweennessCentrality(petersen, samples = -3))
+
+    def test_closeness(self):
+        path = SimpleGraph([1, 2, 3, 4, 5], [[1, 2], [2, 3], [3, 4], [4, 5]])
+        self.assertEqual(ClosenessCentrality(path), {1: 0.4, 2: 4 / 7, 3: 4 / 6, 4: 4 / 7, 5: 0.4})
+        self.assertEqual(ClosenessCentrality(path, workers = 2), ClosenessCentrality(path))
+
+        g1 = SimpleGraph([1, 2, 3, 4], [[1, 2]])
+        self.assertEqual(ClosenessCentrality(g1), {1: 1 / 3, 2: 1 / 3, 3: 0.0, 4: 0.0})
+
+    def test_pagerank(self):
+        ranks = PageRank(CycleGraph(6))
+        for vertex in ranks:
+            self.assertAlmostEqual(ranks[vertex], 1 / 6)
+
+        star = CompleteBipartiteGraph(1, 4, backend = "csr")
+        ranks = PageRank(star)
+        self.assertAlmostEqual(sum(ranks.values()), 1)
+        self.assertGreater(ranks[1], ranks[2])
+        self.assertAlmostEqual(ranks[2], ranks[5])
+
+        ranks = PageRank(SimpleGraph([1, 2, 3], [[1, 2]]))
+        self.assertAlmostEqual(sum(ranks.values()), 1)
+        self.assertRaises(ValueError, lambda: PageRank(star, max_iterations = 1))
+
+class TestSpectral(unittest.TestCase):
+    def test_laplacian_matrix(self):
+        g1 = SimpleGraph([3, 1, 2], [[1, 2], [2, 3]])
+        self.assertEqual(LaplacianMatrix(g1), [[1, -1, 0], [-1, 2, -1], [0, -1, 1]])
+        self.assertEqual(LaplacianMatrix(g1, as_numpy = True).sum(axis = 1).tolist(), [0, 0, 0])
+
+    def test_adjacency_eigenvalues(self):
+        # The Petersen graph has spectrum 3, 1 (5 times), -2 (4 times)
+        petersen = PetersenGraph()
+        values = AdjacencyEigenvalues(petersen)
+        for value, expected in zip(values, [3] + [1] * 5 + [-2] * 4):
+            self.assertAlmostEqual(value, expected)
+        for method in ("dense", "sparse"):
+            largest = AdjacencyEigenvalues(petersen, 2, method = method)
+            smallest = AdjacencyEigenvalues(petersen, 2, which = "smallest", method = method)
+            for value, expected in zip(largest + smallest, [3, 1, -2, -2]):
+                self.assertAlmostEqual(value, expected)
+
+        g1 = RandomGraph(300, 0.05, seed = 1)
+        dense = AdjacencyEigenvalues(g1, 3, method = "dense")
+        sparse = AdjacencyEigenvalues(g1, 3, method = "sparse")
+        for x, y in zip(dense, sparse):
+            self.assertAlmostEqual(x, y)
+        self.assertEqual(AdjacencyEigenvalues(SimpleGraph([], [])), [])
+        self.assertRaises(ValueError, lambda: AdjacencyEigenvalues(petersen, which = "middle"))
+        self.assertRaises(ValueError, lambda: AdjacencyEigenvalues(petersen, method = "arpack"))
+
+    def test_algebraic_connectivity(self):
+        # 2 - 2cos(2pi/n) for the n-cycle, n for the complete graph
+        for method in ("dense", "sparse"):
+            self.assertAlmostEqual(AlgebraicConnectivity(CycleGraph(40), method), 2 - 2 * math.cos(2 * math.pi / 40))
+            self.assertAlmostEqual(AlgebraicConnectivity(CompleteGraph(6, backend = "csr"), method), 6)
+            self.assertAlmostEqual(AlgebraicConnectivity(SimpleGraph([1, 2, 3, 4], [[1, 2], [3, 4]]), method), 0)
+
+        g1 = BarabasiAlbertGraph(200, 2, seed = 3)
+        self.assertAlmostEqual(AlgebraicConnectivity(g1, "dense"), AlgebraicConnectivity(g1, "sparse"))
+        self.assertEqual(AlgebraicConnectivity(SimpleGraph([1], [])), 0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,240 @@
+import math
+import os
+import tempfile
+import unittest
+
+import sys
+
+from matplotlib.figure import Figure
+
+sys.path.insert(0, "../../kc-polynomos")
+sys.path.insert(0, "../kc-polynomos")
+
+from polynomos.graphnomos.all import *
+from polynomos.graphnomos.graph import GraphVertex, SimpleGraphObject
+
+class TestLayouts(unittest.TestCase):
+    def test_fruchterman_reingold(self):
+        petersen = PetersenGraph()
+        pos = FruchtermanReingoldLayout(petersen, seed=7)
+        self.assertEqual(set(pos), GraphVertices(petersen))
+        self.assertEqual(pos, FruchtermanReingoldLayout(petersen, seed=7))
+        for x, y in pos.values():
+            self.assertTrue(-1 <= x <= 1 and -1 <= y <= 1)
+
+        # Adjacent vertices are pulled closer together than the average pair
+        def dist(u, v):
+            return ((pos[u][0] - pos[v][0]) ** 2 + (pos[u][1] - pos[v][1]) ** 2) ** 0.5
+        
+        edge_mean = sum(dist(edge.v1, edge.v2) for edge in GraphEdges(petersen)) / EdgeCount(petersen)
+        vertices = list(pos)
+        pair_mean = sum(dist(u, v) for u in vertices for v in vertices if u != v) / (len(vertices) * (len(vertices) - 1))
+        self.assertLess(edge_mean, pair_mean)
+
+        # Coordinates given by the pure Python implementation that was vectorized
+        reference = {
+            1: (-0.079852124566, 0.307492796944),
+            2: (0.294987766854, 0.296482246618),
+            3: (0.036328602601, 0.004248517839),
+            4: (-0.000755105175, 0.681525775924),
+            5: (0.412589391071, -0.046986780549),
+            6: (0.524612339714, 0.150426701518),
+            7: (0.759199112240, 0.293410308328),
+            8: (0.321033160962, 0.542216113603),
+            9: (0.360113917891, 0.897455003896),
+            10: (0.633139362962, 0.520869730323),
+        }
+        for label, (x, y) in reference.items():
+            self.assertAlmostEqual(pos[GraphVertex(label)][0], x, places = 9)
+            self.assertAlmostEqual(pos[GraphVertex(label)][1], y, places = 9)
+
+        single = SimpleGraph(vertices = [1])
+        self.assertEqual(list(FruchtermanReingoldLayout(single, seed=1)), [GraphVertex(1)])
+        self.assertEqual(FruchtermanReingoldLayout(SimpleGraph(vertices = [])), {})
+
+    def test_barnes_hut(self):
+        g1 = Mycielskian(Mycielskian(CycleGraph(5)))
+        exact = FruchtermanReingoldLayout(g1, seed=3)
+        approx = FruchtermanReingoldLayout(g1, seed=3, method="barnes_hut", theta=0)
+        for vertex in exact:
+            self.assertAlmostEqual(exact[vertex][0], approx[vertex][0])
+            self.assertAlmostEqual(exact[vertex][1], approx[vertex][1])
+
+        approx = FruchtermanReingoldLayout(g1, seed=3, method="barnes_hut")
+        self.assertEqual(set(approx), GraphVertices(g1))
+        self.assertRaises(ValueError, lambda: FruchtermanReingoldLayout(g1, method="spring"))
+
+    def test_bipartite_layout(self):
+        g1 = SimpleGraph(vertices = [1, 2, 3, 4, 5, 6], edges = [
+            [1, 4],
+            [4, 2],
+            [2, 5],
+            [3, 6]
+        ])
+        layout = BipartiteLayout(g1)
+        left = set([vertex.label for vertex in layout if layout[vertex][0] < 0])
+        self.assertEqual(left, {1, 2, 3})
+        self.assertEqual(BipartiteLayout(g1), layout)
+
+        layout = BipartiteLayout(g1, [4, 5, 6])
+        self.assertEqual(set([vertex.label for vertex in layout if layout[vertex][0] < 0]), {4, 5, 6})
+        self.assertRaises(ValueError, lambda: BipartiteLayout(CycleGraph(5)))
+
+        # The same edges with other bipartite_parties are not taken from the cache
+        k = CompleteBipartiteGraph(2, 2)
+        g2 = SimpleGraphObject([1, 2, 3, 4], [[edge.v1.label, edge.v2.label] for edge in GraphEdges(k)], bipartite_parties = [[3, 4], [1, 2]])
+        cache = LayoutCache()
+        BipartiteLayout(k, cache = cache)
+        layout = BipartiteLayout(g2, cache = cache)
+        self.assertEqual(set([vertex.label for vertex in layout if layout[vertex][0] < 0]), {3, 4})
+        self.assertEqual(layout, BipartiteLayout(g2))
+
+    def test_draw_graph_output(self):
+        g1 = SimpleGraph(vertices = [1, 2, 3, 4], edges = [
+            [1, 2, 4],
+            [2, 3],
+            [3, 4],
+            [4, 1]
+        ])
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "graph.png")
+            DrawGraph(g1, output = path)
+            with open(path, "rb") as f:
+                self.assertEqual(f.read(8), b"\x89PNG\r\n\x1a\n")
+
+            path = os.path.join(directory, "bipartite.svg")
+            DrawGraph(CompleteBipartiteGraph(2, 3), layout = "bipartite", output = path, show_labels = False)
+            self.assertGreater(os.path.getsize(path), 0)
+        self.assertRaises(ValueError, lambda: DrawGraph(g1, layout = "spring", output = "graph.png"))
+
+    def test_draw_graph_axes(self):
+        figure = Figure()
+        left, right = figure.subplots(1, 2)
+        DrawGraph(CycleGraph(5), CircularLayout(CycleGraph(5)), ax = right)
+        self.assertEqual(len(left.collections), 0)
+        self.assertEqual(len(right.collections), 2)
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "graph.png")
+            DrawGraph(CycleGraph(5), layout = "spectral", ax = left, output = path)
+            self.assertGreater(os.path.getsize(path), 0)
+
+    def test_layout_cache(self):
+        g1 = CycleGraph(8)
+        cache = LayoutCache(maxsize = 2)
+        first = FruchtermanReingoldLayout(g1, seed = 1, cache = cache)
+        self.assertEqual(FruchtermanReingoldLayout(g1, seed = 1, cache = cache), first)
+        self.assertEqual(FruchtermanReingoldLayout(CycleGraph(8, backend = "csr"), seed = 1, cache = cache), first)
+        self.assertEqual((cache.hits, cache.misses), (2, 1))
+
+        FruchtermanReingoldLayout(g1, seed = 2, cache = cache)
+        FruchtermanReingoldLayout(g1, seed = 1, iterations = 10, cache = cache)
+        self.assertEqual(len(cache), 2)
+        self.assertEqual(cache.misses, 3)
+
+        # Unseeded layouts are not cached, and edits change the key
+        FruchtermanReingoldLayout(g1, cache = cache)
+        self.assertEqual(cache.misses, 3)
+        AddEdges(g1, [[1, 5]])
+        CircularLayout(g1, cache = cache)
+        self.assertEqual(cache.misses, 4)
+        self.assertEqual(CircularLayout(g1, cache = cache), CircularLayout(g1))
+        self.assertEqual(cache.hits, 3)
+
+        with tempfile.TemporaryDirectory() as directory:
+            cache = LayoutCache(maxsize = 0, directory = directory)
+            shells = [[1], [2, 3, 4, 5, 6, 7, 8]]
+            layout = ShellLayout(g1, shells, cache = cache)
+            self.assertEqual(len(cache), 0)
+            self.assertEqual(LayoutCache(directory = directory).get(LayoutCache.key(g1, "shell", {"shells": shells})), layout)
+            self.assertEqual(ShellLayout(g1, shells, cache = cache), layout)
+            self.assertEqual(cache.hits, 1)
+
+            # Arrays and tuple labels are stored without pickle
+            g2 = CartesianProduct(CompleteGraph(2), CycleGraph(3))
+            positions, labels = CircularLayout(g2, cache = cache, as_numpy = True)
+            stored = LayoutCache(directory = directory).get(LayoutCache.key(g2, "circular", {"as_numpy": True}))
+            self.assertEqual((stored[0].tolist(), stored[1]), (positions.tolist(), labels))
+            self.assertEqual(CircularLayout(g2, cache = LayoutCache(directory = directory)), CircularLayout(g2))
+            cache.clear(disk = True)
+            self.assertEqual(os.listdir(directory), [])
+
+    def test_warm_start(self):
+        g1 = RandomGraph(60, 0.08, seed = 2)
+        before = FruchtermanReingoldLayout(g1, seed = 1)
+        AddVertices(g1, [61])
+        AddEdges(g1, [[61, 1], [61, 2], [3, 4]])
+        after = FruchtermanReingoldLayout(g1, seed = 1, iterations = 5, initial_positions = before)
+
+        # With the default warm temperature, a vertex moves at most 0.01 per iteration
+        for v, (x, y) in before.items():
+            self.assertLessEqual(abs(after[v][0] - x) + abs(after[v][1] - y), 0.1)
+        middle = [(before[GraphVertex(1)][i] + before[GraphVertex(2)][i]) / 2 for i in range(2)]
+        self.assertLess(abs(after[GraphVertex(61)][0] - middle[0]) + abs(after[GraphVertex(61)][1] - middle[1]), 0.3)
+
+        # Positions may also be keyed by label, and unknown labels are ignored
+        by_label = {v.label: p for v, p in before.items()}
+        by_label[100] = (0.5, 0.5)
+        self.assertEqual(FruchtermanReingoldLayout(g1, seed = 1, iterations = 5, initial_positions = by_label), after)
+
+    def test_spectral_layout(self):
+        # The Laplacian eigenvectors of a cycle are cos and sin of the angles
+        # of its vertices around a circle
+        layout = SpectralLayout(CycleGraph(12))
+        radii = [math.hypot(x, y) for x, y in layout.values()]
+        for radius in radii:
+            self.assertAlmostEqual(radius, radii[0])
+        for v in range(1, 13):
+            neighbour = layout[GraphVertex(v % 12 + 1)]
+            self.assertAlmostEqual(math.dist(layout[GraphVertex(v)], neighbour), 2 * radii[0] * math.sin(math.pi / 12))
+
+        g1 = RandomGraph(200, 0.05, seed = 4)
+        dense = SpectralLayout(g1, method = "dense")
+        sparse = SpectralLayout(g1, method = "sparse")
+        for v in dense:
+            self.assertAlmostEqual(dense[v][0], sparse[v][0], places = 4)
+            self.assertAlmostEqual(dense[v][1], sparse[v][1], places = 4)
+            self.assertTrue(-1 <= dense[v][0] <= 1 and -1 <= dense[v][1] <= 1)
+
+        self.assertEqual(SpectralLayout(SimpleGraph(vertices = [1])), {GraphVertex(1): (0.0, 0.0)})
+        self.assertEqual(SpectralLayout(SimpleGraph(vertices = [])), {})
+        self.assertRaises(ValueError, lambda: SpectralLayout(g1, method = "arpack"))
+
+    def test_array_layouts(self):
+        g1 = CompleteBipartiteGraph(3, 4)
+        layouts = [
+            lambda **options: FruchtermanReingoldLayout(g1, seed = 5, **options),
+            lambda **options: BipartiteLayout(g1, **options),
+            lambda **options: CircularLayout(g1, **options),
+            lambda **options: ShellLayout(g1, [[1, 2, 3], [4, 5, 6, 7]], **options),
+            lambda **options: SpectralLayout(g1, **options),
+        ]
+        for layout in layouts:
+            positions, labels = layout(as_numpy = True)
+            self.assertEqual((positions.shape, positions.dtype), ((7, 2), float))
+            self.assertEqual(sorted(labels), [1, 2, 3, 4, 5, 6, 7])
+            points = layout()
+            for label, (x, y) in zip(labels, positions.tolist()):
+                self.assertEqual(points[GraphVertex(label)], (x, y))
+
+        # Both forms are cached separately, and cached arrays are copies
+        cache = LayoutCache()
+        positions, labels = CircularLayout(g1, cache = cache, as_numpy = True)
+        positions[0] = 5
+        self.assertEqual(CircularLayout(g1, cache = cache, as_numpy = True)[0].max(), 1)
+        self.assertIsInstance(CircularLayout(g1, cache = cache), dict)
+        self.assertEqual((cache.hits, cache.misses), (1, 2))
+
+        # Arrays also seed the Fruchterman-Reingold layout
+        positions, labels = SpectralLayout(g1, as_numpy = True)
+        warm = FruchtermanReingoldLayout(g1, seed = 1, iterations = 0, initial_positions = (positions, labels))
+        self.assertEqual(warm, SpectralLayout(g1))
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "graph.png")
+            DrawGraph(g1, (positions[::-1], labels[::-1]), output = path)
+            self.assertGreater(os.path.getsize(path), 0)
+            self.assertRaises(ValueError, lambda: DrawGraph(g1, (positions[1:], labels[1:]), output = path))
+            self.assertRaises(ValueError, lambda: DrawGraph(g1, (positions, labels[:-1] + [1]), output = path))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,3 +1,5 @@
+import os
+import tempfile
 import unittest
 
 import sys
@@ -26,6 +28,22 @@ class TestGraphs(unittest.TestCase):
             GraphEdge(GraphVertex(3), GraphVertex(4)),
         ]))
 
+    def test_graph_edge(self):
+        u, v, w = GraphVertex(1), GraphVertex("a"), GraphVertex((1, 2))
+        self.assertEqual(GraphEdge(u, v), GraphEdge(v, u))
+        self.assertEqual(hash(GraphEdge(u, v)), hash(GraphEdge(v, u)))
+        self.assertEqual(hash(GraphEdge(v, w, 3)), hash(GraphEdge(w, v)))
+        self.assertNotEqual(GraphEdge(u, v), GraphEdge(u, w))
+        self.assertNotEqual(GraphEdge(u, v), (u, v))
+
+        # The weight is not part of the identity of an edge
+        self.assertEqual(GraphEdge(u, v, 2.5), GraphEdge(v, u))
+        edges = set([GraphEdge(u, v, 2.5), GraphEdge(v, u, 4), GraphEdge(u, w, 2.5), GraphEdge(u, u)])
+        self.assertEqual(len(edges), 3)
+        self.assertIn(GraphEdge(w, u), edges)
+        self.assertNotIn(GraphEdge(v, w, 2.5), edges)
+        self.assertFalse(hasattr(GraphEdge(u, v), "__dict__"))
+
     def test_adjacency_matrix(self):
         g1 = SimpleGraph(vertices = [1, 2, 3, 4, 5], edges = [
             [1, 2],
@@ -174,6 +192,43 @@ class TestGraphs(unittest.TestCase):
         ])
 
 
+    def test_remove_edge(self):
+        g1 = SimpleGraph(vertices = [2, 3, 4], edges = [
+            [2, 3],
+            [3, 4]
+        ])
+        self.assertEqual(AdjacencyMatrix(g1), [
+            [0, 1, 0], 
+            [1, 0, 1], 
+            [0, 1, 0]
+        ])
+
+        g1.remove_edge([4, 3])
+        self.assertEqual(EdgeCount(g1), 1)
+        self.assertEqual(GraphEdges(g1), set([GraphEdge(GraphVertex(2), GraphVertex(3))]))
+        self.assertEqual(AdjacencyMatrix(g1), [
+            [0, 1, 0], 
+            [1, 0, 0], 
+            [0, 0, 0]
+        ])
+        self.assertRaises(ValueError, lambda: g1.remove_edge([3, 4]))
+        self.assertRaises(ValueError, lambda: g1.remove_edge([3, 5]))
+
+        # add_weight_mode is still accepted, but deprecated
+        g2 = SimpleGraph(vertices = [1, 2], edges = [[1, 2]])
+        with self.assertWarns(DeprecationWarning):
+            g2.remove_edge([1, 2], add_weight_mode = True)
+        self.assertEqual(EdgeCount(g2), 0)
+
+        AddEdge(g1, [1, 4])
+        self.assertEqual(AdjacencyMatrix(g1), [
+            [0, 0, 0, 1], 
+            [0, 0, 1, 0], 
+            [0, 1, 0, 0], 
+            [1, 0, 0, 0]
+        ])
+        self.assertEqual(DegreeSequence(g1, do_sort=False), [1, 1, 1, 1])
+
     def test_multiple_edges(self):
         g1 = SimpleGraph(vertices = [1, 2, 3, 4, 5], edges = [
             [1, 2],
@@ -197,6 +252,122 @@ class TestGraphs(unittest.TestCase):
             [1, 1, 1, 0, 0]
         ])
 
+    def test_edge_weights(self):
+        g1 = SimpleGraph(vertices = [1, 2, 3], edges = [
+            [1, 2],
+            [2, 3, 4]
+        ])
+        AddEdgeWeight(g1, [2, 1], 5)
+        self.assertEqual(set((edge.v1.label, edge.v2.label, edge.weight) for edge in GraphEdges(g1)), {(1, 2, 5), (2, 3, 4)})
+
+        self.assertRaises(ValueError, lambda: AddEdgeWeights(g1, {(1, 2): 1, (1, 3): 2}))
+        self.assertEqual(set((edge.v1.label, edge.v2.label, edge.weight) for edge in GraphEdges(g1)), {(1, 2, 5), (2, 3, 4)})
+
+        AddEdgeWeights(g1, {(1, 2): 1, (3, 2): 2})
+        self.assertEqual(set((edge.v1.label, edge.v2.label, edge.weight) for edge in GraphEdges(g1)), {(1, 2, 1), (2, 3, 2)})
+        self.assertEqual(EdgeCount(g1), 2)
+
+        self.assertRaises(ValueError, lambda: AddEdges(g1, [[1, 3], [4]]))
+        self.assertEqual(EdgeCount(g1), 2)
+
+    def test_csr_backend(self):
+        edges = [
+            [1, 2],
+            [1, 3],
+            [2, 3, 2.5],
+            [1, 5],
+            [3, 4]
+        ]
+        g1 = SimpleGraph(vertices = [1, 2, 3, 4, 5], edges = edges)
+        g2 = SimpleGraph(vertices = [1, 2, 3, 4, 5], edges = edges, backend = "csr")
+        self.assertEqual(AdjacencyMatrix(g1), AdjacencyMatrix(g2))
+        self.assertEqual(GraphEdges(g1), GraphEdges(g2))
+        self.assertEqual(DegreeSequence(g2, do_sort=False), [3, 2, 3, 1, 1])
+        self.assertEqual(VertexDegree(g2, 3), 3)
+        self.assertEqual(GraphNeighbours(g2, 1), {2, 3, 5})
+
+        AddEdges(g2, [[2, 4], [4, 6]])
+        g2.remove_edge([1, 5])
+        AddEdgeWeight(g2, [3, 1], 4)
+        self.assertEqual(VertexCount(g2), 6)
+        self.assertEqual(EdgeCount(g2), 6)
+        self.assertEqual(GraphNeighbours(g2, 4), {2, 3, 6})
+        self.assertEqual(GraphNeighbours(g2, 5), set())
+        self.assertEqual(set((edge.v1.label, edge.v2.label, edge.weight) for edge in GraphEdges(g2) if edge.weight is not None), {(1, 3, 4), (2, 3, 2.5)})
+
+        self.assertRaises(ValueError, lambda: SimpleGraph(vertices = [1, 2], edges = [[1, 2]], backend = "matrix"))
+
+    def test_read_graph(self):
+        with tempfile.TemporaryDirectory() as folder:
+            path = os.path.join(folder, "graph.txt")
+            with open(path, "w") as f:
+                f.write("# comment\n1 2\n1 3\n\n2 3\n1 5 # trailing comment\n3 4\n2 1\n")
+            for backend in ["dict", "csr"]:
+                g1 = ReadGraph(path, chunk_size=8, backend=backend)
+                self.assertEqual(VertexCount(g1), 5)
+                self.assertEqual(EdgeCount(g1), 5)
+                self.assertEqual(AdjacencyMatrix(g1), [
+                    [0, 1, 1, 0, 1], 
+                    [1, 0, 1, 0, 0], 
+                    [1, 1, 0, 1, 0], 
+                    [0, 0, 1, 0, 0], 
+                    [1, 0, 0, 0, 0], 
+                ])
+                self.assertEqual(DegreeMap(g1), {1: 3, 2: 2, 3: 3, 4: 1, 5: 1})
+
+            with open(path, "w") as f:
+                f.write("A B 2.5\nB C 1\n")
+            g2 = ReadGraph(path, format="weighted_edgelist", label_type=str)
+            self.assertEqual(set((edge.v1.label, edge.v2.label, edge.weight) for edge in GraphEdges(g2)), {('A', 'B', 2.5), ('B', 'C', 1)})
+
+            with open(path, "w") as f:
+                f.write("1 2 3 5\n3 2 4\n6\n")
+            g3 = ReadGraph(path, format="adjlist")
+            self.assertEqual(VertexCount(g3), 6)
+            self.assertEqual(GraphNeighbours(g3, 3), {1, 2, 4})
+            self.assertEqual(GraphNeighbours(g3, 6), set())
+
+            with open(path, "w") as f:
+                f.write("1 2 3\n")
+            self.assertRaises(ValueError, lambda: ReadGraph(path))
+            self.assertRaises(ValueError, lambda: ReadGraph(path, format="graphml"))
+
+            open(path, "w").close()
+            self.assertEqual(VertexCount(ReadGraph(path)), 0)
+
+    def test_save_load_graph(self):
+        g1 = CompleteBipartiteGraph(2, 3)
+        AddEdgeWeight(g1, [1, 4], 2.5)
+        g2 = SimpleGraph(vertices = ['A', 'B', 'C'], edges = [['A', 'B'], ['B', 'C']], backend = "csr")
+
+        with tempfile.TemporaryDirectory() as folder:
+            path = os.path.join(folder, "graph.npz")
+            SaveGraph(g1, path)
+            for mmap in [False, True]:
+                loaded = LoadGraph(path, mmap=mmap)
+                self.assertEqual(GraphVertices(loaded), GraphVertices(g1))
+                self.assertEqual(GraphEdges(loaded), GraphEdges(g1))
+                self.assertEqual([edge.weight for edge in GraphEdges(loaded) if edge.weight is not None], [2.5])
+                self.assertEqual(loaded.get_property("bipartite_parties"), [[1, 2], [3, 4, 5]])
+                self.assertEqual(DegreeMap(loaded), DegreeMap(g1))
+                AddEdge(loaded, [1, 2])
+                self.assertEqual(EdgeCount(loaded), 7)
+
+            SaveGraph(g2, path, compressed=True)
+            loaded = LoadGraph(path)
+            self.assertEqual(AdjacencyMatrix(loaded), AdjacencyMatrix(g2))
+            self.assertEqual(GraphNeighbours(loaded, 'B'), {'A', 'C'})
+            self.assertRaises(ValueError, lambda: LoadGraph(path, mmap=True))
+
+            # Tuple labels, as in product graphs, come back as tuples
+            for g3 in [CartesianProduct(CompleteGraph(2), CompleteGraph(2)), StrongProduct(CompleteGraph(3), CycleGraph(4))]:
+                SaveGraph(g3, path)
+                loaded = LoadGraph(path)
+                self.assertEqual(GraphVertices(loaded), GraphVertices(g3))
+                self.assertEqual(GraphEdges(loaded), GraphEdges(g3))
+                self.assertEqual(GraphNeighbours(loaded, (1, 1)), GraphNeighbours(g3, (1, 1)))
+            self.assertRaises(ValueError, lambda: SaveGraph(SimpleGraph(vertices = [frozenset([1])]), path))
+
     def test_add_vertices(self):
         g1 = SimpleGraph(vertices = [1, 2, 3, 4, 5], edges = [
             [1, 2],
@@ -325,6 +496,19 @@ class TestGraphs(unittest.TestCase):
         self.assertEqual(KRegularQ(petersen, 3), True)
         self.assertEqual(Regularity(petersen), 3)
 
+        c4 = SimpleGraph(vertices = [1, 2, 3, 4], edges = [[1, 2], [2, 3], [3, 4]])
+        self.assertEqual(Regularity(c4), -1)
+        self.assertEqual(KRegularQ(c4, -1), False)
+        AddEdge(c4, [4, 1])
+        self.assertEqual(Regularity(c4), 2)
+        self.assertEqual(DegreeFrequency(c4), {2: 4})
+        AddVertex(c4, 5)
+        self.assertEqual(RegularQ(c4), False)
+        self.assertEqual(DegreeFrequency(c4), {2: 4, 0: 1})
+        c4.remove_edge([1, 4])
+        self.assertEqual(DegreeMap(c4), {1: 1, 2: 2, 3: 2, 4: 1, 5: 0})
+        self.assertEqual(DegreeFrequency(c4), {2: 2, 1: 2, 0: 1})
+
     def test_neighbours(self):
         g1 = SimpleGraph(vertices = [1, 2, 3, 4, 5], edges = [
             [1, 2],
@@ -358,6 +542,19 @@ class TestGraphs(unittest.TestCase):
         self.assertEqual(GraphNeighbours(g2, GraphVertex('D')), {'C'})
         self.assertEqual(GraphNeighbours(g2, GraphVertex('E')), {'A'})
 
+    def test_iter_neighbours(self):
+        g1 = SimpleGraph(vertices = [1, 2, 3, 4, 5], edges = [
+            [1, 2],
+            [1, 3],
+            [2, 3],
+            [1, 5],
+            [3, 4]
+        ])
+        self.assertEqual(sorted(IterNeighbours(g1, 1)), [2, 3, 5])
+        self.assertEqual(sorted(IterNeighbours(g1, GraphVertex(4))), [3])
+        self.assertEqual(GraphNeighbours(g1, 3, return_objs=True), {GraphVertex(1), GraphVertex(2), GraphVertex(4)})
+        self.assertRaises(ValueError, lambda: IterNeighbours(g1, 6))
+
     def test_mycielskian(self):
         g1 = SimpleGraph(vertices = [1, 2, 3, 4], edges = [
             [1, 2],
@@ -391,6 +588,104 @@ class TestGraphs(unittest.TestCase):
         self.assertEqual(VertexCount(myc), 2 * VertexCount(g1) + 1)
         self.assertEqual(EdgeCount(myc), 3 * EdgeCount(g1) + VertexCount(g1))
 
+        grotzsch = Mycielskian(CompleteGraph(2), k = 2)
+        self.assertEqual(VertexCount(grotzsch), 11)
+        self.assertEqual(EdgeCount(grotzsch), 20)
+        self.assertEqual(GraphEdges(grotzsch), GraphEdges(Mycielskian(Mycielskian(CompleteGraph(2)))))
+
+        labelled = Mycielskian(CompleteGraph(2), "u", "v")
+        self.assertEqual(GraphVertices(labelled), set([GraphVertex(label) for label in [1, 2, "u1", "u2", "v"]]))
+        self.assertEqual(GraphNeighbours(labelled, "u1"), {2, "v"})
+
+    def test_graph_products(self):
+        for backend in ["dict", "csr"]:
+            path = SimpleGraph([1, 2, 3], [[1, 2], [2, 3]], backend = backend)
+            edge = CompleteGraph(2, backend = backend)
+
+            grid = CartesianProduct(path, path)
+            self.assertEqual(VertexCount(grid), 9)
+            self.assertEqual(EdgeCount(grid), 12)
+            self.assertEqual(GraphNeighbours(grid, (2, 2)), {(1, 2), (3, 2), (2, 1), (2, 3)})
+
+            tensor = TensorProduct(path, edge)
+            self.assertEqual(GraphEdges(tensor), set(
+                [GraphEdge(GraphVertex(u), GraphVertex(v)) for u, v in [
+                    [(1, 1), (2, 2)],
+                    [(1, 2), (2, 1)],
+                    [(2, 1), (3, 2)],
+                    [(2, 2), (3, 1)]
+                ]]
+            ))
+
+            king = StrongProduct(path, path)
+            self.assertEqual(EdgeCount(king), 20)
+            self.assertEqual(GraphNeighbours(king, (2, 2)), set([(x, y) for x in [1, 2, 3] for y in [1, 2, 3]]) - {(2, 2)})
+
+            complement = GraphComplement(CycleGraph(5, backend = backend))
+            self.assertEqual(EdgeCount(complement), 5)
+            self.assertTrue(KRegularQ(complement, 2))
+            self.assertEqual(GraphNeighbours(complement, 1), {3, 4})
+            self.assertEqual(EdgeCount(GraphComplement(CompleteGraph(4, backend = backend))), 0)
+
+    def test_generators(self):
+        for backend in ["dict", "csr"]:
+            cycle = CycleGraph(5, backend = backend)
+            self.assertEqual(GraphEdges(cycle), set(
+                [GraphEdge(GraphVertex(i), GraphVertex(i % 5 + 1)) for i in range(1, 6)]
+            ))
+
+            complete = CompleteGraph(6, backend = backend)
+            self.assertEqual(EdgeCount(complete), 15)
+            self.assertTrue(KRegularQ(complete, 5))
+            self.assertEqual(GraphNeighbours(complete, 3), {1, 2, 4, 5, 6})
+
+            bipartite = CompleteBipartiteGraph(2, 3, backend = backend)
+            self.assertEqual(EdgeCount(bipartite), 6)
+            self.assertEqual(DegreeMap(bipartite), {1: 3, 2: 3, 3: 2, 4: 2, 5: 2})
+            self.assertEqual(bipartite.get_property("bipartite_parties"), [[1, 2], [3, 4, 5]])
+
+            heawood = LCFGraph(14, [5, -5], 7, backend = backend)
+            self.assertEqual(EdgeCount(heawood), 21)
+            self.assertTrue(KRegularQ(heawood, 3))
+            self.assertEqual(GraphNeighbours(heawood, 1), {2, 6, 14})
+
+    def test_random_graphs(self):
+        for backend in ["dict", "csr"]:
+            g = RandomGraph(50, 0.2, seed = 7, backend = backend)
+            self.assertEqual(VertexCount(g), 50)
+            self.assertEqual(GraphEdges(g), GraphEdges(RandomGraph(50, 0.2, seed = 7)))
+            self.assertEqual(EdgeCount(RandomGraph(10, 1, backend = backend)), 45)
+            self.assertEqual(EdgeCount(RandomGraph(10, 0, backend = backend)), 0)
+
+            self.assertEqual(EdgeCount(RandomGraphM(40, 100, seed = 1, backend = backend)), 100)
+            self.assertEqual(EdgeCount(RandomGraphM(10, 45, backend = backend)), 45)
+
+            ba = BarabasiAlbertGraph(100, 3, seed = 2, backend = backend)
+            self.assertEqual(EdgeCount(ba), 3 * 97)
+            self.assertTrue(ConnectedQ(ba))
+
+            self.assertTrue(KRegularQ(RandomRegularGraph(60, 5, seed = 3, backend = backend), 5))
+            self.assertTrue(KRegularQ(RandomRegularGraph(12, 10, seed = 3, backend = backend), 10))
+
+            ws = WattsStrogatzGraph(60, 4, 0.3, seed = 4, backend = backend)
+            self.assertEqual(EdgeCount(ws), 120)
+            self.assertTrue(KRegularQ(WattsStrogatzGraph(60, 4, 0, backend = backend), 4))
+
+        self.assertRaises(ValueError, lambda: RandomGraph(10, 1.5))
+        self.assertRaises(ValueError, lambda: RandomGraphM(10, 46))
+        self.assertRaises(ValueError, lambda: BarabasiAlbertGraph(10, 10))
+        self.assertRaises(ValueError, lambda: RandomRegularGraph(9, 3))
+
+        # Pairings with no valid swap left are shuffled again rather than stuck
+        for n in range(2, 13):
+            for d in range(1, n):
+                if n * d % 2 == 0:
+                    for seed in range(6):
+                        g = RandomRegularGraph(n, d, seed = seed)
+                        self.assertTrue(KRegularQ(g, d))
+                        self.assertEqual(EdgeCount(g), n * d // 2)
+        self.assertRaises(ValueError, lambda: WattsStrogatzGraph(10, 3, 0.1))
+
 
 
 if __name__ == '__main__':